@@ -1,6 +1,8 @@
 import streamlit as st
+import pandas as pd
 import importlib
 import tempfile
+import hashlib
 import os
 import sys
 
@@ -9,6 +11,17 @@ import sys
 # ─────────────────────────────────────────────────────────────────────────────
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+import reaf_engine
+from reaf_engine.checkpoint import CHECKPOINT_PAGES
+from reaf_engine.disk_cache import DiskCache, make_key
+from reaf_engine.pdf_pages import open_document
+
+# Conversion cache: xlsx bytes keyed by (PDF SHA-256, profile name, parser version, diagnostics level)
+CONVERSION_CACHE = DiskCache(
+    os.environ.get("REAF_CACHE_DIR", os.path.join(tempfile.gettempdir(), "reaf_conversion_cache")),
+    suffix=".xlsx",
+)
+
 # Simple user credentials (username:password)
 USERS = {
     "RDKR": "nakakojo",
@@ -58,8 +71,8 @@ with st.expander("💡 사용 팁 (Usage Tips)", expanded=False):
     st.markdown("""
     **📋 사용 방법:**
     1. **PDF 파일 업로드**: 변환할 PDF 파일을 선택하세요
-    2. **장비 선택**: cobas Pro CC 또는 cobas Pro IM 중 선택
-    3. **모드 선택**: 
+    2. **장비 선택**: 자동 감지(기본) 또는 cobas Pro CC / cobas Pro IM 중 선택
+    3. **모드 선택**: 자동 감지(기본) 또는
        - **Barcode mode**: Sample ID 기반 변환
        - **Sequence mode**: Sequence Number 기반 변환
     4. **변환 시작**: 버튼을 클릭하여 변환을 시작하세요
@@ -77,10 +90,12 @@ with st.expander("💡 사용 팁 (Usage Tips)", expanded=False):
     
     **📋 How to Use:**
     1. **Upload PDF File**: Select the PDF file to convert
-    2. **Select Analyzer**: Choose between cobas Pro CC or cobas Pro IM
-    3. **Select Mode**: 
+    2. **Select Analyzer**: Auto-detect (default), or choose cobas Pro CC / cobas Pro IM
+       - **Mixed CC + IM report**: each page is routed to its own analyzer/mode (one sheet per profile)
+    3. **Select Mode**: Auto-detect (default), or
        - **Barcode mode**: Sample ID-based conversion
        - **Sequence mode**: Sequence Number-based conversion
+       - **Both modes**: Barcode and Sequence sheets in one workbook from a single extraction
     4. **Start Conversion**: Click the button to start conversion
     
     **⚠️ Important Notes:**
@@ -96,66 +111,235 @@ with st.expander("💡 사용 팁 (Usage Tips)", expanded=False):
 # PDF uploader
 pdf_file = st.file_uploader("Upload PDF File (PDF 파일 업로드)", type=["pdf"])
 
-# Analyzer and mode selection
-device = st.selectbox("Select Analyzer (장비 선택)", ["cobas Pro CC (c503, c703)", "cobas Pro IM (e801)"])
-mode_options = ["Barcode mode (Barcode 모드)", "Sequence mode (Sequence 모드)"]
-mode = st.selectbox("Select Mode (모드 선택)", mode_options)
+# Analyzer and mode selection (auto-detected from the first page by default)
+AUTO_DETECT = "Auto-detect (자동 감지)"
+MIXED_REPORT = "Mixed CC + IM report (혼합 보고서)"
+BOTH_MODES = "Both modes (Barcode + Sequence 모두)"
+analyzer_codes = {
+    "cobas Pro CC (c503, c703)": "CC",
+    "cobas Pro IM (e801)": "IM",
+}
+mode_codes = {
+    "Barcode mode (Barcode 모드)": "ID",
+    "Sequence mode (Sequence 모드)": "Seq",
+}
+device_options = [AUTO_DETECT] + list(analyzer_codes)
+device = st.selectbox("Select Analyzer (장비 선택)", device_options + [MIXED_REPORT])
+mode_options = [AUTO_DETECT] + list(mode_codes)
+mode = st.selectbox("Select Mode (모드 선택)", mode_options + [BOTH_MODES])
+
+def choose_profile(device, mode, pdf_bytes):
+    """
+    Resolve the conversion profile name (reaf_engine.profiles.PROFILES).
+    Auto-detect parts are filled in from the first page header region; returns None if detection fails.
+    A mixed report is routed page by page during conversion, so the mode selection is ignored.
+    Both modes resolves to a list of profiles (one extraction, one sheet per mode).
+    """
+    if device == MIXED_REPORT:
+        return reaf_engine.MIXED_PROFILE
+    if mode == BOTH_MODES:
+        analyzer = analyzer_codes.get(device)
+        if analyzer is None:
+            detected = reaf_engine.detect_profile(pdf_bytes)
+            if detected is None:
+                return None
+            analyzer = reaf_engine.get_profile(detected)["analyzer"]
+        return reaf_engine.mode_profiles(analyzer)
+    analyzer = analyzer_codes.get(device)
+    mode_code = mode_codes.get(mode)
+    if analyzer is None or mode_code is None:
+        detected = reaf_engine.detect_profile(pdf_bytes)
+        if detected is None:
+            return None
+        detected = reaf_engine.get_profile(detected)
+        analyzer = analyzer or detected["analyzer"]
+        mode_code = mode_code or detected["mode"]
+    return reaf_engine.find_profile(analyzer, mode_code)
+
+def needs_checkpoint(pdf_bytes):
+    """
+    Whether to keep a resumable checkpoint for this upload.
+    Only long reports (CHECKPOINT_PAGES pages or more) use one; short uploads convert fully in memory
+    without writing anything to disk.
+    """
+    try:
+        with open_document(pdf_bytes, "pdfium") as doc:
+            return len(doc) >= CHECKPOINT_PAGES
+    except Exception:
+        return False
+
+# Diagnostic sheets ('터미널 시트', '터미널 로그') included in the Excel file
+diagnostics_options = {
+    "Summary (요약 로그만)": "summary",
+    "None (결과 시트만)": "none",
+    "Full (터미널 시트 + 로그 전체)": "full",
+}
+diagnostics_label = st.selectbox("Diagnostics (진단 정보)", list(diagnostics_options))
+diagnostics = diagnostics_options[diagnostics_label]
 
 # Start conversion button
 if st.button("🔄 Start Conversion (변환 시작)"):
     if pdf_file is None:
         st.error("Please upload a PDF file. (PDF 파일을 업로드 해주세요.)")
     else:
-        # Save uploaded PDF to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(pdf_file.getbuffer())
-            tmp_path = tmp.name
-
-        # Map to module names (without file extension)
-        module_map = {
-            ("cobas Pro CC (c503, c703)", "Barcode mode (Barcode 모드)"):  "Pro_CC_ID_pdf_to_excel",
-            ("cobas Pro CC (c503, c703)", "Sequence mode (Sequence 모드)"): "Pro_CC_Seq_pdf_to_excel",
-            ("cobas Pro IM (e801)", "Barcode mode (Barcode 모드)"):  "Pro_IM_ID_pdf_to_excel",
-            ("cobas Pro IM (e801)", "Sequence mode (Sequence 모드)"): "Pro_IM_Seq_pdf_to_excel",
-        }
-        mod_name = module_map.get((device, mode))
-        if not mod_name:
-            st.error("Unsupported analyzer/mode combination. (지원하지 않는 장비/모드 조합입니다.)")
+        pdf_bytes = pdf_file.getvalue()
+        profile = choose_profile(device, mode, pdf_bytes)
+        if not profile:
+            st.error("Could not detect the analyzer/mode. Please select them manually. "
+                     "(장비/모드를 감지하지 못했습니다. 직접 선택해주세요.)")
             st.stop()
+        if device != MIXED_REPORT and AUTO_DETECT in (device, mode):
+            profile_label = ", ".join(profile) if isinstance(profile, list) else profile
+            st.info(f"Detected profile: {profile_label} (감지된 프로파일: {profile_label})")
 
-        # Dynamically import and run the selected module
-        try:
-            mod = importlib.import_module(mod_name)
-        except Exception as e:
-            st.error(f"Failed to load module: {mod_name} (모듈 불러오기 실패)\n{str(e)}")
-            st.stop()
+        # Same PDF + same profile + same parser version + same diagnostics level -> reuse the cached Excel file
+        cache_key = make_key(hashlib.sha256(pdf_bytes).hexdigest(), profile, reaf_engine.PARSER_VERSION, diagnostics)
+        data = CONVERSION_CACHE.get(cache_key)
+
+        if data is None:
+            # Convert PDF to Excel in memory (no temp files)
+            # Only long reports write a checkpoint, so they can resume from the last saved page if the session drops
+            with st.spinner("Converting... please wait. (변환 중입니다. 잠시만 기다려주세요...)"):
+                try:
+                    data = reaf_engine.convert(profile, pdf_bytes, pdf_filename=pdf_file.name,
+                                               diagnostics=diagnostics, checkpoint=needs_checkpoint(pdf_bytes))
+                except Exception as e:
+                    st.error(f"Error during PDF conversion: {str(e)} (PDF 변환 중 오류 발생)")
+                    st.stop()
+
+            if data:
+                CONVERSION_CACHE.put(cache_key, data)
+        else:
+            st.info("Loaded from conversion cache. (이전 변환 결과를 불러왔습니다.)")
+
+        if data:
+            # Keep the result across reruns (e.g. when the save name is edited)
+            st.session_state.conversion = {
+                "data": data,
+                "profile": profile,
+                "diagnostics": diagnostics,
+                "pdf_name": pdf_file.name,
+                "pdf_size": pdf_file.size,
+            }
+        else:
+            st.session_state.pop("conversion", None)
+            st.error("Failed to generate Excel file. (엑셀 파일을 생성하지 못했습니다.)")
+
+# Provide download link for the generated Excel file with filename input
+conversion = st.session_state.get("conversion")
+if conversion and pdf_file is not None and (pdf_file.name, pdf_file.size) == (conversion["pdf_name"], conversion["pdf_size"]):
+    # PDF 파일명과 동일한 이름으로 기본값 설정 (확장자만 .xlsx로 변경)
+    pdf_filename = os.path.basename(conversion["pdf_name"])
+    base_name = os.path.splitext(pdf_filename)[0]
+    default_name = f"{base_name}.xlsx"
+    save_name = st.text_input("Save as (저장 이름)", default_name)
+    st.success("✅ Conversion completed! (변환이 완료되었습니다!)")
+    st.download_button(
+        label="📥 Download Excel (Excel 다운로드)",
+        data=conversion["data"],
+        file_name=save_name,
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
 
-        # Convert PDF to Excel
-        with st.spinner("Converting... please wait. (변환 중입니다. 잠시만 기다려주세요...)"):
-            try:
-                output_path = mod.run(tmp_path)
-            except Exception as e:
-                st.error(f"Error during PDF conversion: {str(e)} (PDF 변환 중 오류 발생)")
-                st.stop()
-
-        # Provide download link for the generated Excel file with filename input
-        if output_path and os.path.exists(output_path):
-            with open(output_path, "rb") as f:
-                data = f.read()
-            # PDF 파일명과 동일한 이름으로 기본값 설정 (확장자만 .xlsx로 변경)
-            pdf_filename = os.path.basename(pdf_file.name)
-            base_name = os.path.splitext(pdf_filename)[0]
-            default_name = f"{base_name}.xlsx"
-            save_name = st.text_input("Save as (저장 이름)", default_name)
-            st.success("✅ Conversion completed! (변환이 완료되었습니다!)")
+    # Full diagnostics as a separate compressed file, built only on request
+    if conversion["diagnostics"] != "full":
+        if st.button("🩺 Prepare full diagnostics (전체 진단 파일 준비)"):
+            with st.spinner("Preparing diagnostics... (진단 파일 준비 중...)"):
+                try:
+                    conversion["diagnostics_data"] = reaf_engine.build_diagnostics(
+                        conversion["profile"], pdf_file.getvalue(), pdf_filename=pdf_file.name)
+                except Exception as e:
+                    st.error(f"Error while preparing diagnostics: {str(e)} (진단 파일 준비 중 오류 발생)")
+        if conversion.get("diagnostics_data"):
             st.download_button(
-                label="📥 Download Excel (Excel 다운로드)",
-                data=data,
-                file_name=save_name,
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                label="📥 Download diagnostics (진단 파일 다운로드)",
+                data=conversion["diagnostics_data"],
+                file_name=f"{base_name}.diagnostics.jsonl.gz",
+                mime="application/gzip"
             )
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batch conversion (multiple PDFs, analyzer/mode per file)
+# ─────────────────────────────────────────────────────────────────────────────
+st.markdown("---")
+st.subheader("📚 Batch Conversion (여러 PDF 일괄 변환)")
+batch_files = st.file_uploader("Upload PDF Files (여러 PDF 파일 업로드)", type=["pdf"],
+                               accept_multiple_files=True, key="batch_pdfs")
+
+if batch_files:
+    # Analyzer/mode per file (defaults to the selection above; mixed reports and both modes are single-file only)
+    batch_table = st.data_editor(
+        pd.DataFrame({
+            "File": [f.name for f in batch_files],
+            "Analyzer": [device if device in device_options else AUTO_DETECT] * len(batch_files),
+            "Mode": [mode if mode in mode_options else AUTO_DETECT] * len(batch_files),
+        }),
+        column_config={
+            "File": st.column_config.TextColumn("File (파일)"),
+            "Analyzer": st.column_config.SelectboxColumn("Analyzer (장비)", options=device_options, required=True),
+            "Mode": st.column_config.SelectboxColumn("Mode (모드)", options=mode_options, required=True),
+        },
+        disabled=["File"],
+        hide_index=True,
+        key="batch_table",
+    )
+    batch_output = st.radio("Output (결과 형식)",
+                            ["ZIP (파일별 Excel)", "Combined workbook (하나의 Excel)"], horizontal=True)
+
+    if st.button("🔄 Start Batch Conversion (일괄 변환 시작)"):
+        # Fully automatic rows are detected inside the workers; partially fixed rows are resolved here
+        jobs = []
+        for f, row in zip(batch_files, batch_table.itertuples()):
+            if row.Analyzer == AUTO_DETECT and row.Mode == AUTO_DETECT:
+                jobs.append((f.name, f.getvalue(), "auto"))
+            else:
+                jobs.append((f.name, f.getvalue(), choose_profile(row.Analyzer, row.Mode, f.getvalue()) or "auto"))
+        combined = batch_output.startswith("Combined")
+        results = [None] * len(jobs)
+
+        progress = st.progress(0.0, text="Converting... (변환 중...)")
+        # Combined workbook only has result sheets, so skip per-file Excel and diagnostic sheets
+        options = {"build_excel": False, "diagnostics": "none"} if combined else {"diagnostics": diagnostics}
+        for done, (index, result) in enumerate(reaf_engine.convert_many(jobs, **options), 1):
+            results[index] = result
+            progress.progress(done / len(jobs), text=f"{done}/{len(jobs)} {result['name']}")
+
+        status_labels = {"ok": "✅ OK", "empty": "⚠️ No data (데이터 없음)", "error": "❌ Error (오류)"}
+        st.session_state.batch = {
+            "files": [(f.name, f.size) for f in batch_files],
+            "status": pd.DataFrame({
+                "File (파일)": [r["name"] for r in results],
+                "Profile (프로파일)": [r["profile"] for r in results],
+                "Status (상태)": [status_labels[r["status"]] for r in results],
+                "Rows (데이터 개수)": [r["row_count"] for r in results],
+                "Error (오류)": [r["error"] or "" for r in results],
+            }),
+            "data": reaf_engine.combined_workbook(results) if combined else reaf_engine.make_zip(results),
+            "combined": combined,
+            "has_output": any(r["status"] == "ok" for r in results),
+        }
+
+    # Per-file status and download (kept across reruns while the same files are uploaded)
+    batch = st.session_state.get("batch")
+    if batch and batch["files"] == [(f.name, f.size) for f in batch_files]:
+        st.dataframe(batch["status"], hide_index=True)
+        if batch["has_output"]:
+            if batch["combined"]:
+                st.download_button(
+                    label="📥 Download combined Excel (통합 Excel 다운로드)",
+                    data=batch["data"],
+                    file_name="REAF_batch.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+            else:
+                st.download_button(
+                    label="📥 Download ZIP (ZIP 다운로드)",
+                    data=batch["data"],
+                    file_name="REAF_batch.zip",
+                    mime="application/zip"
+                )
         else:
-            st.error("Failed to generate Excel file. (엑셀 파일을 생성하지 못했습니다.)")
+            st.error("No file was converted. (변환된 파일이 없습니다.)")
 
 # Secret button for RDKR user
 if st.session_state.logged_in and st.session_state.username == "RDKR":
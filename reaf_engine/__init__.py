@@ -0,0 +1,16 @@
+"""
+REAF PDF → Excel 변환 엔진
+
+cobas pro 보고서 PDF의 텍스트 추출(pdf_pages), 장비/모드별 파싱 규칙(profiles, parsers),
+엑셀 출력(excel)과 변환 흐름(converter)을 한 곳에서 제공합니다.
+Pro_*_pdf_to_excel.py 모듈들은 이 엔진에 프로파일 이름만 넘기는 호환용 진입점입니다.
+"""
+from .converter import (DIAGNOSTICS_LEVELS, MIXED_PROFILE, build_diagnostics, convert, diagnostics_path,
+                        parse_mixed_pages, parse_pages, process_pdf_to_excel, route_pages, run, write_diagnostics)
+from .batch import combined_workbook, convert_many, make_zip
+from .detect import classify_page, detect_profile
+from .excel import create_excel_file
+from .incremental import convert_incremental
+from .parsers import PARSER_VERSION, Row, parse_page
+from .pdf_pages import BACKENDS, DEFAULT_BACKEND, extract_page_lines, iter_page_lines
+from .profiles import PROFILES, find_profile, get_profile, mode_profiles
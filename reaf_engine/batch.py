@@ -0,0 +1,189 @@
+"""
+여러 PDF 일괄 변환
+
+파일마다 변환 프로파일을 따로 지정할 수 있고, 크기가 제한된 프로세스 풀에서 파일 단위로 동시에 변환합니다.
+결과는 파일별 엑셀을 묶은 zip 또는 파일별 결과 시트를 담은 통합 워크북으로 만들 수 있습니다.
+"""
+import io
+import os
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .converter import _prepare_sheets, check_diagnostics
+from .detect import detect_profile
+from .excel import create_combined_excel_file, create_excel_file
+from .pdf_pages import DEFAULT_BACKEND, read_source
+from .profiles import get_profile
+
+# 일괄 변환 워커 프로세스 수 상한 (공용 서버에서 한 사용자가 CPU를 모두 쓰지 않도록 제한)
+BATCH_MAX_WORKERS = 4
+
+def convert_file(name, source, profile, build_excel=True, keep_rows=None, backend=DEFAULT_BACKEND, crop=False,
+                 page_cache=True, excel_writer=None, diagnostics="full", isolate=False):
+    """
+    PDF 하나를 변환하고 결과를 dict로 반환하는 함수 (오류가 나도 예외 대신 상태로 반환)
+    워커 프로세스에서 실행되므로 인자와 반환값은 모두 pickle 가능한 값입니다.
+
+    Args:
+        name (str): PDF 파일명 (결과 시트명과 출력 파일명에 사용)
+        source (str | bytes): PDF 파일 경로 또는 PDF 내용
+        profile (str | dict): 변환 프로파일 또는 'auto' (첫 페이지로 장비/모드 감지)
+        build_excel (bool): 파일별 엑셀(xlsx 내용)을 만들지 여부 (통합 워크북만 필요하면 False)
+        keep_rows (bool): 결과에 행 리스트를 담을지 여부 (None이면 build_excel이 False일 때만 - 통합 워크북용)
+            파일별 엑셀만 필요하면 행 리스트를 워커에서 돌려받지 않아 부모 프로세스 메모리를 아낍니다.
+        그 외 옵션은 converter.run 참고
+
+    Returns:
+        dict: {'name', 'profile', 'status': 'ok' | 'empty' | 'error', 'pages': 페이지 수,
+               'rows': 행(Row) 리스트 (keep_rows가 아니면 빈 리스트), 'row_count': 행 수,
+               'data': xlsx 내용 또는 None, 'error': 오류 메시지 또는 None}
+    """
+    if keep_rows is None:
+        keep_rows = not build_excel
+    result = {
+        'name': name,
+        'profile': profile['name'] if isinstance(profile, dict) else profile,
+        'status': 'ok',
+        'pages': 0,
+        'rows': [],
+        'row_count': 0,
+        'data': None,
+        'error': None,
+    }
+    try:
+        source = read_source(source)
+        if profile == "auto":
+            profile = detect_profile(source)
+            if profile is None:
+                result['status'] = 'error'
+                result['error'] = "보고서 종류(장비/모드)를 감지할 수 없습니다."
+                return result
+            result['profile'] = profile
+        profile = get_profile(profile)
+        check_diagnostics(diagnostics)
+        extracted, terminal_logs, pdf_lines, page_count = _prepare_sheets(profile, source, name, False, None, backend,
+                                                                          crop, page_cache, diagnostics, isolate)
+        result['pages'] = page_count
+        if not extracted:
+            result['status'] = 'empty'
+            return result
+        result['row_count'] = len(extracted)
+        if keep_rows:
+            result['rows'] = extracted
+
+        if build_excel:
+            output = io.BytesIO()
+            create_excel_file(profile, name, extracted, output, terminal_logs, pdf_lines, writer=excel_writer)
+            result['data'] = output.getvalue()
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+    return result
+
+def batch_workers(job_count, max_workers=None):
+    """
+    일괄 변환에 사용할 워커 프로세스 수 (기본: CPU 코어 수, BATCH_MAX_WORKERS 이하, 파일 수 이하)
+    """
+    workers = max_workers or min(os.cpu_count() or 1, BATCH_MAX_WORKERS)
+    return max(1, min(workers, job_count))
+
+def run_bounded(func, job_args, workers, **options):
+    """
+    작업들을 크기가 제한된 프로세스 풀에서 실행하는 제너레이터 (convert_many와 CLI 일괄 변환이 함께 사용)
+    풀에는 워커 수만큼만 작업을 넣고 하나가 끝나면 다음 작업을 넣습니다.
+    job_args가 제너레이터이면 작업을 넣을 때 다음 인자를 만드므로 (PDF 읽기 등), 부모 프로세스가 들고 있는
+    인자와 결과는 전체 작업 수가 아니라 워커 수에 비례합니다. 워커가 1개이면 순서대로 실행합니다.
+
+    Args:
+        func (callable): 워커 프로세스에서 실행할 함수 (모듈 최상위 함수)
+        job_args (iterable): 작업별 위치 인자 튜플
+        workers (int): 워커 프로세스 수
+        **options: 모든 작업에 공통으로 넘길 키워드 인자
+
+    Yields:
+        tuple: (작업 인덱스, func 반환값) - 끝난 순서대로
+    """
+    pending = enumerate(job_args)
+    if workers < 2:
+        for index, args in pending:
+            yield index, func(*args, **options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        running = {}
+
+        def submit():
+            # 남은 작업이 있으면 다음 작업을 풀에 넣음
+            job = next(pending, None)
+            if job is not None:
+                index, args = job
+                running[executor.submit(func, *args, **options)] = index
+
+        for _ in range(workers):
+            submit()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                submit()
+                yield index, future.result()
+
+def convert_many(jobs, max_workers=None, **options):
+    """
+    여러 PDF를 변환하는 제너레이터 (파일 하나가 끝날 때마다 결과를 돌려주므로 진행 상태 표시에 사용 가능)
+    워커가 2개 이상이면 프로세스 풀에서 파일 단위로 동시에 변환하고, 1개이면 순서대로 변환합니다.
+    PDF 내용은 작업을 풀에 넣을 때 읽고 파일 경로는 경로로 넘기므로 (run_bounded 참고),
+    부모 프로세스가 들고 있는 PDF 내용과 결과는 전체 파일 수가 아니라 워커 수에 비례합니다.
+
+    Args:
+        jobs (list): (파일명, PDF 경로/내용/파일 객체, 프로파일) 튜플 리스트
+        max_workers (int): 최대 워커 프로세스 수 (None이면 batch_workers 기본값)
+        **options: convert_file 옵션 (build_excel, keep_rows, backend, crop, page_cache, excel_writer, diagnostics)
+
+    Yields:
+        tuple: (jobs 안의 인덱스, convert_file 결과 dict) - 끝난 순서대로
+    """
+    workers = batch_workers(len(jobs), max_workers)
+    job_args = ((name, read_source(source), profile) for name, source, profile in jobs)
+    yield from run_bounded(convert_file, job_args, workers, **options)
+
+def make_zip(results):
+    """
+    변환에 성공한 파일별 엑셀을 zip 하나로 묶는 함수 (xlsx는 이미 압축되어 있으므로 그대로 저장)
+
+    Args:
+        results (list): convert_file 결과 dict 리스트
+
+    Returns:
+        bytes: zip 파일 내용
+    """
+    output = io.BytesIO()
+    used = set()
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as archive:
+        for result in results:
+            if not result.get('data'):
+                continue
+            base_name = os.path.splitext(os.path.basename(result['name']))[0]
+            file_name = f"{base_name}.xlsx"
+            number = 2
+            while file_name.lower() in used:
+                file_name = f"{base_name} ({number}).xlsx"
+                number += 1
+            used.add(file_name.lower())
+            archive.writestr(file_name, result['data'])
+    return output.getvalue()
+
+def combined_workbook(results, writer=None):
+    """
+    파일별 결과 시트와 '변환 요약' 시트를 담은 통합 워크북을 만드는 함수
+
+    Args:
+        results (list): convert_file 결과 dict 리스트
+        writer (str): 출력 백엔드 ('openpyxl', 'xlsxwriter', None이면 자동 선택)
+
+    Returns:
+        bytes: xlsx 파일 내용
+    """
+    output = io.BytesIO()
+    create_combined_excel_file(results, output, writer=writer)
+    return output.getvalue()
@@ -0,0 +1,142 @@
+"""
+긴 변환의 체크포인트와 이어서 변환하기
+
+변환 중 CHECKPOINT_PAGES 페이지마다 파싱이 끝난 페이지의 행, Sequence 카운터, 줄 내용을
+로컬 체크포인트 파일(JSONL, 페이지당 한 줄)에 덧붙입니다.
+프로세스가 중단된 뒤 같은 PDF를 같은 설정으로 다시 변환하면 마지막으로 기록된 페이지 다음부터 이어서 처리하고,
+변환이 끝까지 진행되면 (추출된 데이터가 없어도) 체크포인트 파일을 지우고,
+중단된 뒤 다시 변환하지 않은 체크포인트는 기간/크기 한도에 따라 정리합니다.
+"""
+import json
+import os
+import tempfile
+
+from .disk_cache import DiskCache, make_key
+from .parsers import PARSER_VERSION, Row
+from .pdf_pages import file_sha256
+
+# 체크포인트 파일 형식이 바뀌면 올려야 하는 버전 (키에 포함되므로 이전 파일은 사용하지 않음)
+CHECKPOINT_VERSION = 1
+
+# 이 페이지 수마다 체크포인트 기록
+CHECKPOINT_PAGES = 100
+
+# 체크포인트 디렉터리 한도 (중단된 뒤 다시 변환하지 않은 체크포인트 정리용)
+CHECKPOINT_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+CHECKPOINT_MAX_AGE = 3 * 24 * 60 * 60      # 3일 (마지막 기록 시점 기준)
+
+def default_checkpoint_dir():
+    """기본 체크포인트 디렉터리 (REAF_CHECKPOINT_DIR 환경변수로 변경 가능)"""
+    return os.environ.get("REAF_CHECKPOINT_DIR", os.path.join(tempfile.gettempdir(), "reaf_checkpoints"))
+
+def evict_checkpoints(directory):
+    """
+    체크포인트 디렉터리 정리 (DiskCache와 같은 규칙)
+    CHECKPOINT_MAX_AGE 동안 기록이 없는 체크포인트를 지우고, 총 크기가 CHECKPOINT_MAX_BYTES를 넘으면
+    가장 오래 기록하지 않은 체크포인트부터 지웁니다.
+    """
+    DiskCache(directory, max_bytes=CHECKPOINT_MAX_BYTES, max_age=CHECKPOINT_MAX_AGE, suffix=".jsonl").evict()
+
+class Checkpoint:
+    """
+    페이지 순서대로 기록되는 체크포인트 파일
+    각 줄은 {"page": 페이지 인덱스, "counter": 페이지까지의 테스트 수, "rows": [...], "lines": [...]} 입니다.
+    마지막 줄이 중간에 끊겨 있으면(기록 중 중단) 그 줄은 버리고 앞의 완전한 페이지부터 이어서 씁니다.
+    기록된 페이지는 메모리에 올려 두지 않고 필요할 때 records()로 파일에서 다시 읽습니다.
+    """
+    def __init__(self, path):
+        self.path = path
+        # 기록된 페이지 수와 마지막으로 기록된 페이지까지의 Sequence 테스트 수
+        self.page_count = 0
+        self.counter = 0
+        self._load()
+
+    def _load(self):
+        """기록된 페이지 확인 (0페이지부터 연속된 완전한 줄만 사용)"""
+        valid_bytes = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for raw in f:
+                    if not raw.endswith(b'\n'):
+                        break
+                    try:
+                        record = json.loads(raw)
+                    except ValueError:
+                        break
+                    if record.get('page') != self.page_count:
+                        break
+                    self.page_count += 1
+                    self.counter = record['counter']
+                    valid_bytes += len(raw)
+                size = f.seek(0, os.SEEK_END)
+        except OSError:
+            return
+        if size != valid_bytes:
+            # 끊긴 줄 뒤에 이어 쓰지 않도록 완전한 줄까지만 남김
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_bytes)
+
+    def records(self):
+        """
+        기록된 페이지들을 순서대로 읽는 제너레이터
+
+        Yields:
+            dict: {"page", "counter", "rows", "lines"} ("rows"는 Row 리스트, 격리 추출에 실패한 페이지는 "failure" 포함)
+        """
+        if not self.page_count:
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for _, line in zip(range(self.page_count), f):
+                record = json.loads(line)
+                record['rows'] = [Row.from_dict(row) for row in record['rows']]
+                yield record
+
+    def append(self, records):
+        """
+        파싱이 끝난 페이지들을 기록 (디스크에 내려쓴 뒤 반환)
+
+        Args:
+            records (list): 페이지 순서대로의 {"page", "counter", "rows", "lines"} dict 리스트 ("rows"는 Row 리스트)
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=Row.to_dict) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if records:
+            self.page_count += len(records)
+            self.counter = records[-1]['counter']
+
+    def remove(self):
+        """변환이 끝난 체크포인트 삭제"""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+def open_checkpoint(checkpoint, source, profile, backend, region=None):
+    """
+    converter의 checkpoint 인자를 Checkpoint 객체로 변환하는 함수
+    파일 이름은 (PDF 해시, 프로파일, 파서 버전, 백엔드, 영역)으로 정하므로 설정이 같을 때만 이어서 변환합니다.
+    체크포인트를 열 때마다 디렉터리의 오래된 체크포인트를 정리합니다 (evict_checkpoints).
+
+    Args:
+        checkpoint (bool | str | Checkpoint): True이면 기본 디렉터리, 문자열이면 체크포인트 디렉터리, False/None이면 사용 안 함
+        source (str | bytes): PDF 파일 경로 또는 PDF 내용
+        profile (dict): 변환 프로파일
+        backend (str): 텍스트 추출 백엔드
+        region (str): 영역 프로파일 이름 (None이면 전체 페이지)
+
+    Returns:
+        Checkpoint: 체크포인트 객체, 사용하지 않으면 None
+    """
+    if not checkpoint:
+        return None
+    if isinstance(checkpoint, Checkpoint):
+        return checkpoint
+    directory = default_checkpoint_dir() if checkpoint is True else checkpoint
+    evict_checkpoints(directory)
+    key = make_key(CHECKPOINT_VERSION, file_sha256(source), json.dumps(profile, sort_keys=True), PARSER_VERSION,
+                   backend, region or "")
+    return Checkpoint(os.path.join(directory, f"{key}.jsonl"))
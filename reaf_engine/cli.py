@@ -0,0 +1,241 @@
+"""
+대화상자 없이 여러 PDF를 한 번에 변환하는 명령줄 도구
+
+    python -m reaf_engine <PDF 파일 | 디렉터리 | glob 패턴>... -o <출력 디렉터리> [옵션]
+
+출력 엑셀이 PDF보다 새로우면 건너뛰고(--force로 다시 변환), 끝나면 통계를 JSON 한 줄로 표준 출력에 기록합니다.
+--incremental이면 누적 PDF의 새로 붙은 페이지만 변환해서 기존 엑셀에 이어 씁니다 (incremental 모듈 참고).
+변환 중 메시지는 표준 에러로 출력되므로 표준 출력은 JSON만 남습니다.
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
+
+from .batch import batch_workers, convert_file, run_bounded
+from .converter import DIAGNOSTICS_LEVELS
+from .detect import detect_profile
+from .incremental import convert_incremental
+from .isolation import PAGE_MEMORY_MB, PAGE_TIMEOUT, PageLimits
+from .pdf_pages import BACKENDS, DEFAULT_BACKEND
+from .profiles import PROFILES
+
+def find_pdfs(inputs, recursive=False):
+    """
+    입력(파일, 디렉터리, glob 패턴)에서 PDF 파일 목록을 만드는 함수
+    디렉터리 입력은 디렉터리 기준 상대 경로를 함께 돌려주어 출력 디렉터리에 같은 구조로 저장할 수 있게 합니다.
+
+    Args:
+        inputs (list): 입력 경로/패턴 리스트
+        recursive (bool): 디렉터리 입력의 하위 디렉터리까지 찾을지 여부
+
+    Returns:
+        list: (PDF 경로, 출력 기준 상대 경로) 튜플 리스트 (중복 제거, 입력 순서 유지)
+    """
+    found = []
+    seen = set()
+
+    def add(path, relative):
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            found.append((path, relative))
+
+    for item in inputs:
+        if os.path.isdir(item):
+            pattern = os.path.join(item, "**", "*") if recursive else os.path.join(item, "*")
+            for path in sorted(glob.glob(pattern, recursive=recursive)):
+                if path.lower().endswith(".pdf") and os.path.isfile(path):
+                    add(path, os.path.relpath(path, item))
+        elif os.path.isfile(item):
+            add(item, os.path.basename(item))
+        else:
+            for path in sorted(glob.glob(item, recursive=True)):
+                if path.lower().endswith(".pdf") and os.path.isfile(path):
+                    add(path, os.path.basename(path))
+    return found
+
+def output_path_for(relative, output_dir):
+    """출력 엑셀 경로 (출력 디렉터리 아래 상대 경로, 확장자만 .xlsx)"""
+    return os.path.join(output_dir, os.path.splitext(relative)[0] + ".xlsx")
+
+def is_up_to_date(pdf_path, output_path):
+    """출력 엑셀이 있고 PDF보다 나중에 만들어졌으면 True"""
+    try:
+        return os.path.getsize(output_path) > 0 and os.path.getmtime(output_path) >= os.path.getmtime(pdf_path)
+    except OSError:
+        return False
+
+def write_atomic(path, data):
+    """임시 파일에 쓴 뒤 이름을 바꿔서 저장 (중간에 중단되어도 불완전한 엑셀이 '최신'으로 남지 않도록)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def convert_incremental_to_file(pdf_path, output_path, profile="auto", build_excel=True, **options):
+    """
+    convert_to_file의 증분 변환 버전: 이전 변환 이후 새로 붙은 페이지만 변환해서 output_path에 이어 씀
+    (엑셀을 항상 output_path에 직접 쓰므로 build_excel은 사용하지 않음)
+
+    Returns:
+        dict: {'profile', 'status', 'pages', 'rows', 'error', 'written'} (pages/rows는 이번에 새로 처리한 페이지/행 수)
+    """
+    if profile == "auto":
+        profile = detect_profile(pdf_path)
+        if profile is None:
+            raise ValueError("보고서 종류(장비/모드)를 감지할 수 없습니다.")
+    info = convert_incremental(profile, pdf_path, output_path, **options)
+    return {
+        'profile': profile,
+        'status': 'empty' if info['mode'] == 'empty' else 'ok',
+        'pages': info['new_pages'],
+        'rows': info['new_rows'],
+        'error': None,
+        'written': info['mode'] in ('full', 'append', 'unchanged'),
+    }
+
+def convert_to_file(pdf_path, output_path, profile="auto", incremental=False, **options):
+    """
+    워커 프로세스에서 실행되는 함수: PDF 하나를 변환해서 output_path에 저장
+
+    Args:
+        pdf_path (str): PDF 파일 경로
+        output_path (str): 출력 엑셀 경로
+        profile (str): 변환 프로파일 이름 또는 'auto' (첫 페이지로 자동 감지)
+        incremental (bool): True이면 누적 PDF의 새 페이지만 변환해서 기존 엑셀에 이어 씀
+        **options: batch.convert_file 옵션
+
+    Returns:
+        dict: {'pdf', 'output', 'profile', 'status', 'pages', 'rows', 'seconds', 'error'}
+    """
+    started = time.perf_counter()
+    # 변환기 메시지가 JSON 출력과 섞이지 않도록 표준 에러로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            if incremental:
+                result = convert_incremental_to_file(pdf_path, output_path, profile, **options)
+            else:
+                result = convert_file(os.path.basename(pdf_path), pdf_path, profile, **options)
+                if result['data']:
+                    write_atomic(output_path, result['data'])
+                result = dict(result, rows=result['row_count'], written=bool(result['data']))
+        except Exception as e:
+            result = {'profile': profile, 'status': 'error', 'pages': 0, 'rows': 0, 'error': str(e), 'written': False}
+
+    return {
+        'pdf': pdf_path,
+        'output': output_path if result['written'] else None,
+        'profile': result['profile'],
+        'status': result['status'],
+        'pages': result['pages'],
+        'rows': result['rows'],
+        'seconds': round(time.perf_counter() - started, 3),
+        'error': result['error'],
+    }
+
+def run_batch(pdfs, output_dir, profile="auto", jobs=None, force=False, incremental=False, **options):
+    """
+    PDF 목록을 변환하고 통계를 반환하는 함수
+
+    Args:
+        pdfs (list): find_pdfs 결과 [(PDF 경로, 상대 경로), ...]
+        output_dir (str): 출력 디렉터리
+        profile (str): 변환 프로파일 이름 또는 'auto'
+        jobs (int): 워커 프로세스 수 (None이면 batch_workers 기본값)
+        force (bool): True이면 최신 출력이 있어도 다시 변환
+        incremental (bool): True이면 누적 PDF의 새 페이지만 변환해서 기존 엑셀에 이어 씀
+        **options: batch.convert_file 옵션
+
+    Returns:
+        dict: 통계 (files, converted, skipped, empty, failed, pages, rows, seconds, pages_per_second, failures)
+    """
+    started = time.perf_counter()
+    stats = {'files': len(pdfs), 'converted': 0, 'skipped': 0, 'empty': 0, 'failed': 0, 'pages': 0, 'rows': 0}
+    failures = []
+
+    todo = []
+    for pdf_path, relative in pdfs:
+        output_path = output_path_for(relative, output_dir)
+        if not force and is_up_to_date(pdf_path, output_path):
+            stats['skipped'] += 1
+        else:
+            todo.append((pdf_path, output_path))
+
+    def collect(item):
+        stats['pages'] += item['pages']
+        stats['rows'] += item['rows']
+        if item['status'] == 'ok':
+            stats['converted'] += 1
+        elif item['status'] == 'empty':
+            stats['empty'] += 1
+        else:
+            stats['failed'] += 1
+            failures.append({'pdf': item['pdf'], 'error': item['error']})
+        print(f"[{item['status']}] {item['pdf']} ({item['profile']}, {item['pages']}p, {item['rows']} rows, "
+              f"{item['seconds']}s)", file=sys.stderr)
+
+    # 앱의 일괄 변환(convert_many)과 같은 방식으로 워커 수만큼만 풀에 넣으며 변환
+    workers = batch_workers(len(todo), jobs)
+    job_args = ((pdf_path, output_path, profile, incremental) for pdf_path, output_path in todo)
+    for _, item in run_bounded(convert_to_file, job_args, workers, **options):
+        collect(item)
+
+    seconds = time.perf_counter() - started
+    stats['seconds'] = round(seconds, 3)
+    stats['pages_per_second'] = round(stats['pages'] / seconds, 2) if seconds > 0 else 0.0
+    stats['failures'] = failures
+    return stats
+
+def build_parser():
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="python -m reaf_engine",
+        description="cobas pro 보고서 PDF를 대화상자 없이 엑셀로 일괄 변환합니다. 끝나면 통계를 JSON으로 출력합니다.",
+    )
+    parser.add_argument("inputs", nargs="+", help="PDF 파일, 디렉터리 또는 glob 패턴 (예: 'exports/**/*.pdf')")
+    parser.add_argument("-o", "--output-dir", required=True, help="엑셀 출력 디렉터리")
+    parser.add_argument("-p", "--profile", default="auto", choices=["auto"] + list(PROFILES),
+                        help="변환 프로파일 (기본: auto - 첫 페이지로 장비/모드 감지)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="동시에 변환할 워커 프로세스 수")
+    parser.add_argument("-r", "--recursive", action="store_true", help="디렉터리 입력의 하위 디렉터리까지 변환")
+    parser.add_argument("--force", action="store_true", help="최신 출력이 있어도 다시 변환")
+    parser.add_argument("--incremental", action="store_true",
+                        help="누적 PDF의 새로 붙은 페이지만 변환해서 기존 엑셀에 이어 쓰기 (진단 정보 full 제외)")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=list(BACKENDS), help="텍스트 추출 백엔드")
+    parser.add_argument("--crop", action="store_true", help="헤더 줄과 결과 블록 영역만 잘라서 추출")
+    parser.add_argument("--diagnostics", default="summary", choices=DIAGNOSTICS_LEVELS,
+                        help="엑셀에 넣을 진단 정보 수준 (기본: summary)")
+    parser.add_argument("--no-page-cache", action="store_true", help="페이지 텍스트 캐시 사용 안 함")
+    parser.add_argument("--isolate", action="store_true",
+                        help="페이지마다 시간/메모리 제한이 있는 격리된 워커 프로세스에서 추출 (실패 페이지는 단순한 백엔드로 재시도)")
+    parser.add_argument("--page-timeout", type=float, default=PAGE_TIMEOUT,
+                        help=f"--isolate 사용 시 페이지당 추출 시간 제한 (초, 기본: {PAGE_TIMEOUT:g})")
+    parser.add_argument("--page-memory", type=int, default=PAGE_MEMORY_MB,
+                        help=f"--isolate 사용 시 추출 워커가 시작 후 더 쓸 수 있는 메모리 (MB, 기본: {PAGE_MEMORY_MB})")
+    return parser
+
+def main(argv=None):
+    """
+    명령줄 진입점
+
+    Returns:
+        int: 종료 코드 (변환 실패한 파일이 있으면 1, 입력 PDF가 없으면 2)
+    """
+    args = build_parser().parse_args(argv)
+    pdfs = find_pdfs(args.inputs, args.recursive)
+    if not pdfs:
+        print("변환할 PDF 파일이 없습니다.", file=sys.stderr)
+        print(json.dumps({'files': 0, 'failures': []}))
+        return 2
+
+    stats = run_batch(pdfs, args.output_dir, profile=args.profile, jobs=args.jobs, force=args.force,
+                      incremental=args.incremental, build_excel=True, backend=args.backend, crop=args.crop, page_cache=not args.no_page_cache,
+                      diagnostics=args.diagnostics,
+                      isolate=PageLimits(args.page_timeout, args.page_memory) if args.isolate else False)
+    print(json.dumps(stats, ensure_ascii=False))
+    return 1 if stats['failed'] else 0
@@ -0,0 +1,826 @@
+import gzip
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from .checkpoint import CHECKPOINT_PAGES, open_checkpoint
+from .detect import classify_page
+from .excel import ExcelStream, create_combined_excel_file, create_excel_file
+from .gui import ProgressWindow, open_excel_file, select_pdf_file, select_save_location
+from .parsers import PARSER_VERSION, parse_page
+from .pdf_pages import (DEFAULT_BACKEND, STREAM_CHUNK_PAGES, PageReader, extract_page_lines, iter_page_lines,
+                        read_source, resolve_page_cache)
+from .profiles import PROFILES, get_profile
+
+# 진단 정보 수준
+# none: 결과 시트만 / summary: 요약 '터미널 로그' 시트 / full: '터미널 시트'(PDF 줄별 내용)와 '터미널 로그' 전체
+DIAGNOSTICS_LEVELS = ("none", "summary", "full")
+
+# 혼합 보고서용 프로파일 이름: 페이지마다 장비/모드를 판단해서 프로파일별 시트로 나눔
+MIXED_PROFILE = "mixed"
+
+def check_diagnostics(diagnostics):
+    """진단 정보 수준 값 확인"""
+    if diagnostics not in DIAGNOSTICS_LEVELS:
+        raise ValueError(f"알 수 없는 진단 정보 수준입니다: {diagnostics} (사용 가능: {', '.join(DIAGNOSTICS_LEVELS)})")
+
+def count_flags(extracted):
+    """
+    Data Alarm / Rerun 행 수
+
+    Returns:
+        tuple: (alarms, reruns)
+    """
+    alarms = sum(1 for data in extracted if data.get('data_alarm') == 'Y')
+    reruns = sum(1 for data in extracted if data.get('rerun') == 'Y')
+    return alarms, reruns
+
+def summary_logs(pdf_filename, total_pages, empty_pages, extracted):
+    """
+    summary 수준에서 '터미널 로그' 시트에 기록할 요약 줄들
+
+    Args:
+        pdf_filename (str): PDF 파일명
+        total_pages (int): 전체 페이지 수
+        empty_pages (list): 텍스트가 없는 페이지 번호 리스트 (1부터)
+        extracted (list): 전체 행(Row) 리스트
+
+    Returns:
+        list: 요약 문자열 리스트
+    """
+    return summary_count_logs(pdf_filename, total_pages, empty_pages, len(extracted), *count_flags(extracted))
+
+def summary_count_logs(pdf_filename, total_pages, empty_pages, row_count, alarms, reruns):
+    """
+    summary_logs와 같은 요약 줄들을 행 대신 집계 값으로 만드는 함수 (증분 변환처럼 전체 행이 없을 때)
+    """
+    logs = [
+        f"PDF 파일: {pdf_filename}",
+        f"PDF 총 페이지 수: {total_pages}",
+        f"총 데이터 개수: {row_count}",
+        f"Data Alarm: {alarms}개, Rerun: {reruns}개",
+    ]
+    if empty_pages:
+        logs.append(f"텍스트를 추출할 수 없는 페이지: {', '.join(str(page) for page in empty_pages)}")
+    return logs
+
+def failure_logs(failures):
+    """
+    격리 추출에 실패한 페이지 기록을 '터미널 로그' 시트에 넣을 줄들로 만드는 함수
+
+    Args:
+        failures (list): extract_page_lines의 failures 기록
+
+    Returns:
+        list: 로그 문자열 리스트
+    """
+    logs = []
+    for failure in failures:
+        if failure['fallback']:
+            result = f"{failure['fallback']} 백엔드로 다시 추출함"
+        else:
+            result = "빈 페이지로 처리함"
+        logs.append(f"페이지 {failure['page']} 추출 실패: {failure['error']} ({result})")
+    return logs
+
+def terminal_lines(lines, profile):
+    """
+    터미널 시트에 기록할 페이지 줄 리스트 (프로파일에 따라 빈 줄 포함 여부 결정, 프로파일이 없으면 빈 줄 제외)
+    """
+    if profile is not None and profile['terminal_blank_lines']:
+        return lines
+    return [line.strip() for line in lines if line.strip()]
+
+def parse_pages(page_lines, profile):
+    """
+    모든 페이지를 순서대로 파싱하는 함수
+    Sequence 모드의 테스트 카운터는 페이지 간에 이어집니다.
+
+    Args:
+        page_lines (list): 페이지별 줄 리스트
+        profile (str | dict): 변환 프로파일
+
+    Returns:
+        list: 전체 행(Row) 리스트
+    """
+    profile = get_profile(profile)
+    extracted = []
+    counter = 0
+    for index, lines in enumerate(page_lines):
+        _, _, rows, counter = parse_page(lines, profile, index == 0, counter)
+        extracted.extend(rows)
+    return extracted
+
+def route_pages(page_lines):
+    """
+    혼합 보고서의 페이지마다 변환 프로파일과 페이지 종류를 정하는 함수
+    판단할 수 없는 페이지(헤더가 없는 이어지는 페이지 등)는 바로 앞 페이지의 프로파일을 이어받습니다.
+
+    Args:
+        page_lines (list): 페이지별 줄 리스트
+
+    Returns:
+        list: 페이지별 (프로파일 dict 또는 None, 첫 페이지 형식 여부) 튜플 리스트
+    """
+    routes = []
+    previous = None
+    for lines in page_lines:
+        name, first_page = classify_page(lines)
+        if name is None:
+            routes.append((previous, False))
+        else:
+            previous = PROFILES[name]
+            routes.append((previous, first_page))
+    return routes
+
+def _parse_routed(page_lines, routes):
+    """
+    route_pages 결과대로 페이지를 파싱하는 함수
+    Sequence 모드의 테스트 카운터는 프로파일별로 이어지고, 첫 페이지 형식의 페이지(새 보고서)에서 다시 시작합니다.
+
+    Yields:
+        tuple: (페이지 인덱스, 프로파일 dict 또는 None, 행(Row) 리스트)
+    """
+    counters = {}
+    for index, (lines, (profile, first_page)) in enumerate(zip(page_lines, routes)):
+        if profile is None:
+            yield index, None, []
+            continue
+        counter = 0 if first_page else counters.get(profile['name'], 0)
+        _, _, rows, counters[profile['name']] = parse_page(lines, profile, first_page, counter)
+        yield index, profile, rows
+
+def parse_mixed_pages(page_lines, routes=None):
+    """
+    혼합 보고서의 모든 페이지를 페이지별 프로파일로 파싱하는 함수
+
+    Args:
+        page_lines (list): 페이지별 줄 리스트
+        routes (list): route_pages 결과 (None이면 새로 판단)
+
+    Returns:
+        dict: 프로파일 이름별 {'rows': 행(Row) 리스트, 'pages': 페이지 수} (처음 나온 순서)
+    """
+    if routes is None:
+        routes = route_pages(page_lines)
+    sections = {}
+    for _, profile, rows in _parse_routed(page_lines, routes):
+        if profile is not None:
+            section = sections.setdefault(profile['name'], {'rows': [], 'pages': 0})
+            section['rows'].extend(rows)
+            section['pages'] += 1
+    return sections
+
+def source_name(source):
+    """PDF 입력(경로 또는 파일 객체)의 파일명, 알 수 없으면 'PDF'"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(source)
+    return os.path.basename(getattr(source, 'name', None) or "PDF")
+
+def _stream_pages(profile, source, checkpoint, parallel, max_workers, backend, region, cache, isolate=None,
+                  failures=None):
+    """
+    페이지를 순서대로 추출/파싱해서 한 페이지씩 내보내는 제너레이터 (내보낸 페이지는 메모리에 남기지 않음)
+    checkpoint(Checkpoint)가 있으면 기록된 페이지는 체크포인트 파일에서 읽고,
+    이후 페이지는 CHECKPOINT_PAGES 페이지마다 기록합니다 (격리 추출에 실패한 페이지 기록 포함).
+
+    Yields:
+        tuple: (lines, rows) - 페이지의 줄 리스트와 행(Row) 리스트 (첫 페이지부터 순서대로)
+    """
+    start = 0
+    counter = 0
+    if checkpoint is not None and checkpoint.page_count:
+        print(f"체크포인트에서 이어서 변환합니다 ({checkpoint.page_count}페이지 완료)")
+        for record in checkpoint.records():
+            if 'failure' in record and failures is not None:
+                failures.append(record['failure'])
+            yield record['lines'], record['rows']
+        start = checkpoint.page_count
+        counter = checkpoint.counter
+
+    records = []
+    failed = {}
+    new_failures = []
+    # 체크포인트를 쓰면 병렬/격리 추출도 체크포인트 단위로 나눠서 중단 시 잃는 작업을 줄임
+    chunk_pages = CHECKPOINT_PAGES if checkpoint is not None else STREAM_CHUNK_PAGES
+    for index, lines in enumerate(iter_page_lines(source, parallel=parallel, max_workers=max_workers,
+                                                  backend=backend, region=region, cache=cache, start=start,
+                                                  isolate=isolate, failures=new_failures,
+                                                  chunk_pages=chunk_pages), start):
+        # 격리 추출 실패 기록은 묶음마다 그 묶음의 페이지를 내보내기 전에 덧붙여짐
+        for failure in new_failures:
+            failed[failure['page'] - 1] = failure
+        if failures is not None:
+            failures.extend(new_failures)
+        new_failures.clear()
+
+        # 페이지 순서대로 처리해야 Sequence 모드의 테스트 카운터가 연속됨
+        _, _, rows, counter = parse_page(lines, profile, index == 0, counter)
+        if checkpoint is not None:
+            record = {'page': index, 'counter': counter, 'rows': rows, 'lines': lines}
+            if index in failed:
+                record['failure'] = failed.pop(index)
+            records.append(record)
+            if len(records) == CHECKPOINT_PAGES:
+                checkpoint.append(records)
+                records = []
+        yield lines, rows
+    if records:
+        checkpoint.append(records)
+
+def _write_stream(profile, pages, pdf_filename, output, excel_writer, diagnostics, failures):
+    """
+    run()/convert() 공통: _stream_pages의 페이지를 받는 대로 엑셀에 쓰는 함수 (excel.ExcelStream 참고)
+    요약 진단 정보는 행을 모아 두지 않고 페이지마다 집계한 값으로 만들고,
+    격리 추출에 실패한 페이지는 진단 정보 수준과 상관없이 '터미널 로그' 시트에 기록합니다.
+
+    Returns:
+        tuple: (page_count, row_count), 페이지나 추출된 데이터가 없으면 엑셀을 쓰지 않고 row_count가 0
+    """
+    full = diagnostics == "full"
+    book = ExcelStream(profile, pdf_filename, output, excel_writer, terminal_sheet=full)
+    page_count = 0
+    empty_pages = []
+    alarms = reruns = 0
+    for lines, rows in pages:
+        page_count += 1
+        if not any(lines):
+            empty_pages.append(page_count)
+        page_alarms, page_reruns = count_flags(rows)
+        alarms += page_alarms
+        reruns += page_reruns
+        book.add_page(page_count, rows, terminal_lines(lines, profile) if full else None)
+
+    if page_count == 0:
+        print("PDF에 페이지가 없습니다.")
+        return 0, 0
+    if book.row_count == 0:
+        print("추출된 데이터가 없습니다.")
+        return page_count, 0
+
+    terminal_logs = None
+    if diagnostics == "summary":
+        terminal_logs = summary_count_logs(pdf_filename, page_count, empty_pages, book.row_count, alarms, reruns)
+    if failures:
+        terminal_logs = (terminal_logs or []) + failure_logs(failures)
+    book.close(terminal_logs)
+    return page_count, book.row_count
+
+def _prepare_sheets(profile, source, pdf_filename, parallel, max_workers, backend, crop, page_cache, diagnostics,
+                    isolate=None):
+    """
+    일괄 변환용: 텍스트 추출과 파싱 후 엑셀에 쓸 데이터를 모두 메모리에 준비하는 함수
+    (통합 워크북에 행이 필요하므로 스트리밍하지 않음, 단일 파일 변환은 _stream_pages/_write_stream 사용)
+    격리 추출에 실패한 페이지는 진단 정보 수준과 상관없이 '터미널 로그' 시트에 기록합니다.
+
+    Returns:
+        tuple: (extracted, terminal_logs, pdf_lines, page_count), 페이지나 추출된 데이터가 없으면 extracted가 빈 리스트
+    """
+    region = profile['analyzer'] if crop else None
+    failures = []
+    # PDF 페이지별 텍스트 추출 (parallel=True이면 프로세스 풀 사용, 결과는 페이지 순서 유지)
+    page_lines = extract_page_lines(source, parallel=parallel, max_workers=max_workers, backend=backend,
+                                    region=region, cache=resolve_page_cache(page_cache), isolate=isolate,
+                                    failures=failures)
+    # 페이지 순서대로 처리해야 Sequence 모드의 테스트 카운터가 연속됨
+    extracted = parse_pages(page_lines, profile)
+    if len(page_lines) == 0:
+        print("PDF에 페이지가 없습니다.")
+        return [], None, None, 0
+
+    if not extracted:
+        print("추출된 데이터가 없습니다.")
+        return [], None, None, len(page_lines)
+
+    # 진단 정보 시트 구성
+    terminal_logs = None
+    pdf_lines = None
+    if diagnostics == "full":
+        # PDF 줄별 데이터 수집 (이미 추출한 텍스트 재사용)
+        pdf_lines = [{'page': page_num, 'lines': terminal_lines(lines, profile)}
+                     for page_num, lines in enumerate(page_lines, 1)]
+    elif diagnostics == "summary":
+        empty_pages = [page_num for page_num, lines in enumerate(page_lines, 1) if not any(lines)]
+        terminal_logs = summary_logs(pdf_filename, len(page_lines), empty_pages, extracted)
+    if failures:
+        terminal_logs = (terminal_logs or []) + failure_logs(failures)
+    return extracted, terminal_logs, pdf_lines, len(page_lines)
+
+def is_combined(profile):
+    """여러 프로파일 시트를 만드는 변환인지 (혼합 보고서 'mixed' 또는 프로파일 리스트)"""
+    return profile == MIXED_PROFILE or isinstance(profile, (list, tuple))
+
+def _prepare_combined_sheets(profile, source, pdf_filename, parallel, max_workers, backend, crop, page_cache,
+                             diagnostics, isolate=None):
+    """
+    run()/convert() 공통: 한 번 추출한 페이지 텍스트를 프로파일별 결과로 나누는 함수
+    - 'mixed': 페이지마다 장비/모드를 판단해서 해당 프로파일로 파싱 (영역 잘라내기는 사용하지 않음)
+    - 프로파일 리스트: 모든 페이지를 각 프로파일로 파싱 (예: 같은 보고서의 Barcode/Sequence 시트를 함께 생성)
+
+    Returns:
+        tuple: (results, terminal_logs, pdf_lines, page_count)
+            results는 프로파일별 결과 dict 리스트 (excel.create_combined_excel_file 입력), 데이터가 없으면 빈 리스트
+    """
+    mixed = profile == MIXED_PROFILE
+    profiles = None if mixed else [get_profile(item) for item in profile]
+    # 페이지마다 장비가 다를 수 있으면 결과 블록 영역만 잘라내지 않고 전체 페이지를 추출
+    region = None
+    if crop and not mixed and len({item['analyzer'] for item in profiles}) == 1:
+        region = profiles[0]['analyzer']
+    failures = []
+    page_lines = extract_page_lines(source, parallel=parallel, max_workers=max_workers, backend=backend,
+                                    region=region, cache=resolve_page_cache(page_cache), isolate=isolate,
+                                    failures=failures)
+    if len(page_lines) == 0:
+        print("PDF에 페이지가 없습니다.")
+        return [], None, None, 0
+
+    if mixed:
+        routes = route_pages(page_lines)
+        sections = parse_mixed_pages(page_lines, routes)
+        line_profiles = [item for item, _ in routes]
+    else:
+        # 추출은 한 번만 하고 같은 줄 리스트를 프로파일마다 파싱
+        sections = {item['name']: {'rows': parse_pages(page_lines, item), 'pages': len(page_lines)}
+                    for item in profiles}
+        line_profiles = [profiles[0]] * len(page_lines)
+    results = [{'name': name, 'profile': name, 'status': 'ok', 'pages': section['pages'], 'rows': section['rows'],
+                'error': None}
+               for name, section in sections.items() if section['rows']]
+    if not results:
+        print("추출된 데이터가 없습니다.")
+        return [], None, None, len(page_lines)
+
+    terminal_logs = None
+    pdf_lines = None
+    if diagnostics == "full":
+        pdf_lines = [{'page': page_num, 'lines': terminal_lines(lines, line_profile)}
+                     for page_num, (lines, line_profile) in enumerate(zip(page_lines, line_profiles), 1)]
+    elif diagnostics == "summary":
+        empty_pages = [page_num for page_num, lines in enumerate(page_lines, 1) if not any(lines)]
+        extracted = [row for result in results for row in result['rows']]
+        terminal_logs = summary_logs(pdf_filename, len(page_lines), empty_pages, extracted)
+        for result in results:
+            terminal_logs.append(f"{result['name']}: {result['pages']}페이지, {len(result['rows'])}개")
+        unrouted = [page_num for page_num, line_profile in enumerate(line_profiles, 1) if line_profile is None]
+        if unrouted:
+            terminal_logs.append(f"보고서 종류를 판단할 수 없는 페이지: {', '.join(str(page) for page in unrouted)}")
+    if failures:
+        terminal_logs = (terminal_logs or []) + failure_logs(failures)
+    return results, terminal_logs, pdf_lines, len(page_lines)
+
+def convert(profile, source, pdf_filename:str=None, parallel:bool=False, max_workers:int=None,
+            backend:str=DEFAULT_BACKEND, crop:bool=False, page_cache=True, excel_writer:str=None,
+            diagnostics:str="full", checkpoint=False, isolate=False) -> bytes:
+    """
+    메모리 안에서 PDF를 엑셀로 변환하는 함수 (임시 파일 없이 PDF 내용을 받아 xlsx 내용을 반환)
+    옵션은 run()과 같습니다.
+
+    Args:
+        profile (str | dict | list): 변환 프로파일 ('CC_ID', 'CC_Seq', 'IM_ID', 'IM_Seq', 혼합 보고서는 'mixed',
+            프로파일 리스트이면 한 번 추출해서 프로파일별 시트 생성 - run() 참고)
+        source (bytes | BinaryIO): PDF 내용 또는 파일 객체 (Streamlit 업로드 파일, BytesIO 등)
+        pdf_filename (str): 결과 시트명에 사용할 PDF 파일명 (None이면 파일 객체의 name, 없으면 'PDF')
+
+    Returns:
+        bytes: xlsx 파일 내용, 페이지나 추출된 데이터가 없으면 None
+    """
+    check_diagnostics(diagnostics)
+    if pdf_filename is None:
+        pdf_filename = source_name(source)
+
+    output = io.BytesIO()
+    if is_combined(profile):
+        results, terminal_logs, pdf_lines, _ = _prepare_combined_sheets(profile, read_source(source), pdf_filename,
+                                                                        parallel, max_workers, backend, crop,
+                                                                        page_cache, diagnostics, isolate)
+        if not results:
+            return None
+        create_combined_excel_file(results, output, excel_writer, terminal_logs, pdf_lines)
+        return output.getvalue()
+
+    profile = get_profile(profile)
+    source = read_source(source)
+    region = profile['analyzer'] if crop else None
+    checkpoint = open_checkpoint(checkpoint, source, profile, backend, region)
+    failures = []
+    pages = _stream_pages(profile, source, checkpoint, parallel, max_workers, backend, region,
+                          resolve_page_cache(page_cache), isolate, failures)
+    _, row_count = _write_stream(profile, pages, pdf_filename, output, excel_writer, diagnostics, failures)
+    # 변환이 끝까지 진행되었으면 데이터가 없어도 체크포인트 삭제 (중단된 변환만 체크포인트를 남김)
+    if checkpoint is not None:
+        checkpoint.remove()
+    if not row_count:
+        return None
+    return output.getvalue()
+
+def run(profile, pdf_path:str, parallel:bool=False, max_workers:int=None, backend:str=DEFAULT_BACKEND, crop:bool=False,
+        page_cache=True, excel_writer:str=None, diagnostics:str="full", checkpoint=False, isolate=False) -> str:
+    """
+    Entrypoint: converts PDF to Excel and returns output path
+    Streamlit 환경에서 호출될 때는 파일 저장 대화상자를 표시하지 않고 임시 파일에 저장합니다.
+    단일 프로파일 변환은 페이지를 추출하는 대로 파싱해서 엑셀에 내려쓰므로 (excel.ExcelStream)
+    페이지 수와 상관없이 메모리 사용량이 일정합니다 (excel_writer='openpyxl'을 지정하면 끝까지 모았다가 씀).
+
+    Args:
+        profile (str | dict | list): 변환 프로파일 ('CC_ID', 'CC_Seq', 'IM_ID', 'IM_Seq')
+            'mixed'이면 페이지마다 장비/모드를 판단해서 프로파일별 시트로 나눔 (crop 사용 안 함)
+            프로파일 리스트이면 텍스트를 한 번만 추출해서 프로파일마다 파싱하고 프로파일별 시트로 작성
+            (예: profiles.mode_profiles('CC') - Barcode/Sequence 시트를 함께 생성)
+        pdf_path (str): PDF 파일 경로
+        parallel (bool): True이면 여러 프로세스로 페이지 텍스트를 병렬 추출
+        max_workers (int): 병렬 추출 시 최대 워커 프로세스 수 (None이면 CPU 코어 수)
+        backend (str): 텍스트 추출 백엔드 ('pdfplumber', 'pdfium', 'mupdf')
+        crop (bool): True이면 헤더 줄과 결과 블록 영역만 잘라서 추출 (검증 실패 페이지는 전체 추출)
+        page_cache (bool | PageTextCache): 페이지 텍스트 캐시 (True: 기본 캐시, False: 사용 안 함)
+        excel_writer (str): 엑셀 출력 백엔드 ('openpyxl', 'xlsxwriter', None이면 입력 크기에 따라 자동 선택)
+        diagnostics (str): 진단 정보 수준 ('none', 'summary', 'full')
+            전체 진단 정보를 엑셀과 따로 받으려면 'summary'로 변환한 뒤 필요할 때 write_diagnostics() 사용
+        checkpoint (bool | str): 긴 변환의 체크포인트 (True: 기본 디렉터리, 문자열: 체크포인트 디렉터리, False: 사용 안 함)
+            중단된 뒤 같은 PDF를 같은 설정으로 다시 변환하면 마지막으로 기록된 페이지 다음부터 이어서 처리
+            (단일 프로파일 변환만 지원, 'mixed'와 프로파일 리스트는 무시)
+        isolate (bool | PageLimits): True이면 페이지마다 시간/메모리 제한이 있는 격리된 워커 프로세스에서 추출
+            (제한을 넘은 페이지는 더 단순한 백엔드로 다시 추출하고 '터미널 로그' 시트에 기록, isolation 모듈 참고)
+
+    Returns:
+        str: 생성된 Excel 파일 경로
+    """
+    combined = is_combined(profile)
+    if not combined:
+        profile = get_profile(profile)
+    check_diagnostics(diagnostics)
+
+    # Streamlit 환경에서 실행 중인지 확인
+    is_streamlit = 'streamlit' in sys.modules
+
+    # 입력 파일 체크
+    if not os.path.exists(pdf_path):
+        print(f"오류: 파일을 찾을 수 없습니다: {pdf_path}")
+        return None
+
+    stream_path = None
+    try:
+        pdf_filename = os.path.basename(pdf_path)
+        if combined:
+            extracted, terminal_logs, pdf_lines, _ = _prepare_combined_sheets(profile, pdf_path, pdf_filename,
+                                                                              parallel, max_workers, backend, crop,
+                                                                              page_cache, diagnostics, isolate)
+            if not extracted:
+                return None
+        else:
+            # 단일 프로파일은 페이지를 받는 대로 임시 엑셀 파일에 쓰고, 데이터가 있으면 저장 위치로 옮김
+            region = profile['analyzer'] if crop else None
+            checkpoint = open_checkpoint(checkpoint, pdf_path, profile, backend, region)
+            fd, stream_path = tempfile.mkstemp(suffix=".xlsx")
+            os.close(fd)
+            failures = []
+            pages = _stream_pages(profile, pdf_path, checkpoint, parallel, max_workers, backend, region,
+                                  resolve_page_cache(page_cache), isolate, failures)
+            _, row_count = _write_stream(profile, pages, pdf_filename, stream_path, excel_writer, diagnostics,
+                                         failures)
+            # 변환이 끝까지 진행되었으면 데이터가 없어도 체크포인트 삭제 (중단된 변환만 체크포인트를 남김)
+            if checkpoint is not None:
+                checkpoint.remove()
+            if not row_count:
+                return None
+
+        # Streamlit 환경에서는 임시 파일에 저장
+        if is_streamlit:
+            base_name = os.path.splitext(pdf_filename)[0]
+            # 임시 파일 생성
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
+                output_path = tmp.name
+
+            # 파일 이름을 PDF 파일명과 동일하게 설정 (확장자만 .xlsx로 변경)
+            new_output_path = os.path.join(os.path.dirname(output_path), f"{base_name}.xlsx")
+            if os.path.exists(new_output_path):
+                try:
+                    os.remove(new_output_path)  # 기존 파일이 있으면 삭제
+                except:
+                    pass
+            try:
+                os.rename(output_path, new_output_path)
+                output_path = new_output_path
+            except:
+                # 이름 변경 실패 시 원래 임시 파일 경로 사용
+                pass
+        else:
+            # 일반 환경에서는 사용자에게 저장 위치 선택 요청
+            output_path = select_save_location(pdf_filename)
+            if not output_path:
+                return None
+
+        # 엑셀 생성 (진단 정보 수준에 따라 PDF 줄별 데이터/로그 포함, 혼합 보고서/프로파일 리스트는 프로파일별 시트)
+        if combined:
+            create_combined_excel_file(extracted, output_path, excel_writer, terminal_logs, pdf_lines)
+        else:
+            shutil.move(stream_path, output_path)
+            print(f"엑셀 파일이 저장되었습니다: {output_path}")
+        return output_path
+
+    except Exception as e:
+        print(f"PDF 처리 중 오류 발생: {e}")
+        return None
+    finally:
+        # 옮기지 않은 임시 엑셀 파일 정리 (데이터가 없거나 저장이 취소/실패한 경우)
+        if stream_path is not None and os.path.exists(stream_path):
+            os.remove(stream_path)
+
+def process_pdf_to_excel(profile, pdf_path, progress_window=None, backend=DEFAULT_BACKEND, page_cache=True,
+                         excel_writer=None, diagnostics="full"):
+    """
+    PDF 파일을 읽어서 엑셀로 변환하는 메인 처리 함수 (데스크톱 GUI용)
+
+    Args:
+        profile (str | dict): 변환 프로파일 ('CC_ID', 'CC_Seq', 'IM_ID', 'IM_Seq')
+        pdf_path (str): PDF 파일 경로
+        progress_window (ProgressWindow): 프로그래스바 객체
+        backend (str): 텍스트 추출 백엔드 ('pdfplumber', 'pdfium', 'mupdf')
+        page_cache (bool | PageTextCache): 페이지 텍스트 캐시 (True: 기본 캐시, False: 사용 안 함)
+        excel_writer (str): 엑셀 출력 백엔드 ('openpyxl', 'xlsxwriter', None이면 입력 크기에 따라 자동 선택)
+        diagnostics (str): 진단 정보 수준 ('none', 'summary', 'full')
+    """
+    profile = get_profile(profile)
+    check_diagnostics(diagnostics)
+    key_label = profile['key_label']
+    key_field = profile['key_field']
+
+    # 터미널 로그 수집용 리스트
+    terminal_logs = []
+    # PDF 줄별 데이터 수집용 리스트
+    pdf_lines = []
+    # 텍스트가 없는 페이지 번호 (summary 진단 정보용)
+    empty_pages = []
+
+    def log_and_print(message):
+        """터미널에 출력하면서 동시에 로그에 저장하는 함수"""
+        print(message)
+        terminal_logs.append(message)
+
+    if not os.path.exists(pdf_path):
+        log_and_print(f"오류: '{pdf_path}' 파일을 찾을 수 없습니다.")
+        if progress_window:
+            progress_window.close()
+        return
+
+    try:
+        if progress_window:
+            progress_window.update_progress(5, "Opening PDF file...")
+
+        # 캐시된 페이지는 PDF에서 다시 추출하지 않음
+        with PageReader(pdf_path, backend, cache=resolve_page_cache(page_cache)) as pdf:
+            total_pages = len(pdf)
+            if total_pages == 0:
+                log_and_print("PDF에 페이지가 없습니다.")
+                if progress_window:
+                    progress_window.close()
+                return
+
+            if progress_window:
+                progress_window.update_progress(10, f"Analyzing PDF pages... (Total {total_pages} pages)")
+
+            log_and_print(f"PDF 총 페이지 수: {total_pages}")
+            all_extracted_data = []
+
+            # 첫 번째 페이지 처리
+            lines = pdf.page_lines(0)
+
+            if not any(lines):
+                log_and_print("첫 번째 페이지에서 텍스트를 추출할 수 없습니다.")
+                if progress_window:
+                    progress_window.close()
+                return
+
+            # PDF 줄별 데이터 수집 (첫 번째 페이지)
+            pdf_lines.append({'page': 1, 'lines': terminal_lines(lines, profile)})
+
+            if progress_window:
+                progress_window.update_progress(20, "Extracting data from first page...")
+
+            # 디버깅용: 줄 번호와 내용 출력
+            log_and_print("=" * 50)
+            log_and_print("첫 번째 페이지 내용:")
+            log_and_print("=" * 50)
+            for i, line in enumerate(lines, 1):
+                if line.strip():
+                    log_and_print(f"줄 {i:3d}: {line}")
+            log_and_print("=" * 50)
+
+            # 첫 번째 페이지 데이터 추출
+            key, date, first_page_data, counter = parse_page(lines, profile, True)
+            all_extracted_data.extend(first_page_data)
+
+            if progress_window:
+                progress_window.update_progress(30, f"First page completed ({len(first_page_data)} data items)")
+
+            log_and_print(f"\n첫 번째 페이지에서 추출된 데이터: {len(first_page_data)}개")
+
+            # 두 번째 페이지부터 처리
+            for page_num in range(1, total_pages):
+                # 진행률 계산 (30%부터 60%까지)
+                if progress_window and total_pages > 1:
+                    progress = 30 + int((page_num / (total_pages - 1)) * 30)
+                    progress_window.update_progress(progress, f"Processing page {page_num + 1}/{total_pages}...")
+
+                lines = pdf.page_lines(page_num)
+
+                if not any(lines):
+                    log_and_print(f"페이지 {page_num + 1}에서 텍스트를 추출할 수 없습니다.")
+                    empty_pages.append(page_num + 1)
+                    continue
+
+                # PDF 줄별 데이터 수집 (다른 페이지들)
+                pdf_lines.append({'page': page_num + 1, 'lines': terminal_lines(lines, profile)})
+
+                # 디버깅용: 줄 번호와 내용 출력
+                log_and_print(f"\n[ 페이지 {page_num + 1} ]")
+                log_and_print("-" * 30)
+                for i, line in enumerate(lines, 1):
+                    if line.strip():
+                        log_and_print(f"줄 {i:3d}: {line}")
+
+                # 두 번째 페이지부터의 데이터 추출 (Sequence 모드는 카운터가 이어짐)
+                page_key, page_date, page_data, counter = parse_page(lines, profile, False, counter)
+                all_extracted_data.extend(page_data)
+
+                log_and_print(f"페이지 {page_num + 1}에서 추출된 데이터: {len(page_data)}개")
+                log_and_print(f"  - {key_label}: {page_key}, Date: {page_date}")
+
+            if not all_extracted_data:
+                log_and_print("추출할 데이터가 없습니다.")
+                if progress_window:
+                    progress_window.close()
+                return
+
+            if progress_window:
+                progress_window.update_progress(60, "Organizing data...")
+
+            log_and_print(f"\n전체 추출된 데이터:")
+            log_and_print(f"{key_label}: {key}")
+            log_and_print(f"Date: {date}")
+            log_and_print(f"총 데이터 개수: {len(all_extracted_data)}")
+
+            # 데이터 출력 (디버깅용)
+            for i, data in enumerate(all_extracted_data, 1):
+                log_and_print(f"  {i:2d}. {key_label}: {data.get(key_field, '')}, Test Name: {data.get('test_name', '')}, Result: {data.get('result', '')}, Unit: {data.get('unit', '')}, AU: {data.get('au', '')}")
+
+            if progress_window:
+                progress_window.update_progress(70, "Selecting output location...")
+
+            # 저장 위치 선택
+            pdf_filename = os.path.basename(pdf_path)
+            output_path = select_save_location(pdf_filename)
+
+            if not output_path:
+                log_and_print("저장이 취소되었습니다.")
+                if progress_window:
+                    progress_window.close()
+                return
+
+            if progress_window:
+                progress_window.update_progress(80, "Creating Excel file...")
+
+            # 엑셀 파일 생성 (진단 정보 수준에 따라 PDF 줄별 데이터/로그 포함)
+            if diagnostics == "full":
+                create_excel_file(profile, pdf_filename, all_extracted_data, output_path, terminal_logs, pdf_lines,
+                                  writer=excel_writer)
+            else:
+                logs = None
+                if diagnostics == "summary":
+                    logs = summary_logs(pdf_filename, total_pages, empty_pages, all_extracted_data)
+                create_excel_file(profile, pdf_filename, all_extracted_data, output_path, logs, None,
+                                  writer=excel_writer)
+
+            if profile['open_after_save']:
+                if progress_window:
+                    progress_window.update_progress(95, "Opening Excel file...")
+
+                # 엑셀 파일 자동 실행
+                log_and_print("\n엑셀 파일을 열고 있습니다...")
+                open_excel_file(output_path)
+
+            if progress_window:
+                progress_window.update_progress(100, "Completed!")
+                time.sleep(1)  # 1초 대기 후 창 닫기
+
+            log_and_print(f"\n변환 완료!")
+            log_and_print(f"출력 파일: {output_path}")
+
+    except Exception as e:
+        log_and_print(f"PDF 처리 중 오류 발생: {e}")
+        import traceback
+        log_and_print(f"상세 오류: {traceback.format_exc()}")
+    finally:
+        if progress_window:
+            progress_window.close()
+
+def build_diagnostics(profile, pdf_path, backend=DEFAULT_BACKEND, crop=False, page_cache=True, pdf_filename=None):
+    """
+    전체 진단 정보(페이지별 줄 내용과 추출 행 수)를 gzip 압축 JSONL로 만드는 함수
+    변환할 때 만들지 않고 필요할 때만 호출합니다 (페이지 텍스트 캐시가 있으면 PDF를 다시 읽지 않음).
+    첫 줄은 요약 {"pdf", "profile", "parser_version", "pages", "rows"},
+    이후 줄은 페이지별 {"page", "rows", "lines"} 입니다 (혼합 보고서는 페이지별 "profile" 추가,
+    프로파일 리스트이면 "rows"가 {프로파일: 행 수}).
+
+    Args:
+        profile (str | dict | list): 변환 프로파일 (혼합 보고서는 'mixed', 프로파일 리스트 가능)
+        pdf_path (str | bytes | BinaryIO): PDF 파일 경로, PDF 내용 또는 파일 객체
+        backend (str): 텍스트 추출 백엔드
+        crop (bool): 변환 시 사용한 영역 잘라내기 여부
+        page_cache (bool | PageTextCache): 페이지 텍스트 캐시
+        pdf_filename (str): 요약에 기록할 PDF 파일명 (None이면 경로 또는 파일 객체의 name)
+
+    Returns:
+        bytes: gzip 압축된 JSONL 데이터
+    """
+    mixed = profile == MIXED_PROFILE
+    multi = isinstance(profile, (list, tuple))
+    if mixed:
+        profiles = []
+    else:
+        profiles = [get_profile(item) for item in profile] if multi else [get_profile(profile)]
+    region = None
+    if crop and profiles and len({item['analyzer'] for item in profiles}) == 1:
+        region = profiles[0]['analyzer']
+    page_lines = extract_page_lines(pdf_path, backend=backend, region=region, cache=resolve_page_cache(page_cache))
+
+    if mixed:
+        routes = route_pages(page_lines)
+        records = [{'page': index + 1, 'profile': page_profile['name'] if page_profile else None, 'rows': len(rows),
+                    'lines': terminal_lines(page_lines[index], page_profile)}
+                   for index, page_profile, rows in _parse_routed(page_lines, routes)]
+        total_rows = sum(record['rows'] for record in records)
+    else:
+        # 프로파일별 페이지 행 수 (프로파일 리스트이면 페이지별 {프로파일: 행 수})
+        counts = {}
+        for item in profiles:
+            routes = [(item, index == 0) for index in range(len(page_lines))]
+            counts[item['name']] = [len(rows) for _, _, rows in _parse_routed(page_lines, routes)]
+        records = [{'page': index + 1,
+                    'rows': {name: page_counts[index] for name, page_counts in counts.items()} if multi
+                    else counts[profiles[0]['name']][index],
+                    'lines': terminal_lines(lines, profiles[0])}
+                   for index, lines in enumerate(page_lines)]
+        total_rows = {name: sum(page_counts) for name, page_counts in counts.items()}
+        if not multi:
+            total_rows = total_rows[profiles[0]['name']]
+
+    records.insert(0, {
+        'pdf': pdf_filename or source_name(pdf_path),
+        'profile': MIXED_PROFILE if mixed else [item['name'] for item in profiles] if multi else profiles[0]['name'],
+        'parser_version': PARSER_VERSION,
+        'pages': len(page_lines),
+        'rows': total_rows,
+    })
+    text = "\n".join(json.dumps(record, ensure_ascii=False) for record in records)
+    return gzip.compress(text.encode('utf-8'))
+
+def diagnostics_path(output_path):
+    """엑셀 출력 파일 옆에 둘 진단 정보 파일 경로 (예: report.xlsx -> report.diagnostics.jsonl.gz)"""
+    return os.path.splitext(output_path)[0] + ".diagnostics.jsonl.gz"
+
+def write_diagnostics(profile, pdf_path, sidecar_path, **options):
+    """
+    전체 진단 정보를 압축 파일로 저장하는 함수 (옵션은 build_diagnostics 참고)
+
+    Returns:
+        str: 저장된 파일 경로
+    """
+    data = build_diagnostics(profile, pdf_path, **options)
+    with open(sidecar_path, 'wb') as f:
+        f.write(data)
+    return sidecar_path
+
+def main(profile):
+    """
+    메인 함수: GUI로 PDF 파일을 선택받아 엑셀로 변환합니다.
+
+    Args:
+        profile (str | dict): 변환 프로파일 ('CC_ID', 'CC_Seq', 'IM_ID', 'IM_Seq')
+    """
+
+    if len(sys.argv) > 1:
+        # 명령행 인수로 파일 경로가 제공된 경우
+        pdf_path = sys.argv[1]
+        print(f"명령행에서 제공된 파일: {pdf_path}")
+    else:
+        # GUI로 파일 선택
+        print("PDF 파일 선택 창을 열고 있습니다...")
+        pdf_path = select_pdf_file()
+
+        if not pdf_path:
+            print("파일 선택이 취소되었습니다.")
+            return
+
+        print(f"선택된 파일: {pdf_path}")
+
+    # 프로그래스바 생성 및 표시
+    progress_window = ProgressWindow()
+    progress_window.show()
+
+    # PDF를 엑셀로 변환
+    process_pdf_to_excel(profile, pdf_path, progress_window)
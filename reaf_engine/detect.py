@@ -0,0 +1,115 @@
+"""
+보고서 종류(장비/모드) 자동 감지
+
+첫 페이지의 위쪽 영역(헤더 줄과 결과 블록 앞부분)만 추출해서 변환 프로파일을 고릅니다.
+전체 변환을 시작하기 전에 호출하므로 페이지 하나의 일부만 읽습니다.
+- 모드: 헤더 줄이 어느 모드의 샘플 줄 형식(profiles.MODE_HEADER_PATTERNS)으로 시작하는지로 판단
+  ("Ser/PI 000123 ... Patient ID : 42 ..."처럼 줄 중간에 "ID :"가 있어도 Sequence 모드)
+- 장비: 결과 줄 다음의 단위 줄이 CC 단위(mg/dL 등)인지 IM 단위(COI 등)인지로 판단
+"""
+from .parsers import DATE_PATTERN
+from .pdf_pages import open_document, read_source
+from .profiles import CC_UNITS, PROFILES, find_profile, header_mode
+
+# cobas pro e (IM) 결과의 단위 줄 첫 단어
+IM_UNITS = ['COI', 'ng/mL', 'pg/mL', 'pmol/L', 'nmol/L', 'uIU/mL', 'µIU/mL', 'mIU/mL', 'IU/mL', 'U/mL', 'IU/L']
+
+# 감지에 사용하는 첫 페이지 영역 (페이지 크기 대비 비율 x0, top, x1, bottom)
+# 헤더 줄(8번째 줄)과 결과 블록 앞부분이 들어가는 위쪽 42%
+DETECT_BBOX = (0.0, 0.0, 1.0, 0.42)
+
+# 감지용 텍스트 추출 백엔드 (가장 빠른 pdfium 사용, 감지 결과만 쓰므로 변환 백엔드와 달라도 됨)
+DETECT_BACKEND = "pdfium"
+
+def find_header_line(lines):
+    """
+    첫 페이지에서 헤더 줄(모드별 샘플 줄 형식으로 시작하고 날짜가 있는 첫 줄)을 찾는 함수
+
+    Args:
+        lines (list): 첫 페이지의 줄들
+
+    Returns:
+        tuple: (줄 인덱스, 줄 문자열), 없으면 (None, None)
+    """
+    start_line = min(profile['first_page']['start_line'] for profile in PROFILES.values())
+    for index, line in enumerate(lines[:start_line]):
+        if header_mode(line) is not None and DATE_PATTERN.search(line):
+            return index, line
+    return None, None
+
+def count_units(lines, start_line, units):
+    """결과 블록에서 units 중 하나로 시작하는 줄 수"""
+    count = 0
+    for line in lines[start_line:]:
+        parts = line.split()
+        if parts and parts[0] in units:
+            count += 1
+    return count
+
+def detect_profile_from_lines(lines):
+    """
+    첫 페이지 줄들로 변환 프로파일 이름을 고르는 함수
+
+    Args:
+        lines (list): 첫 페이지의 줄들 (위쪽 일부만 있어도 됨)
+
+    Returns:
+        str: 프로파일 이름 ('CC_ID', 'CC_Seq', 'IM_ID', 'IM_Seq'), 판단할 수 없으면 None
+    """
+    header_index, header = find_header_line(lines)
+    if header is None:
+        return None
+
+    mode = header_mode(header)
+    cc_units = count_units(lines, header_index + 1, CC_UNITS)
+    im_units = count_units(lines, header_index + 1, IM_UNITS)
+    if cc_units > im_units:
+        analyzer = "CC"
+    elif im_units > cc_units:
+        analyzer = "IM"
+    elif mode == "ID" and header.lstrip().startswith("SerumPlasma"):
+        # IM Barcode 헤더: "SerumPlasma 50016-1 ID : 187 ..."
+        analyzer = "IM"
+    elif mode == "ID":
+        # CC Barcode 헤더: "Sample ID : 12345 ..."
+        analyzer = "CC"
+    else:
+        return None
+    return find_profile(analyzer, mode)
+
+def detect_profile(source, backend=DETECT_BACKEND):
+    """
+    PDF 첫 페이지의 위쪽 영역만 읽어서 변환 프로파일 이름을 고르는 함수
+    영역 안에서 판단할 수 없으면 첫 페이지 전체로 한 번 더 시도합니다.
+
+    Args:
+        source (str | bytes | BinaryIO): PDF 파일 경로, PDF 내용 또는 파일 객체
+        backend (str): 텍스트 추출 백엔드
+
+    Returns:
+        str: 프로파일 이름, 판단할 수 없으면 None
+    """
+    with open_document(read_source(source), backend) as doc:
+        if len(doc) == 0:
+            return None
+        profile = detect_profile_from_lines(doc.page_lines(0, DETECT_BBOX))
+        if profile is None:
+            profile = detect_profile_from_lines(doc.page_lines(0))
+        return profile
+
+def classify_page(lines):
+    """
+    혼합 보고서의 한 페이지가 어떤 프로파일의 어떤 페이지 형식인지 판단하는 함수
+    헤더 줄 위치가 프로파일의 첫 페이지 헤더 위치와 같으면 첫 페이지 형식(새 보고서의 시작)입니다.
+
+    Args:
+        lines (list): 페이지의 모든 줄들
+
+    Returns:
+        tuple: (프로파일 이름, 첫 페이지 형식 여부), 판단할 수 없으면 (None, None)
+    """
+    profile = detect_profile_from_lines(lines)
+    if profile is None:
+        return None, None
+    header_index, _ = find_header_line(lines)
+    return profile, header_index == PROFILES[profile]['first_page']['header_index']
@@ -0,0 +1,167 @@
+import hashlib
+import os
+import tempfile
+import time
+
+# 기본 캐시 한도
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60     # 7일 (마지막 사용 시점 기준)
+
+def make_key(*parts):
+    """
+    여러 값을 조합해서 캐시 키(SHA-256 hex)를 만드는 함수
+
+    Args:
+        *parts: 키를 구성하는 값들 (문자열로 변환되어 사용)
+
+    Returns:
+        str: 64자리 hex 문자열
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+class DiskCache:
+    """
+    크기와 기간 제한이 있는 디스크 캐시
+    항목은 파일 하나로 저장되며, 파일 수정 시각을 마지막 사용 시각으로 사용하여
+    오래된 항목(max_age 초과)과 최근에 쓰지 않은 항목(총 크기 max_bytes 초과 시)부터 삭제합니다.
+    """
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE, suffix=".bin"):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.suffix = suffix
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}{self.suffix}")
+
+    def open(self, key):
+        """
+        캐시 항목을 파일 객체로 여는 함수 (큰 항목을 한 번에 읽지 않고 나눠 읽을 때 사용, 열면 마지막 사용 시각 갱신)
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            BinaryIO: 읽기용 파일 객체, 없거나 만료되었으면 None
+        """
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                return None
+            f = open(path, 'rb')
+            os.utime(path)  # LRU: 마지막 사용 시각 갱신
+            return f
+        except OSError:
+            return None
+
+    def get(self, key):
+        """
+        캐시에서 데이터를 읽는 함수 (읽으면 마지막 사용 시각 갱신)
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            bytes: 저장된 데이터, 없거나 만료되었으면 None
+        """
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # LRU: 마지막 사용 시각 갱신
+            return data
+        except OSError:
+            return None
+
+    def put(self, key, data):
+        """
+        캐시에 데이터를 저장하는 함수 (저장 후 한도 초과분 삭제)
+
+        Args:
+            key (str): 캐시 키
+            data (bytes): 저장할 데이터
+        """
+        try:
+            tmp_path, f = self.temp_file()
+            with f:
+                f.write(data)
+        except OSError:
+            # 캐시 저장 실패는 치명적이지 않으므로 무시
+            return
+        self.put_file(key, tmp_path)
+
+    def temp_file(self):
+        """
+        항목을 조금씩 써서 만들 임시 파일을 캐시 디렉터리에 만드는 함수 (다 쓴 뒤 put_file()로 저장)
+
+        Returns:
+            tuple: (임시 파일 경로, 쓰기용 파일 객체)
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        return tmp_path, os.fdopen(fd, 'wb')
+
+    def put_file(self, key, tmp_path):
+        """
+        temp_file()로 만든 임시 파일을 캐시 항목으로 저장하는 함수 (저장 후 한도 초과분 삭제)
+        임시 파일에 쓴 후 이름을 바꾸므로 동시에 읽는 쪽이 반쯤 쓴 파일을 보지 않습니다.
+
+        Args:
+            key (str): 캐시 키
+            tmp_path (str): 다 쓴 임시 파일 경로
+        """
+        try:
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # 캐시 저장 실패는 치명적이지 않으므로 무시
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        만료된 항목을 삭제하고, 총 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+        """
+        now = time.time()
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        for name in names:
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
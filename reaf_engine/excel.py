@@ -0,0 +1,622 @@
+import os
+
+from openpyxl import Workbook
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import Font, PatternFill
+
+# XlsxWriter가 없으면 openpyxl 출력만 사용
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+from .profiles import excel_columns, get_profile
+
+# 값이 없을 때 'N'으로 채우는 컬럼
+FLAG_FIELDS = ('data_alarm', 'rerun')
+
+# 출력 백엔드 자동 선택 시 전체 시트 행 수가 이 값 이상이면 XlsxWriter 스트리밍 출력 사용
+STREAMING_MIN_ROWS = 20000
+
+# 엑셀 시트 이름 최대 길이
+SHEET_NAME_MAX = 31
+
+# 결과 시트 셀 값을 한 번에 변환하는 행 수 (XlsxWriter 출력은 이만큼씩 모아서 변환한 뒤 씀)
+RESULT_CHUNK_ROWS = 4096
+
+# Result 값이 이 개수 이상이면 pandas/NumPy로 한 번에 변환 (적으면 값마다 변환하는 쪽이 빠름)
+VECTORIZE_MIN_VALUES = 256
+
+# 정수로 변환할 수 있는 최대 크기 (이 이상은 float 정밀도 밖이므로 format_result로 하나씩 변환)
+EXACT_INT_LIMIT = 2 ** 53
+
+# 결과 시트 강조 표시 (셀마다 서식을 넣지 않고 데이터 범위 전체에 조건부 서식 규칙으로 적용)
+# (적용 열, 수식(2행 기준), 서식 이름) - C열: Result, G열: Data Alarm, H열: Rerun
+HIGHLIGHT_RULES = [
+    # Data Alarm이 Y이면 Data Alarm 빨간색 굵게
+    ('G', '$G2="Y"', 'alarm'),
+    # Data Alarm이 Y이고 Rerun이 아니면 Result 빨간색 굵게
+    ('C', 'AND($G2="Y",$H2<>"Y")', 'alarm'),
+    # Rerun이 Y이면 Result 연한 노란색 배경
+    ('C', '$H2="Y"', 'rerun'),
+]
+
+def format_result(result):
+    """
+    Result 값을 숫자로 변환하는 함수 (유효숫자에 맞게 반올림)
+
+    Args:
+        result (str): 추출된 Result 문자열
+
+    Returns:
+        int | float | str: 변환된 숫자, 변환 실패시 원본 문자열, 빈 값이면 ""
+    """
+    try:
+        result_str = str(result) if result is not None else ''
+        if not result_str.strip():
+            return ""
+        result_value = float(result_str)
+        if result_value == int(result_value):
+            # 정수인 경우 소수점 없이
+            return int(result_value)
+        if result_value >= 1:
+            # 1 이상인 경우 소수점 2자리까지
+            return round(result_value, 2)
+        if result_value >= 0.1:
+            # 0.1 이상인 경우 소수점 3자리까지
+            return round(result_value, 3)
+        # 0.1 미만인 경우 소수점 4자리까지
+        return round(result_value, 4)
+    except (ValueError, TypeError, AttributeError, OverflowError):
+        return str(result) if result is not None else ''
+
+def format_results(results):
+    """
+    Result 값들을 format_result와 같은 규칙으로 한 번에 변환하는 함수
+    값이 많으면 숫자 변환, 정수 판정, 크기별 반올림을 pandas/NumPy 배열 연산으로 처리하고,
+    숫자로 바로 읽지 못한 값(문자 등)과 반올림 경계(x.5)에 걸친 값만 format_result로 하나씩 변환합니다.
+
+    Args:
+        results (list): 추출된 Result 문자열 리스트
+
+    Returns:
+        list: 변환된 셀 값 리스트 (int | float | str)
+    """
+    if len(results) < VECTORIZE_MIN_VALUES:
+        return [format_result(result) for result in results]
+    # pandas가 없으면 값마다 변환
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        return [format_result(result) for result in results]
+
+    # pandas가 읽지 못한 값은 NaN이 되어 아래에서 format_result로 변환
+    values = pd.to_numeric(np.array(results, dtype=object), errors='coerce').astype(float)
+    with np.errstate(invalid='ignore'):
+        exact = np.abs(values) < EXACT_INT_LIMIT
+        whole = exact & (np.floor(values) == values)
+        # 1 이상은 소수점 2자리, 0.1 이상은 3자리, 0.1 미만은 4자리
+        scale = np.where(values >= 1, 100.0, np.where(values >= 0.1, 1000.0, 10000.0))
+        scaled = values * scale
+        # 곱셈 오차로 x.5 경계에 걸친 값은 내장 round()와 결과가 다를 수 있으므로 제외
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= np.abs(scaled) * 1e-15
+    rounded = exact & ~whole & ~near_half
+
+    cells = np.empty(len(values), dtype=object)
+    cells[whole] = values[whole].astype(np.int64).tolist()
+    cells[rounded] = (np.rint(scaled[rounded]) / scale[rounded]).tolist()
+    cells = cells.tolist()
+    for index in np.flatnonzero(~(whole | rounded)).tolist():
+        cells[index] = format_result(results[index])
+    return cells
+
+class ColumnBuffer:
+    """
+    결과 시트 행을 컬럼별 값 리스트로 모아 두는 버퍼
+    행을 받을 때는 컬럼별 리스트에 값만 덧붙이고, 셀 값으로 바꿀 때 Result 컬럼 전체를 format_results로 한 번에 변환합니다.
+
+    Args:
+        columns (list): 결과 시트 컬럼 목록 [(행 필드 이름, 헤더명), ...]
+    """
+    def __init__(self, columns):
+        self.fields = [field for field, _ in columns]
+        self.values = [[] for _ in self.fields]
+
+    def __len__(self):
+        return len(self.values[0]) if self.values else 0
+
+    def extend(self, rows):
+        """행(Row) 리스트의 값을 컬럼별 리스트에 추가"""
+        for field, values in zip(self.fields, self.values):
+            values.extend([row.get(field) for row in rows])
+
+    def cell_rows(self):
+        """
+        모아 둔 행들의 엑셀 셀 값 (None/빈 값은 빈 문자열, 플래그 컬럼은 'N', Result는 숫자 변환)
+
+        Returns:
+            iterator: 행별 셀 값 튜플
+        """
+        cells = []
+        for field, values in zip(self.fields, self.values):
+            if field == 'result':
+                cells.append(format_results(values))
+            else:
+                empty = 'N' if field in FLAG_FIELDS else ''
+                cells.append([str(value) if value else empty for value in values])
+        return zip(*cells)
+
+    def clear(self):
+        """모아 둔 행 비우기"""
+        for values in self.values:
+            values.clear()
+
+def safe_text(text):
+    """셀에 쓸 수 있도록 문자열 정리 (32000자 제한, 특수문자 제거)"""
+    safe = str(text)[:32000] if text else ""
+    return safe.replace('\x00', '').replace('\r', '').strip()
+
+def total_rows(extracted_data, terminal_logs=None, pdf_lines=None):
+    """
+    모든 시트에 쓰게 될 행 수 (출력 백엔드 자동 선택에 사용)
+    """
+    rows = len(extracted_data) + len(terminal_logs or [])
+    for page_data in pdf_lines or []:
+        rows += len(page_data.get('lines', []))
+    return rows
+
+def choose_writer(extracted_data, terminal_logs=None, pdf_lines=None):
+    """
+    입력 크기에 맞는 출력 백엔드 선택 (큰 입력은 XlsxWriter 스트리밍 출력)
+
+    Returns:
+        str: 'xlsxwriter' 또는 'openpyxl'
+    """
+    if XLSXWRITER_AVAILABLE and total_rows(extracted_data, terminal_logs, pdf_lines) >= STREAMING_MIN_ROWS:
+        return "xlsxwriter"
+    return "openpyxl"
+
+def _check_writer(writer, extracted_data, terminal_logs=None, pdf_lines=None):
+    """출력 백엔드 이름 확인 (None이면 입력 크기에 따라 자동 선택)"""
+    if writer is None:
+        writer = choose_writer(extracted_data, terminal_logs, pdf_lines)
+    if writer not in EXCEL_WRITERS:
+        raise ValueError(f"알 수 없는 엑셀 출력 백엔드입니다: {writer} (사용 가능: {', '.join(EXCEL_WRITERS)})")
+    if writer == "xlsxwriter" and not XLSXWRITER_AVAILABLE:
+        raise ValueError("xlsxwriter 출력을 사용하려면 XlsxWriter 패키지가 필요합니다.")
+    return writer
+
+def create_excel_file(profile, pdf_filename, extracted_data, output_path, terminal_logs=None, pdf_lines=None,
+                      writer=None):
+    """
+    추출된 데이터로 엑셀 파일을 생성하는 함수
+
+    Args:
+        profile (str | dict): 변환 프로파일 (결과 시트 컬럼 구성에 사용)
+        pdf_filename (str): PDF 파일명 (시트명으로 사용)
+        extracted_data (list): 추출된 데이터 리스트
+        output_path (str | BinaryIO): 출력 엑셀 파일 경로 또는 파일 객체 (BytesIO 등)
+        terminal_logs (list): 터미널 로그 리스트
+        pdf_lines (list): PDF의 모든 줄 데이터 리스트
+        writer (str): 출력 백엔드 ('openpyxl', 'xlsxwriter', None이면 입력 크기에 따라 자동 선택)
+    """
+    writer = _check_writer(writer, extracted_data, terminal_logs, pdf_lines)
+
+    # 시트명은 PDF 파일명에서 확장자 제거
+    sheets = [(os.path.splitext(pdf_filename)[0], excel_columns(get_profile(profile)), extracted_data)]
+    EXCEL_WRITERS[writer](sheets, output_path, terminal_logs, pdf_lines)
+    if isinstance(output_path, str):
+        print(f"엑셀 파일이 저장되었습니다: {output_path}")
+
+class ExcelStream:
+    """
+    페이지 순서대로 받은 행과 PDF 줄로 create_excel_file과 같은 엑셀 파일을 쓰는 객체 (긴 보고서의 스트리밍 변환용)
+    출력 백엔드를 자동 선택하면 시트 행 수가 STREAMING_MIN_ROWS에 이를 때까지는 모아 두었다가
+    create_excel_file처럼 작성하고, 그 이상이 되면 XlsxWriter constant_memory 출력을 열어서 모아 둔 행부터
+    받는 즉시 디스크로 내려씁니다 (전체 행 수로 출력 백엔드를 고르는 것과 같은 결과).
+    'xlsxwriter'를 지정하면 처음부터 내려쓰고, 'openpyxl'을 지정하면 끝까지 모았다가 씁니다.
+    close()하지 않으면 (추출된 데이터가 없을 때 등) 파일을 만들지 않습니다.
+
+    Args:
+        profile (str | dict): 변환 프로파일 (결과 시트 컬럼 구성에 사용)
+        pdf_filename (str): PDF 파일명 (시트명으로 사용)
+        output_path (str | BinaryIO): 출력 엑셀 파일 경로 또는 파일 객체
+        writer (str): 출력 백엔드 ('openpyxl', 'xlsxwriter', None이면 시트 행 수에 따라 자동 선택)
+        terminal_sheet (bool): '터미널 시트'(PDF 줄별 내용) 작성 여부
+    """
+    def __init__(self, profile, pdf_filename, output_path, writer=None, terminal_sheet=False):
+        if writer is not None:
+            writer = _check_writer(writer, [])
+        self.writer = writer
+        self.sheet_name = os.path.splitext(pdf_filename)[0]
+        self.columns = excel_columns(get_profile(profile))
+        self.output_path = output_path
+        self.row_count = 0
+        # 내려쓰기 전까지 모아 둔 행과 PDF 줄 (터미널 시트를 쓰지 않으면 pdf_lines는 None)
+        self.rows = []
+        self.pdf_lines = [] if terminal_sheet else None
+        self._buffered = 0
+        self._wb = None
+        if writer == "xlsxwriter":
+            self._start_streaming()
+
+    def _start_streaming(self):
+        """XlsxWriter constant_memory 출력을 열고 모아 둔 행과 줄을 내려씀"""
+        # 파일 객체 출력도 in_memory 모드를 쓰지 않아야 constant_memory가 유지됨 (시트 내용은 임시 파일에 씀)
+        self._wb = xlsxwriter.Workbook(self.output_path, {'constant_memory': True})
+        self._formats = _xlsxwriter_formats(self._wb)
+        self._ws = self._wb.add_worksheet(self.sheet_name[:SHEET_NAME_MAX])
+        for col, (_, header) in enumerate(self.columns):
+            self._ws.write_string(0, col, header, self._formats['bold'])
+        self._row_idx = 1
+        self._pending = ColumnBuffer(self.columns)
+        self._terminal_ws = None
+        self._line_idx = 1
+        if self.pdf_lines is not None:
+            self._terminal_ws = _add_terminal_sheet_xlsxwriter(self._wb, self._formats['bold'])
+
+        rows, self.rows = self.rows, []
+        self._write_rows(rows)
+        pdf_lines, self.pdf_lines = self.pdf_lines, None
+        for page_data in pdf_lines or []:
+            self._write_lines(page_data['page'], page_data['lines'])
+
+    def _write_rows(self, rows):
+        # 페이지별 행은 RESULT_CHUNK_ROWS개가 모일 때까지 컬럼 버퍼에 두었다가 한 번에 변환해서 씀
+        self._pending.extend(rows)
+        if len(self._pending) >= RESULT_CHUNK_ROWS:
+            self._flush_rows()
+
+    def _flush_rows(self):
+        self._row_idx = _write_cells_xlsxwriter(self._ws, self._pending, self._row_idx)
+
+    def _write_lines(self, page_num, lines):
+        if self._terminal_ws is not None:
+            self._line_idx = _write_page_lines_xlsxwriter(self._terminal_ws, self._line_idx, page_num, lines)
+
+    def add_page(self, page_num, rows, lines=None):
+        """
+        페이지 하나의 행과 터미널 시트 줄 추가 (페이지 순서대로 호출)
+
+        Args:
+            page_num (int): 페이지 번호 (1부터)
+            rows (list): 페이지에서 추출한 행(Row) 리스트
+            lines (list): 터미널 시트에 쓸 줄 리스트 (터미널 시트를 쓰지 않으면 무시)
+        """
+        self.row_count += len(rows)
+        if self._wb is not None:
+            self._write_rows(rows)
+            self._write_lines(page_num, lines or [])
+            return
+
+        self.rows.extend(rows)
+        self._buffered += len(rows)
+        if self.pdf_lines is not None:
+            self.pdf_lines.append({'page': page_num, 'lines': lines or []})
+            self._buffered += len(lines or [])
+        if self.writer is None and XLSXWRITER_AVAILABLE and self._buffered >= STREAMING_MIN_ROWS:
+            self._start_streaming()
+
+    def close(self, terminal_logs=None):
+        """
+        엑셀 파일 완성 (내려쓰기 전이면 모아 둔 행으로 create_excel_file과 같은 방식으로 작성)
+
+        Args:
+            terminal_logs (list): 터미널 로그 리스트
+        """
+        if self._wb is None:
+            writer = self.writer or choose_writer(self.rows, terminal_logs, self.pdf_lines)
+            EXCEL_WRITERS[writer]([(self.sheet_name, self.columns, self.rows)], self.output_path, terminal_logs,
+                                  self.pdf_lines)
+            return
+        try:
+            self._flush_rows()
+            _format_results_xlsxwriter(self._ws, self._formats, self.columns, self.row_count)
+            if terminal_logs:
+                _write_terminal_logs_xlsxwriter(self._wb, self._formats['bold'], terminal_logs)
+        finally:
+            self._wb.close()
+
+# 통합 워크북(일괄 변환, 혼합 보고서)의 '변환 요약' 시트 컬럼
+SUMMARY_COLUMNS = [
+    ('name', '파일'),
+    ('profile', '프로파일'),
+    ('status', '상태'),
+    ('pages', '페이지 수'),
+    ('row_count', '데이터 개수'),
+    ('error', '오류'),
+]
+
+# 엑셀 시트명에 쓸 수 없는 문자
+SHEET_NAME_INVALID = '[]:*?/\\'
+
+def unique_sheet_name(name, used):
+    """
+    엑셀 규칙에 맞고 기존 시트명과 겹치지 않는 시트명 만들기 (금지 문자 제거, 31자 제한, 중복 시 ' (2)' 등 추가)
+
+    Args:
+        name (str): 원하는 시트명
+        used (set): 이미 사용한 시트명 (소문자, 이 함수가 새 이름을 추가함)
+
+    Returns:
+        str: 시트명
+    """
+    base = "".join(ch for ch in name if ch not in SHEET_NAME_INVALID).strip("' ") or "Sheet"
+    candidate = base[:SHEET_NAME_MAX]
+    number = 2
+    while candidate.lower() in used:
+        suffix = f" ({number})"
+        candidate = base[:SHEET_NAME_MAX - len(suffix)] + suffix
+        number += 1
+    used.add(candidate.lower())
+    return candidate
+
+def create_combined_excel_file(results, output_path, writer=None, terminal_logs=None, pdf_lines=None):
+    """
+    여러 변환 결과를 하나의 엑셀 파일로 작성하는 함수 (일괄 변환, 혼합 보고서용)
+    첫 시트 '변환 요약'에 결과별 상태를 쓰고, 데이터가 있는 결과마다 결과 시트를 하나씩 추가합니다.
+
+    Args:
+        results (list): 결과 dict 리스트 (name, profile, status, pages, rows, error - batch.convert_file 참고)
+            name(확장자 제외)이 시트명이 됩니다.
+        output_path (str | BinaryIO): 출력 엑셀 파일 경로 또는 파일 객체
+        writer (str): 출력 백엔드 ('openpyxl', 'xlsxwriter', None이면 전체 행 수에 따라 자동 선택)
+        terminal_logs (list): 터미널 로그 리스트
+        pdf_lines (list): PDF의 모든 줄 데이터 리스트
+    """
+    all_rows = [row for result in results for row in result.get('rows') or []]
+    writer = _check_writer(writer, all_rows, terminal_logs, pdf_lines)
+
+    summary = [dict(result, row_count=len(result.get('rows') or [])) for result in results]
+    used = {"변환 요약"}
+    sheets = []
+    for result in results:
+        if result.get('rows'):
+            sheet_name = unique_sheet_name(os.path.splitext(result['name'])[0], used)
+            sheets.append((sheet_name, excel_columns(get_profile(result['profile'])), result['rows']))
+    EXCEL_WRITERS[writer](sheets, output_path, terminal_logs, pdf_lines, summary)
+
+def _write_results_openpyxl(ws, columns, extracted_data):
+    """
+    openpyxl 시트에 결과 표 작성 (헤더, 데이터, 강조 표시 조건부 서식, 필터)
+    """
+    # 헤더 설정
+    for col, (_, header) in enumerate(columns, 1):
+        ws.cell(row=1, column=col, value=header).font = Font(bold=True)
+
+    # 데이터 입력 (Result는 일반형 서식 그대로 두어 유효숫자만 표시)
+    buffer = ColumnBuffer(columns)
+    buffer.extend(extracted_data)
+    for row_idx, cells in enumerate(buffer.cell_rows(), 2):
+        for col, value in enumerate(cells, 1):
+            ws.cell(row=row_idx, column=col, value=value)
+
+    if len(extracted_data) > 0:
+        _format_results_openpyxl(ws, columns, len(extracted_data) + 1)
+
+def _format_results_openpyxl(ws, columns, last_row):
+    """
+    openpyxl 결과 시트의 2행부터 last_row까지 강조 표시 조건부 서식과 필터 적용
+    """
+    # Data Alarm / Rerun 강조 표시 (조건부 서식)
+    styles = {
+        'alarm': {'font': Font(color="FF0000", bold=True)},
+        'rerun': {'fill': PatternFill(start_color="FFFF99", end_color="FFFF99", fill_type="solid")},
+    }
+    for column, formula, style in HIGHLIGHT_RULES:
+        ws.conditional_formatting.add(f"{column}2:{column}{last_row}",
+                                      FormulaRule(formula=[formula], **styles[style]))
+
+    # 헤더 행부터 마지막 데이터 행까지의 범위에 필터 적용
+    ws.auto_filter.ref = f"A1:{chr(64 + len(columns))}{last_row}"
+
+def _write_terminal_logs_openpyxl(wb, terminal_logs):
+    """
+    openpyxl 워크북에 '터미널 로그' 시트 추가
+    """
+    log_ws = wb.create_sheet(title="터미널 로그")
+    log_ws.cell(row=1, column=1, value="터미널 로그").font = Font(bold=True)
+
+    for row_idx, log_line in enumerate(terminal_logs, 2):
+        try:
+            log_ws.cell(row=row_idx, column=1, value=safe_text(log_line))
+        except Exception as e:
+            log_ws.cell(row=row_idx, column=1, value=f"[로그 처리 오류: {str(e)[:100]}]")
+
+    # 컬럼 너비 조정
+    log_ws.column_dimensions['A'].width = 100
+
+def _write_openpyxl(sheets, output_path, terminal_logs, pdf_lines, summary=None):
+    """
+    openpyxl 워크북 객체 모델로 엑셀 파일 작성 (작은 입력용 기본 출력)
+    sheets는 [(시트명, 컬럼, 행(Row) 리스트), ...]이고, summary가 있으면 맨 앞에 '변환 요약' 시트를 씁니다.
+    """
+    # 워크북 생성 (기본 시트는 첫 시트로 사용)
+    wb = Workbook()
+    ws = wb.active
+
+    if summary is not None:
+        ws.title = "변환 요약"
+        for col, (_, header) in enumerate(SUMMARY_COLUMNS, 1):
+            ws.cell(row=1, column=col, value=header).font = Font(bold=True)
+        for row_idx, item in enumerate(summary, 2):
+            for col, (field, _) in enumerate(SUMMARY_COLUMNS, 1):
+                value = item.get(field)
+                ws.cell(row=row_idx, column=col, value=value if value is not None else "")
+        ws.column_dimensions['A'].width = 40
+        ws.column_dimensions['F'].width = 60
+        ws = None
+
+    for sheet_name, columns, rows in sheets:
+        if ws is None:
+            ws = wb.create_sheet()
+        ws.title = sheet_name
+        _write_results_openpyxl(ws, columns, rows)
+        ws = None
+
+    # 터미널 시트 추가 (PDF 줄별 내용)
+    if pdf_lines:
+        terminal_ws = wb.create_sheet(title="터미널 시트")
+        for col, header in enumerate(["페이지", "줄 번호", "내용"], 1):
+            terminal_ws.cell(row=1, column=col, value=header).font = Font(bold=True)
+
+        row_idx = 2
+        for page_data in pdf_lines:
+            page_num = page_data.get('page', 1)
+            for line_num, line_content in enumerate(page_data.get('lines', []), 1):
+                terminal_ws.cell(row=row_idx, column=1, value=page_num)
+                terminal_ws.cell(row=row_idx, column=2, value=line_num)
+                try:
+                    terminal_ws.cell(row=row_idx, column=3, value=safe_text(line_content))
+                except Exception as e:
+                    terminal_ws.cell(row=row_idx, column=3, value=f"[줄 처리 오류: {str(e)[:100]}]")
+                row_idx += 1
+
+        # 컬럼 너비 조정
+        terminal_ws.column_dimensions['A'].width = 10  # 페이지
+        terminal_ws.column_dimensions['B'].width = 10  # 줄 번호
+        terminal_ws.column_dimensions['C'].width = 100  # 내용
+
+    # 터미널 로그 시트 추가
+    if terminal_logs:
+        _write_terminal_logs_openpyxl(wb, terminal_logs)
+
+    # 파일 저장
+    wb.save(output_path)
+
+def _write_xlsxwriter(sheets, output_path, terminal_logs, pdf_lines, summary=None):
+    """
+    XlsxWriter constant_memory 모드로 엑셀 파일 작성 (큰 입력용 스트리밍 출력)
+    sheets와 summary는 _write_openpyxl과 같습니다.
+    행을 위에서부터 순서대로 쓰면 각 행이 바로 디스크로 내려가므로 메모리 사용량이 행 수와 무관합니다.
+    강조 표시는 openpyxl 출력과 같은 조건부 서식 규칙을 사용합니다.
+    출력이 파일 객체(BytesIO 등)여도 in_memory 모드는 constant_memory를 끄므로 쓰지 않습니다
+    (시트 내용은 임시 파일에 내려쓰고, 완성된 xlsx만 파일 객체에 씀 - ExcelStream과 같음).
+    """
+    wb = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+    try:
+        formats = _xlsxwriter_formats(wb)
+        bold = formats['bold']
+
+        if summary is not None:
+            summary_ws = wb.add_worksheet("변환 요약")
+            summary_ws.set_column(0, 0, 40)
+            summary_ws.set_column(5, 5, 60)
+            for col, (_, header) in enumerate(SUMMARY_COLUMNS):
+                summary_ws.write_string(0, col, header, bold)
+            for row_idx, item in enumerate(summary, 1):
+                for col, (field, _) in enumerate(SUMMARY_COLUMNS):
+                    _write_value(summary_ws, row_idx, col, item.get(field))
+
+        for sheet_name, columns, rows in sheets:
+            # 엑셀 시트명 길이 제한
+            ws = wb.add_worksheet(sheet_name[:SHEET_NAME_MAX])
+            _write_results_xlsxwriter(ws, formats, columns, rows)
+
+        # 터미널 시트 추가 (PDF 줄별 내용)
+        if pdf_lines:
+            terminal_ws = _add_terminal_sheet_xlsxwriter(wb, bold)
+            row_idx = 1
+            for page_data in pdf_lines:
+                row_idx = _write_page_lines_xlsxwriter(terminal_ws, row_idx, page_data.get('page', 1),
+                                                       page_data.get('lines', []))
+
+        # 터미널 로그 시트 추가
+        if terminal_logs:
+            _write_terminal_logs_xlsxwriter(wb, bold, terminal_logs)
+    finally:
+        wb.close()
+
+def _add_terminal_sheet_xlsxwriter(wb, bold):
+    """XlsxWriter 워크북에 '터미널 시트'(PDF 줄별 내용)를 추가하고 헤더 작성"""
+    terminal_ws = wb.add_worksheet("터미널 시트")
+    # 컬럼 너비 조정 (페이지, 줄 번호, 내용)
+    terminal_ws.set_column(0, 1, 10)
+    terminal_ws.set_column(2, 2, 100)
+    for col, header in enumerate(["페이지", "줄 번호", "내용"]):
+        terminal_ws.write_string(0, col, header, bold)
+    return terminal_ws
+
+def _write_page_lines_xlsxwriter(terminal_ws, row_idx, page_num, lines):
+    """
+    터미널 시트의 row_idx 행부터 페이지 하나의 줄들을 쓰고 다음 행 번호를 반환
+    """
+    for line_num, line_content in enumerate(lines, 1):
+        terminal_ws.write_number(row_idx, 0, page_num)
+        terminal_ws.write_number(row_idx, 1, line_num)
+        terminal_ws.write_string(row_idx, 2, safe_text(line_content))
+        row_idx += 1
+    return row_idx
+
+def _write_terminal_logs_xlsxwriter(wb, bold, terminal_logs):
+    """XlsxWriter 워크북에 '터미널 로그' 시트 추가"""
+    log_ws = wb.add_worksheet("터미널 로그")
+    log_ws.set_column(0, 0, 100)
+    log_ws.write_string(0, 0, "터미널 로그", bold)
+    for row_idx, log_line in enumerate(terminal_logs, 1):
+        log_ws.write_string(row_idx, 0, safe_text(log_line))
+
+def _xlsxwriter_formats(wb):
+    """XlsxWriter 워크북에서 사용하는 서식 (헤더 굵게, 강조 표시)"""
+    return {
+        'bold': wb.add_format({'bold': True}),
+        'alarm': wb.add_format({'bold': True, 'font_color': '#FF0000'}),
+        'rerun': wb.add_format({'bg_color': '#FFFF99'}),
+    }
+
+def _write_results_xlsxwriter(ws, formats, columns, extracted_data):
+    """
+    XlsxWriter 시트에 결과 표 작성 (헤더, 데이터, 강조 표시 조건부 서식, 필터)
+    """
+    # 헤더 설정
+    for col, (_, header) in enumerate(columns):
+        ws.write_string(0, col, header, formats['bold'])
+
+    # 데이터 입력
+    _write_rows_xlsxwriter(ws, columns, extracted_data, 1)
+    _format_results_xlsxwriter(ws, formats, columns, len(extracted_data))
+
+def _write_rows_xlsxwriter(ws, columns, rows, row_idx):
+    """XlsxWriter 결과 시트의 row_idx 행부터 데이터 행을 RESULT_CHUNK_ROWS개씩 변환해서 쓰고 다음 행 번호를 반환"""
+    buffer = ColumnBuffer(columns)
+    for start in range(0, len(rows), RESULT_CHUNK_ROWS):
+        buffer.extend(rows[start:start + RESULT_CHUNK_ROWS])
+        row_idx = _write_cells_xlsxwriter(ws, buffer, row_idx)
+    return row_idx
+
+def _write_cells_xlsxwriter(ws, buffer, row_idx):
+    """XlsxWriter 결과 시트의 row_idx 행부터 컬럼 버퍼의 행을 쓰고 버퍼를 비운 뒤 다음 행 번호를 반환"""
+    next_idx = row_idx + len(buffer)
+    for row_idx, cells in enumerate(buffer.cell_rows(), row_idx):
+        for col, value in enumerate(cells):
+            _write_value(ws, row_idx, col, value)
+    buffer.clear()
+    return next_idx
+
+def _format_results_xlsxwriter(ws, formats, columns, row_count):
+    """
+    XlsxWriter 결과 시트의 데이터 행(row_count개) 범위에 강조 표시 조건부 서식과 필터 적용
+    """
+    if row_count > 0:
+        last_row = row_count + 1
+        # Data Alarm / Rerun 강조 표시 (조건부 서식)
+        for column, formula, style in HIGHLIGHT_RULES:
+            ws.conditional_format(f"{column}2:{column}{last_row}",
+                                  {'type': 'formula', 'criteria': f"={formula}", 'format': formats[style]})
+
+        # 헤더 행부터 마지막 데이터 행까지의 범위에 필터 적용
+        ws.autofilter(0, 0, row_count, len(columns) - 1)
+
+def _write_value(ws, row, col, value):
+    """셀 값 타입에 맞게 쓰기 (문자열은 수식으로 해석되지 않도록 항상 문자열로 기록, 빈 값은 건너뜀)"""
+    if isinstance(value, (int, float)):
+        ws.write_number(row, col, value)
+    elif value:
+        ws.write_string(row, col, value)
+
+EXCEL_WRITERS = {
+    "openpyxl": _write_openpyxl,
+    "xlsxwriter": _write_xlsxwriter,
+}
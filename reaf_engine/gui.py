@@ -0,0 +1,264 @@
+import json
+import os
+import platform
+import subprocess
+# Streamlit 환경에서는 tkinter를 사용하지 않음
+try:
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+def get_config_file_path():
+    """
+    설정 파일 경로를 반환하는 함수
+    
+    Returns:
+        str: 설정 파일의 전체 경로
+    """
+    # 변환 스크립트(Pro_*_pdf_to_excel.py)와 같은 디렉토리에 config.json 파일 생성
+    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(script_dir, "pdf_converter_config.json")
+
+def load_last_directory():
+    """
+    마지막으로 사용한 디렉토리를 불러오는 함수
+    
+    Returns:
+        str: 마지막 사용 디렉토리 경로, 없으면 현재 디렉토리
+    """
+    config_file = get_config_file_path()
+    try:
+        if os.path.exists(config_file):
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+                last_dir = config.get('last_pdf_directory', os.getcwd())
+                # 디렉토리가 실제로 존재하는지 확인
+                if os.path.exists(last_dir):
+                    return last_dir
+    except (json.JSONDecodeError, FileNotFoundError, PermissionError):
+        pass
+    
+    return os.getcwd()
+
+def save_last_directory(directory_path):
+    """
+    마지막으로 사용한 디렉토리를 저장하는 함수
+    
+    Args:
+        directory_path (str): 저장할 디렉토리 경로
+    """
+    config_file = get_config_file_path()
+    try:
+        # 기존 설정이 있으면 불러오기
+        config = {}
+        if os.path.exists(config_file):
+            try:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                config = {}
+        
+        # 마지막 디렉토리 업데이트
+        config['last_pdf_directory'] = directory_path
+        
+        # 설정 파일에 저장
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+    except (PermissionError, OSError):
+        # 저장 실패시 무시 (치명적이지 않음)
+        pass
+
+class ProgressWindow:
+    """
+    프로그래스바를 표시하는 GUI 클래스
+    """
+    def __init__(self):
+        if not TKINTER_AVAILABLE:
+            return
+        
+        self.root = tk.Tk()
+        self.root.title("PDF 처리 중...")
+        
+        # 창 크기 설정
+        window_width = 400
+        window_height = 150
+        
+        # 화면 크기 가져오기
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        
+        # 화면 중앙 위치 계산
+        center_x = int(screen_width/2 - window_width/2)
+        center_y = int(screen_height/2 - window_height/2)
+        
+        # 창 크기와 위치 설정
+        self.root.geometry(f"{window_width}x{window_height}+{center_x}+{center_y}")
+        self.root.resizable(False, False)
+        self.root.attributes('-topmost', True)  # 항상 위에 표시
+        
+        # 메인 프레임
+        main_frame = ttk.Frame(self.root, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # 제목 라벨
+        self.title_label = ttk.Label(main_frame, text="Processing PDF file...", 
+                                    font=("Arial", 12, "bold"))
+        self.title_label.pack(pady=(0, 20))
+        
+        # 상태 라벨
+        self.status_label = ttk.Label(main_frame, text="Starting...", 
+                                     font=("Arial", 10),
+                                     width=50,
+                                     anchor="center")
+        self.status_label.pack(pady=(0, 10))
+        
+        # 프로그래스바
+        self.progress = ttk.Progressbar(main_frame, length=300, mode='determinate')
+        self.progress.pack(pady=(0, 10))
+        
+        # 퍼센트 라벨
+        self.percent_label = ttk.Label(main_frame, text="0%", 
+                                      font=("Arial", 10),
+                                      width=10,
+                                      anchor="center")
+        self.percent_label.pack()
+        
+        # 프로그래스바 초기화
+        self.progress['maximum'] = 100
+        self.progress['value'] = 0
+        
+    def update_progress(self, value, status_text=""):
+        """
+        프로그래스바 업데이트
+        
+        Args:
+            value (int): 프로그래스 값 (0-100)
+            status_text (str): 상태 텍스트
+        """
+        if not TKINTER_AVAILABLE:
+            return
+        
+        self.progress['value'] = value
+        self.percent_label.config(text=f"{value}%")
+        if status_text:
+            # 이전 텍스트를 완전히 지우고 새 텍스트로 교체
+            self.status_label.config(text="")
+            self.root.update_idletasks()
+            self.status_label.config(text=status_text)
+        self.root.update_idletasks()
+        
+    def close(self):
+        """프로그래스바 창 닫기"""
+        if not TKINTER_AVAILABLE:
+            return
+        
+        self.root.destroy()
+        
+    def show(self):
+        """프로그래스바 창 표시"""
+        if not TKINTER_AVAILABLE:
+            return
+        
+        self.root.update()
+
+def select_save_location(pdf_filename):
+    """
+    GUI로 엑셀 파일 저장 위치를 선택하는 함수
+    
+    Args:
+        pdf_filename (str): PDF 파일명
+        
+    Returns:
+        str: 선택된 저장 경로, 취소시 None
+    """
+    if not TKINTER_AVAILABLE:
+        return None
+    
+    # tkinter 윈도우 생성 (숨김)
+    root = tk.Tk()
+    root.withdraw()  # 메인 윈도우 숨기기
+    
+    # 기본 파일명 설정 (PDF 파일명에서 확장자 제거 후 _extracted.xlsx 추가)
+    default_filename = os.path.splitext(pdf_filename)[0] + '_extracted.xlsx'
+    
+    # 마지막으로 사용한 디렉토리 불러오기
+    initial_dir = load_last_directory()
+    
+    # 파일 저장 대화상자 열기
+    save_path = filedialog.asksaveasfilename(
+        title="엑셀 파일을 저장할 위치를 선택하세요",
+        defaultextension=".xlsx",
+        filetypes=[
+            ("Excel 파일", "*.xlsx"),
+            ("모든 파일", "*.*")
+        ],
+        initialfile=default_filename,
+        initialdir=initial_dir
+    )
+    
+    root.destroy()  # tkinter 윈도우 제거
+    
+    # 파일이 저장되었으면 해당 디렉토리를 저장
+    if save_path:
+        directory = os.path.dirname(save_path)
+        save_last_directory(directory)
+    
+    return save_path if save_path else None
+
+def open_excel_file(file_path):
+    """
+    엑셀 파일을 운영체제 기본 프로그램으로 열기
+    
+    Args:
+        file_path (str): 열려는 엑셀 파일 경로
+    """
+    try:
+        if platform.system() == "Windows":
+            os.startfile(file_path)
+        elif platform.system() == "Darwin":  # macOS
+            subprocess.run(["open", file_path])
+        else:  # Linux
+            subprocess.run(["xdg-open", file_path])
+        
+        print(f"엑셀 파일이 열렸습니다: {file_path}")
+    except Exception as e:
+        print(f"엑셀 파일을 여는 중 오류가 발생했습니다: {str(e)}")
+        print(f"수동으로 파일을 열어주세요: {file_path}")
+
+def select_pdf_file():
+    """
+    GUI로 PDF 파일을 선택하는 함수
+    
+    Returns:
+        str: 선택된 PDF 파일의 경로, 취소시 None
+    """
+    if not TKINTER_AVAILABLE:
+        return None
+    
+    # tkinter 윈도우 생성 (숨김)
+    root = tk.Tk()
+    root.withdraw()  # 메인 윈도우 숨기기
+    
+    # 마지막으로 사용한 디렉토리 불러오기
+    initial_dir = load_last_directory()
+    
+    # 파일 선택 대화상자 열기
+    pdf_path = filedialog.askopenfilename(
+        title="PDF 파일을 선택하세요",
+        filetypes=[
+            ("PDF 파일", "*.pdf"),
+            ("모든 파일", "*.*")
+        ],
+        initialdir=initial_dir  # 마지막 사용 디렉토리에서 시작
+    )
+    
+    root.destroy()  # tkinter 윈도우 제거
+    
+    # 파일이 선택되었으면 해당 디렉토리를 저장
+    if pdf_path:
+        directory = os.path.dirname(pdf_path)
+        save_last_directory(directory)
+    
+    return pdf_path if pdf_path else None
@@ -0,0 +1,208 @@
+"""
+누적 PDF 증분 변환
+
+일부 장비 내보내기는 매일 이전 페이지 전체에 새 페이지를 덧붙인 PDF를 만듭니다.
+변환할 때 페이지별 내용 해시, 행 수, Sequence 카운터를 엑셀 옆 상태 파일(.reaf_state.json)에 기록해 두고,
+다음 변환에서는 앞쪽의 같은 페이지는 건너뛰고 새로 붙은 페이지만 추출/파싱합니다.
+xlsx는 압축된 XML 묶음이라 제자리에서 이어 쓸 수 없으므로, 페이지별 행은 엑셀 옆 행 저장소(.reaf_rows.jsonl)에
+한 줄씩 이어 쓰고 엑셀은 저장소에서 스트리밍 출력(ExcelStream)으로 다시 만듭니다 (기존 엑셀을 읽지 않음).
+- 앞쪽 페이지 중 바뀐 페이지가 있으면 그 페이지부터 다시 처리 (그 뒤의 기존 행은 새 행으로 바뀜)
+- 변환 설정(프로파일, 파서 버전, 백엔드 등)이 다르거나 상태 기록 이후 엑셀 파일/행 저장소가 바뀌었으면 전체를 다시 변환
+"""
+import io
+import json
+import os
+
+from .converter import check_diagnostics, count_flags, failure_logs, source_name, summary_count_logs
+from .excel import ExcelStream
+from .parsers import PARSER_VERSION, Row, parse_page
+from .pdf_pages import DEFAULT_BACKEND, extract_page_lines, page_digests, read_source, resolve_page_cache
+from .profiles import get_profile
+
+# 상태 파일 형식이 바뀌면 올려야 하는 버전 (버전이 다르면 전체를 다시 변환)
+STATE_VERSION = 2
+
+def state_path(output_path):
+    """엑셀 출력 파일 옆에 둘 상태 파일 경로 (예: report.xlsx -> report.reaf_state.json)"""
+    return os.path.splitext(output_path)[0] + ".reaf_state.json"
+
+def rows_path(output_path):
+    """엑셀 출력 파일 옆에 둘 행 저장소 경로 (예: report.xlsx -> report.reaf_rows.jsonl)"""
+    return os.path.splitext(output_path)[0] + ".reaf_rows.jsonl"
+
+def output_signature(output_path):
+    """
+    엑셀 파일/행 저장소 변경 판단용 [크기, 수정 시각 ns]
+
+    Returns:
+        list: [size, mtime_ns], 파일이 없으면 None
+    """
+    try:
+        stat = os.stat(output_path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def load_state(path):
+    """
+    상태 파일 읽기
+
+    Returns:
+        dict: 상태, 없거나 손상되었거나 버전이 다르면 None
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get('version') != STATE_VERSION:
+        return None
+    return state
+
+def save_state(path, state):
+    """상태 파일 저장 (임시 파일에 쓴 뒤 이름 변경)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def append_row_store(path, keep, page_rows):
+    """
+    행 저장소의 앞쪽 keep페이지 기록만 남기고 새 페이지들의 행을 덧붙이는 함수 (한 줄에 한 페이지의 행 리스트)
+
+    Args:
+        path (str): 행 저장소 경로
+        keep (int): 유지할 앞쪽 페이지 수 (0이면 새로 만듦)
+        page_rows (list): 새 페이지별 행(Row) 리스트의 리스트
+    """
+    with open(path, 'r+b' if keep else 'wb') as f:
+        for _ in range(keep):
+            if not f.readline():
+                raise ValueError(f"행 저장소에 유지할 페이지 기록이 부족합니다: {path}")
+        f.truncate()
+        for rows in page_rows:
+            f.write(json.dumps(rows, ensure_ascii=False, default=Row.to_dict).encode('utf-8') + b"\n")
+
+def read_row_store(path):
+    """행 저장소의 페이지별 행 리스트를 한 페이지씩 내보내는 제너레이터"""
+    with open(path, 'rb') as f:
+        for line in f:
+            yield [Row.from_dict(row) for row in json.loads(line)]
+
+def matching_pages(state_pages, digests):
+    """상태에 기록된 페이지와 내용 해시가 같은 앞쪽 페이지 수 (추출에 실패했던 페이지는 다시 처리)"""
+    count = 0
+    for page, digest in zip(state_pages, digests):
+        if page['hash'] != digest or page.get('failed'):
+            break
+        count += 1
+    return count
+
+def convert_incremental(profile, pdf_path, output_path, backend=DEFAULT_BACKEND, crop=False, page_cache=True,
+                        parallel=False, max_workers=None, excel_writer=None, diagnostics="summary", isolate=False):
+    """
+    누적 PDF를 증분 변환하는 함수 (이전 변환 이후 새로 붙은 페이지만 처리해서 기존 엑셀에 이어 씀)
+    이전 상태가 없거나 사용할 수 없으면 전체를 변환하고 상태 파일을 새로 만듭니다.
+
+    Args:
+        profile (str | dict): 변환 프로파일 ('CC_ID', 'CC_Seq', 'IM_ID', 'IM_Seq')
+        pdf_path (str | bytes | BinaryIO): PDF 파일 경로, PDF 내용 또는 파일 객체
+        output_path (str): 엑셀 출력 파일 경로 (이전 변환 결과가 있으면 여기에 이어 씀)
+        diagnostics (str): 진단 정보 수준 ('none', 'summary' - 'full'은 페이지 줄 전체가 필요하므로 지원하지 않음)
+        그 외 옵션은 converter.run 참고 (엑셀은 매번 행 저장소에서 excel_writer로 다시 만듦)
+
+    Returns:
+        dict: {'mode': 'full' | 'append' | 'unchanged' | 'empty', 'pages': 전체 페이지 수,
+               'new_pages': 새로 처리한 페이지 수, 'rows': 전체 행 수, 'new_rows': 새로 쓴 행 수}
+    """
+    profile = get_profile(profile)
+    check_diagnostics(diagnostics)
+    if diagnostics == "full":
+        raise ValueError("증분 변환은 'full' 진단 정보를 지원하지 않습니다. (전체 진단 정보는 write_diagnostics() 사용)")
+    pdf_filename = source_name(pdf_path)
+    pdf_path = read_source(pdf_path)
+
+    digests = page_digests(pdf_path)
+    settings = {
+        'profile': profile['name'],
+        'layout_version': profile.get('layout_version'),
+        'parser_version': PARSER_VERSION,
+        'backend': backend,
+        'crop': bool(crop),
+        'diagnostics': diagnostics,
+    }
+    sidecar = state_path(output_path)
+    store = rows_path(output_path)
+    state = load_state(sidecar)
+
+    keep = 0
+    if (state and state.get('settings') == settings and state.get('output') == output_signature(output_path)
+            and state.get('store') == output_signature(store)):
+        keep = matching_pages(state['pages'], digests)
+        if keep == len(state['pages']) == len(digests):
+            rows = sum(page['rows'] for page in state['pages'])
+            print(f"새 페이지가 없습니다: {pdf_filename}")
+            return {'mode': 'unchanged', 'pages': len(digests), 'new_pages': 0, 'rows': rows, 'new_rows': 0}
+
+    # 내용이 같은 앞쪽 페이지의 기록은 그대로 쓰고, 그 다음 페이지부터 추출/파싱
+    pages = state['pages'][:keep] if keep else []
+    counter = pages[-1]['counter'] if pages else 0
+    failures = []
+    page_lines = extract_page_lines(pdf_path, parallel=parallel, max_workers=max_workers, backend=backend,
+                                    region=profile['analyzer'] if crop else None,
+                                    cache=resolve_page_cache(page_cache), start=keep, isolate=isolate,
+                                    failures=failures)
+    failed_pages = {failure['page'] - 1 for failure in failures}
+    page_rows = []
+    for index, lines in enumerate(page_lines, keep):
+        # Sequence 모드의 테스트 카운터는 마지막으로 유지한 페이지에서 이어짐
+        _, _, rows, counter = parse_page(lines, profile, index == 0, counter)
+        alarms, reruns = count_flags(rows)
+        page = {'hash': digests[index], 'rows': len(rows), 'counter': counter, 'alarms': alarms,
+                'reruns': reruns, 'empty': not any(lines)}
+        if index in failed_pages:
+            page['failed'] = True
+        pages.append(page)
+        page_rows.append(rows)
+
+    total_rows = sum(page['rows'] for page in pages)
+    result = {'mode': 'append' if keep else 'full', 'pages': len(pages), 'new_pages': len(page_lines),
+              'rows': total_rows, 'new_rows': sum(len(rows) for rows in page_rows)}
+    if total_rows == 0:
+        print("추출된 데이터가 없습니다.")
+        result['mode'] = 'empty'
+        return result
+
+    terminal_logs = None
+    if diagnostics == "summary":
+        empty_pages = [page_num for page_num, page in enumerate(pages, 1) if page['empty']]
+        terminal_logs = summary_count_logs(pdf_filename, len(pages), empty_pages, total_rows,
+                                           sum(page['alarms'] for page in pages),
+                                           sum(page['reruns'] for page in pages))
+    if failures:
+        terminal_logs = (terminal_logs or []) + failure_logs(failures)
+
+    # 행 저장소에 새 페이지를 이어 쓰고 엑셀은 저장소 전체에서 다시 만듦 (페이지 순서대로 스트리밍)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    append_row_store(store, keep, page_rows)
+    output = io.BytesIO()
+    stream = ExcelStream(profile, pdf_filename, output, writer=excel_writer)
+    for page_num, rows in enumerate(read_row_store(store), 1):
+        stream.add_page(page_num, rows)
+    stream.close(terminal_logs)
+
+    # 저장소와 엑셀을 먼저 바꾸고 상태를 기록 (중간에 중단되면 서명이 달라서 다음 변환은 전체 변환)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(output.getvalue())
+    os.replace(tmp_path, output_path)
+    save_state(sidecar, {
+        'version': STATE_VERSION,
+        'settings': settings,
+        'pdf': pdf_filename,
+        'output': output_signature(output_path),
+        'store': output_signature(store),
+        'pages': pages,
+    })
+    print(f"엑셀 파일이 저장되었습니다: {output_path} ({result['new_pages']}페이지, {result['new_rows']}개 추가)")
+    return result
@@ -0,0 +1,258 @@
+"""
+페이지별로 격리된 워커 프로세스에서 텍스트 추출
+
+깨진 페이지나 그래픽이 많은 페이지 하나가 추출을 멈추게 하거나 메모리를 모두 쓰지 않도록,
+워커 프로세스에 페이지를 하나씩 맡기고 페이지마다 시간 제한과 메모리 제한을 둡니다.
+제한을 넘거나 워커가 비정상 종료되면 해당 워커만 다시 시작하고 그 페이지는 실패로 기록합니다.
+실패한 페이지는 더 단순한 백엔드(FALLBACK_BACKENDS)로 한 번 더 추출합니다.
+"""
+import multiprocessing
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+# 메모리 제한은 resource 모듈(Unix)이 있을 때만 적용
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from .pdf_pages import _read_page, open_document
+
+# 페이지 하나의 기본 추출 시간 제한(초)과 워커가 시작 후 더 쓸 수 있는 메모리(MB)
+PAGE_TIMEOUT = 60.0
+PAGE_MEMORY_MB = 2048
+
+# 실패한 페이지를 다시 추출할 더 단순한 백엔드 (pdfium은 문자 박스만 읽으므로 가장 단순함)
+FALLBACK_BACKENDS = {
+    "pdfplumber": "pdfium",
+    "mupdf": "pdfium",
+}
+
+# 워커 종료를 기다리는 시간(초)
+WORKER_SHUTDOWN_TIMEOUT = 2.0
+
+class PageLimits:
+    """
+    격리 추출의 페이지별 제한
+
+    Args:
+        timeout (float): 페이지 하나의 추출 시간 제한(초)
+        memory_mb (int): 워커 프로세스가 시작할 때의 주소 공간보다 더 늘릴 수 있는 크기(MB), None이면 제한 없음
+    """
+    def __init__(self, timeout=PAGE_TIMEOUT, memory_mb=PAGE_MEMORY_MB):
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+
+def resolve_limits(isolate):
+    """
+    converter의 isolate 인자를 PageLimits로 변환 (True: 기본 제한, False/None: 격리 사용 안 함)
+    """
+    if isolate is True:
+        return PageLimits()
+    return isolate or None
+
+def _address_space_bytes():
+    """
+    현재 프로세스의 주소 공간 크기 (Linux /proc/self/statm, 읽을 수 없으면 None)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _limit_memory(memory_mb):
+    """
+    워커 프로세스의 주소 공간 제한 설정
+    워커는 호출한 프로세스(Streamlit 등)를 fork해서 그 주소 공간을 물려받으므로,
+    제한은 지금 크기에 memory_mb만큼 더한 값으로 정합니다 (이미 설정된 hard 제한은 넘지 않음).
+    지금 크기를 알 수 없거나(/proc이 없는 macOS 등) 제한을 설정할 수 없으면 메모리 제한 없이 추출합니다
+    (시간 제한은 그대로 적용).
+    """
+    current = _address_space_bytes()
+    if current is None:
+        return
+    limit = current + memory_mb * 1024 * 1024
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass
+
+def _worker_main(conn, pdf_path, backend, region, memory_mb):
+    """
+    워커 프로세스: 페이지 인덱스를 받아서 (인덱스, 줄 리스트, 오류 메시지)를 돌려줌 (None을 받으면 종료)
+    """
+    if memory_mb and resource is not None:
+        _limit_memory(memory_mb)
+    doc = None
+    try:
+        while True:
+            index = conn.recv()
+            if index is None:
+                break
+            try:
+                if doc is None:
+                    doc = open_document(pdf_path, backend)
+                conn.send((index, _read_page(doc, index, region), None))
+            except MemoryError:
+                conn.send((index, None, f"메모리 제한 초과 (시작 후 {memory_mb}MB 추가 사용)"))
+            except Exception as e:
+                conn.send((index, None, str(e) or type(e).__name__))
+    except (EOFError, OSError):
+        pass
+    finally:
+        if doc is not None:
+            doc.close()
+
+class _Worker:
+    """부모 프로세스에서 워커 하나와 지금 맡긴 페이지를 관리"""
+    def __init__(self, pdf_path, backend, region, memory_mb):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker_main,
+                                               args=(child_conn, pdf_path, backend, region, memory_mb),
+                                               daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.index = None
+        self.started = None
+
+    def assign(self, index):
+        self.index = index
+        self.started = time.monotonic()
+        self.conn.send(index)
+
+    def stop(self, kill=False):
+        if not kill:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(WORKER_SHUTDOWN_TIMEOUT)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+class IsolatedPool:
+    """
+    격리된 워커 프로세스 한 벌 (스트리밍 변환에서는 보고서 전체에 걸쳐 다시 씀)
+    submit()으로 맡긴 페이지를 poll()/result()를 부를 때마다 쉬는 워커에 하나씩 나눠 주고 결과를 모아 둡니다.
+    워커는 맡길 페이지가 있을 때만 workers개까지 만들고, 멈추거나 죽은 워커는 버립니다 (다음 페이지에서 새로 만듦).
+
+    Args:
+        pdf_path (str | bytes): PDF 파일 경로 또는 PDF 내용
+        backend (str): 텍스트 추출 백엔드 이름
+        region (dict): 영역 프로파일 (None이면 전체 페이지)
+        limits (PageLimits): 페이지별 제한 (None이면 기본 제한)
+        workers (int): 동시에 실행할 워커 프로세스 수
+    """
+    def __init__(self, pdf_path, backend, region=None, limits=None, workers=1):
+        self.pdf_path = pdf_path
+        self.backend = backend
+        self.region = region
+        self.limits = limits or PageLimits()
+        self.workers = max(1, workers)
+        self.pending = deque()
+        self.pool = []
+        # 끝난 페이지 결과 (result()가 꺼내 감)
+        self.pages = {}
+        self.failed = {}
+
+    def submit(self, indices):
+        """페이지들을 맡김 (맡긴 순서대로 추출), result()에 넘길 인덱스 리스트 반환"""
+        indices = list(indices)
+        self.pending.extend(indices)
+        return indices
+
+    def _drop(self, worker, message):
+        # 멈추거나 죽은 워커는 버림 (남은 페이지가 있으면 다음 poll()에서 새 워커를 만듦)
+        self.failed[worker.index] = message
+        worker.stop(kill=True)
+        self.pool.remove(worker)
+
+    def poll(self, timeout=0):
+        """
+        쉬는 워커에 페이지를 맡기고, 최대 timeout초 동안 끝난 결과를 모으는 함수
+        (None이면 가장 먼저 시간 제한에 걸리는 페이지까지 기다림)
+
+        Returns:
+            bool: 추출 중인 페이지가 있으면 True
+        """
+        for worker in self.pool:
+            if worker.index is None and self.pending:
+                worker.assign(self.pending.popleft())
+        while self.pending and len(self.pool) < self.workers:
+            worker = _Worker(self.pdf_path, self.backend, self.region, self.limits.memory_mb)
+            worker.assign(self.pending.popleft())
+            self.pool.append(worker)
+        busy = [worker for worker in self.pool if worker.index is not None]
+        if not busy:
+            return False
+
+        now = time.monotonic()
+        wait_time = max(0.0, min(worker.started + self.limits.timeout - now for worker in busy))
+        if timeout is not None:
+            wait_time = min(wait_time, timeout)
+        ready = wait([worker.conn for worker in busy], timeout=wait_time)
+        for worker in busy:
+            if worker.conn in ready:
+                try:
+                    index, lines, error = worker.conn.recv()
+                except (EOFError, OSError):
+                    worker.process.join(WORKER_SHUTDOWN_TIMEOUT)
+                    self._drop(worker, f"워커 프로세스 비정상 종료 (종료 코드 {worker.process.exitcode})")
+                    continue
+                if error is None:
+                    self.pages[index] = lines
+                else:
+                    self.failed[index] = error
+                worker.index = None
+            elif time.monotonic() - worker.started >= self.limits.timeout:
+                self._drop(worker, f"시간 제한 초과 ({self.limits.timeout:g}초)")
+        return True
+
+    def result(self, indices):
+        """
+        submit()한 페이지들이 모두 끝날 때까지 기다려서 결과를 꺼내는 함수
+
+        Returns:
+            tuple: ({페이지 인덱스: 줄 리스트}, {실패한 페이지 인덱스: 오류 메시지})
+        """
+        for index in indices:
+            while index not in self.pages and index not in self.failed:
+                self.poll(None)
+        pages = {index: self.pages.pop(index) for index in indices if index in self.pages}
+        failed = {index: self.failed.pop(index) for index in indices if index in self.failed}
+        return pages, failed
+
+    def close(self):
+        # 추출 중인 워커는 페이지가 끝나길 기다리지 않고 종료
+        for worker in self.pool:
+            worker.stop(kill=worker.index is not None)
+        self.pool = []
+        self.pending.clear()
+
+def extract_isolated(pdf_path, indices, backend, region=None, limits=None, workers=1):
+    """
+    페이지들을 격리된 워커 프로세스에서 하나씩 추출하는 함수
+
+    Args:
+        pdf_path (str | bytes): PDF 파일 경로 또는 PDF 내용
+        indices (list): 추출할 페이지 인덱스 리스트 (0-based)
+        backend (str): 텍스트 추출 백엔드 이름
+        region (dict): 영역 프로파일 (None이면 전체 페이지)
+        limits (PageLimits): 페이지별 제한 (None이면 기본 제한)
+        workers (int): 동시에 실행할 워커 프로세스 수
+
+    Returns:
+        tuple: ({페이지 인덱스: 줄 리스트}, {실패한 페이지 인덱스: 오류 메시지})
+    """
+    pool = IsolatedPool(pdf_path, backend, region, limits, workers)
+    try:
+        return pool.result(pool.submit(indices))
+    finally:
+        pool.close()
@@ -0,0 +1,553 @@
+import re
+import sys
+from functools import lru_cache
+from itertools import islice
+
+# 파싱 규칙(헤더/결과 블록 파싱, 엑셀 출력 값)을 바꾸면 올려야 하는 버전 (변환 캐시 키에 사용)
+PARSER_VERSION = "4"
+
+# Unit 줄 해석 결과를 기억해 둘 줄 수 (같은 시약의 Unit/AU/R.P Lot 줄은 보고서 전체에서 반복됨)
+UNIT_LINE_CACHE_SIZE = 4096
+
+DATE_PATTERN = re.compile(r'\d{4}/\d{2}/\d{2}')
+
+def find_date(parts):
+    """
+    단어 리스트에서 YYYY/MM/DD 형태의 첫 번째 날짜를 찾는 함수
+
+    Args:
+        parts (list): 한 줄을 공백으로 나눈 단어들
+
+    Returns:
+        str: 날짜 단어, 없으면 None
+    """
+    for part in parts:
+        if DATE_PATTERN.match(part):
+            return part
+    return None
+
+def _is_rp_lot(word):
+    """숫자로만 구성되어 있거나 숫자가 포함된 영숫자 문자열이면 R.P Lot으로 인식"""
+    return word.isdigit() or (word.isalnum() and any(c.isdigit() for c in word))
+
+def _first_with_dash(parts):
+    """같은 줄에서 "-"가 포함된 첫 번째 단어 (없으면 빈 문자열)"""
+    for word in parts:
+        if "-" in word:
+            return word
+    return ""
+
+def _is_numeric(text):
+    """숫자형 문자열인지 확인 ("4,12"처럼 쉼표 소수점도 허용)"""
+    try:
+        float(text.replace(',', '.'))
+        return True
+    except ValueError:
+        return False
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 헤더 줄 파서: (key, date) 반환
+# key는 Barcode 모드에서는 Sample ID, Sequence 모드에서는 기준 Seq No.
+# ─────────────────────────────────────────────────────────────────────────────
+
+def parse_header_id_colon(line):
+    """
+    "ID :" 다음 단어를 key로 추출 (CC Barcode 모드)
+    예: "Sample ID : 12345 Routine 2024/03/01 10:00:00"
+    날짜는 "ID :" 유무와 상관없이 같은 줄에서 찾습니다.
+    """
+    key = None
+    parts = line.split()
+    if "ID :" in line:
+        # "ID :" 다음 단어를 Sample ID로 추출
+        for i, part in enumerate(parts):
+            if part == "ID" and i + 1 < len(parts) and parts[i + 1] == ":":
+                if i + 2 < len(parts):
+                    key = parts[i + 2]
+                    break
+    return key, find_date(parts)
+
+def parse_header_second_word(line, markers=("Ser/PI", "SerumPlasma")):
+    """
+    markers 중 하나가 있는 줄에서 두 번째 단어를 key로 추출 (CC/IM Sequence 모드)
+    예: "Ser/PI 000123 Routine 2024/03/01 10:00:00"
+    """
+    if any(marker in line for marker in markers):
+        parts = line.split()
+        if len(parts) >= 2:
+            return parts[1], find_date(parts)
+    return None, None
+
+def parse_header_serum_plasma(line):
+    """
+    IM 헤더 줄에서 key 추출
+    SerumPlasma 형태: "SerumPlasma 50016-1 ID : 187 Test Sample 2023/12/08 19:23:06"
+      -> "ID :"와 날짜 사이의 모든 단어 ("187 Test Sample")
+    Ser/PI 형태: "Ser/PI 50016-1 2023/12/08 19:23:06" -> 두 번째 단어
+    """
+    key = None
+    date = None
+    if "SerumPlasma" in line or "Ser/PI" in line:
+        parts = line.split()
+
+        if "SerumPlasma" in line:
+            key_parts = []
+            for i, part in enumerate(parts):
+                if part == "ID" and i + 1 < len(parts) and parts[i + 1] == ":":
+                    # "ID :" 다음부터 날짜 패턴 전까지 모든 단어 수집
+                    for current_part in parts[i + 2:]:
+                        if DATE_PATTERN.match(current_part):
+                            break
+                        key_parts.append(current_part)
+                    break
+            if key_parts:
+                key = " ".join(key_parts)
+        elif len(parts) >= 2:
+            key = parts[1]
+
+        date = find_date(parts)
+    return key, date
+
+HEADER_PARSERS = {
+    "id_colon": parse_header_id_colon,
+    "second_word": parse_header_second_word,
+    "serum_plasma": parse_header_serum_plasma,
+}
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 결과 블록 문법: 프로파일의 결과 규칙(results)을 처음 쓸 때 한 번만 컴파일
+# 규칙 dict의 'parser' 외 항목이 문법 클래스의 키워드 인자이고, 패턴/단어 목록은 미리 컴파일한 패턴과 집합으로 바뀝니다.
+# ─────────────────────────────────────────────────────────────────────────────
+
+# 줄 태그 (줄 분류 패턴의 그룹 번호)
+OTHER = 0    # 빈 줄, 기타 줄 (결과 줄 바로 다음이면 Unit 줄로 읽음)
+END = 1      # 결과 블록 끝 표시 줄 (바닥글 등, 이 줄부터는 읽지 않음)
+REAGENT = 2  # 시약 줄 ("R2"/"R3" 등 skip_words로 시작, 생략)
+RESULT = 3   # 결과 줄
+
+def _line_pattern(end_marker, skip_words, result_pattern):
+    """앞 공백 뒤의 끝 표시(그룹 1), 시약 줄 단어(그룹 2) 또는 결과 줄 패턴(그룹 3)"""
+    skip = "|".join(re.escape(word) for word in skip_words) or "(?!)"
+    return re.compile(r'\s*(?:(' + (end_marker or "(?!)") + r')|(' + skip + r')(?!\S)|(' + result_pattern + '))')
+
+def _shift(parts, marker):
+    """Unit 줄 두번째 단어가 marker(NACL 등)이면 AU/R.P Lot 위치가 한 칸 뒤로 밀림"""
+    return 1 if marker and len(parts) > 2 and parts[1] == marker else 0
+
+class CCGrammar:
+    """
+    cobas pro c (CC) 결과 블록 문법
+
+    Args:
+        result_pattern (str): 결과 줄 정규식 (줄 앞 공백 뒤에서 match)
+        skip_words (list): 생략하는 시약 줄의 첫 단어
+        end_marker (str): 결과 블록이 끝나는 줄의 정규식 (줄 앞 공백 뒤에서 match하므로 줄 끝까지 보려면 $로 고정, None이면 페이지 끝까지)
+        units (list): Unit 줄로 인정하는 단위 문자열 (줄 어디에든 있으면 Unit 줄)
+        two_word_tests (list): 테스트명이 두 단어인 테스트 접두어 ("ISE K 4.5")
+        shift_marker (str): Unit 줄 두번째 단어가 이 값이면 AU/R.P Lot이 한 칸 뒤
+        plus_min_parts (int): "+ 테스트명 결과" 줄로 인정하는 최소 단어 수
+    """
+    def __init__(self, result_pattern, skip_words, end_marker, units, two_word_tests, shift_marker, plus_min_parts=3):
+        self.line_pattern = _line_pattern(end_marker, skip_words, result_pattern)
+        self.unit_pattern = re.compile("|".join(re.escape(unit) for unit in units))
+        self.two_word_tests = frozenset(two_word_tests)
+        self.shift_marker = shift_marker
+        self.plus_min_parts = plus_min_parts
+
+class IMGrammar:
+    """
+    cobas pro e (IM) 결과 블록 문법
+
+    Args:
+        result_pattern (str): 결과 줄 정규식 (줄 앞 공백 뒤에서 match)
+        skip_words (list): 생략하는 시약 줄의 첫 단어
+        end_marker (str): 결과 블록이 끝나는 줄의 정규식 (줄 앞 공백 뒤에서 match하므로 줄 끝까지 보려면 $로 고정, None이면 페이지 끝까지)
+        name_suffix (str): 테스트명 첫 단어 뒤에 붙는 단어 정규식 (전체 일치, 예: "3", "v2")
+        shift_marker (str): au_rule이 'second'일 때 Unit 줄 두번째 단어가 이 값이면 AU/R.P Lot이 한 칸 뒤
+        reaction_unit (str): 다음 줄에서 판정(Reac/NonReac)을 읽는 Unit
+        reactions (list): 판정 줄에서 찾을 단어 (앞의 단어부터 확인)
+        au_rule (str): AU 위치 규칙
+            'second': 두번째 단어 (shift_marker가 있으면 세번째 단어)
+            'third': 세번째 단어
+            지정 위치 단어에 "-"가 없으면 같은 줄에서 "-"가 포함된 단어를 사용
+    """
+    def __init__(self, result_pattern, skip_words, end_marker, name_suffix, shift_marker, reaction_unit, reactions,
+                 au_rule="second"):
+        self.line_pattern = _line_pattern(end_marker, skip_words, result_pattern)
+        self.name_suffix = re.compile(name_suffix)
+        self.shift_marker = shift_marker if au_rule == "second" else None
+        self.reaction_unit = reaction_unit
+        self.reactions = tuple(reactions)
+        self.au_rule = au_rule
+
+RESULT_GRAMMARS = {
+    "cc": CCGrammar,
+    "im": IMGrammar,
+}
+
+# 컴파일한 결과 규칙 {id(규칙 dict): (규칙 dict, 문법)} (프로파일은 불러온 뒤 바꾸지 않는다고 가정)
+_COMPILED_RULES = {}
+
+def compile_rule(rule):
+    """
+    프로파일의 결과 규칙 dict를 문법 객체로 컴파일 (같은 dict는 한 번만 컴파일)
+
+    Args:
+        rule (dict): 페이지 규칙의 'results' 항목 ({"parser": "cc" | "im", ...})
+
+    Returns:
+        CCGrammar | IMGrammar: 컴파일한 문법
+    """
+    entry = _COMPILED_RULES.get(id(rule))
+    if entry is None or entry[0] is not rule:
+        entry = (rule, RESULT_GRAMMARS[rule['parser']](**_options(rule)))
+        _COMPILED_RULES[id(rule)] = entry
+    return entry[1]
+
+def classify_lines(lines, start_line, pattern):
+    """
+    결과 블록의 줄들에 태그를 붙이는 함수
+    start_line부터 끝 표시 줄(END) 전까지 한 번만 훑고, 끝 표시가 없으면 페이지 끝까지 읽습니다.
+
+    Args:
+        lines (list): 페이지의 모든 줄들
+        start_line (int): 결과 블록 시작 줄 인덱스
+        pattern (re.Pattern): 줄 분류 패턴 (문법의 line_pattern)
+
+    Returns:
+        list: 결과 블록 줄들의 태그 리스트 (OTHER, REAGENT, RESULT)
+    """
+    match = pattern.match
+    tags = []
+    for line in islice(lines, start_line, None):
+        m = match(line)
+        if m is None:
+            tags.append(OTHER)
+        elif m.lastindex == END:
+            break
+        else:
+            tags.append(m.lastindex)
+    return tags
+
+def result_lines(tags, start_line):
+    """
+    결과 줄 인덱스를 순서대로 돌려주는 제너레이터 (결과 줄 바로 다음 줄은 Unit 줄로 읽으므로 건너뜀)
+
+    Args:
+        tags (list): classify_lines 결과
+        start_line (int): 결과 블록 시작 줄 인덱스
+
+    Yields:
+        int: 결과 줄의 페이지 줄 인덱스
+    """
+    next_free = start_line
+    for i, tag in enumerate(tags, start_line):
+        if tag == RESULT and i >= next_free:
+            next_free = i + 2
+            yield i
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 결과 행
+# ─────────────────────────────────────────────────────────────────────────────
+
+# 행의 key 컬럼으로 쓸 수 있는 필드 (Barcode 모드: Sample ID, Sequence 모드: Seq No.)
+KEY_FIELDS = ('sample_id', 'seq_no')
+
+class Row:
+    """
+    결과 행 하나 (필드가 고정된 __slots__ 객체라서 행마다 dict를 만들지 않음)
+    행 dict처럼 row['test_name'], row.get('r_nr')로 읽을 수 있고, 값을 넣지 않은 필드는 없는 키로 취급합니다.
+    (key 컬럼은 parse_page에서, IM의 r_nr은 IM 결과 파서에서 채움)
+    """
+    __slots__ = KEY_FIELDS + ('test_name', 'result', 'unit', 'au', 'rp_lot', 'data_alarm', 'rerun', 'date',
+                              'has_rerun', 'r_nr')
+
+    def __init__(self, test_name, result, unit, au, rp_lot, data_alarm, rerun, date, has_rerun):
+        self.test_name = test_name
+        self.result = result
+        self.unit = unit
+        self.au = au
+        self.rp_lot = rp_lot
+        self.data_alarm = data_alarm
+        self.rerun = rerun
+        self.date = date
+        self.has_rerun = has_rerun
+
+    def get(self, field, default=None):
+        return getattr(self, field, default)
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def to_dict(self):
+        """값이 있는 필드만 담은 행 dict (체크포인트 기록용)"""
+        return {field: getattr(self, field) for field in self.__slots__ if hasattr(self, field)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict()로 만든 행 dict를 다시 행 객체로"""
+        row = cls.__new__(cls)
+        for field, value in data.items():
+            setattr(row, field, value)
+        return row
+
+    def __eq__(self, other):
+        if isinstance(other, Row):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Row({self.to_dict()!r})"
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 결과 블록 파서: 행(Row) 리스트 반환 (key 컬럼은 parse_page에서 채움)
+# 태그가 RESULT인 줄과 그 다음 줄(Unit 줄)을 묶어서 한 행으로 만드는 상태 기계입니다.
+# 테스트명/Unit/AU/R.P Lot처럼 여러 행에서 반복되는 문자열은 intern해서 한 객체를 같이 씁니다.
+# ─────────────────────────────────────────────────────────────────────────────
+
+# 결과 줄 정보가 없을 때의 (Test Name, Result, Data Alarm, "+" 재검 여부)
+EMPTY_CC_RESULT = ("", "", "N", False)
+
+def _cc_result_fields(parts, grammar):
+    """
+    CC 결과 줄의 (Test Name, Result, Data Alarm, "+" 재검 여부)
+
+    Returns:
+        tuple: 결과 줄 정보, 단어 수가 모자라면 None
+    """
+    has_plus = parts[0].startswith('+')
+
+    if parts[0] in grammar.two_word_tests or (has_plus and len(parts) > 1 and parts[1] in grammar.two_word_tests):
+        # "+ ISE K 4.5" 또는 "ISE K 4.5" 형태
+        offset = 1 if has_plus else 0
+        if len(parts) >= 3 + offset:
+            # Result 뒤에 추가 단어가 있으면 Data Alarm Y
+            return (sys.intern(f"{parts[offset]} {parts[offset + 1]}"), parts[offset + 2],
+                    "Y" if len(parts) > 3 + offset else "N", has_plus)
+    elif has_plus:
+        # "+ BILD2-D 0.627 > Test" 형태
+        plus_min_parts = grammar.plus_min_parts
+        if len(parts) >= plus_min_parts:
+            return sys.intern(parts[1]), parts[2], "Y" if len(parts) > plus_min_parts else "N", True
+    else:
+        # "BILD2-D 0.627" 또는 "BILD2-D 0.627 > Test" 형태
+        if len(parts) >= 2:
+            return sys.intern(parts[0]), parts[1], "Y" if len(parts) > 2 else "N", False
+    return None
+
+@lru_cache(maxsize=UNIT_LINE_CACHE_SIZE)
+def _cc_unit_line(line, grammar):
+    """
+    CC 결과 줄 다음 줄의 (Unit, AU, R.P Lot)
+    일반적인 경우 두번째 단어가 AU, 네번째 단어가 R.P Lot (NACL이면 한 칸씩 뒤)
+
+    Returns:
+        tuple: Unit 정보, 단위가 없거나 단어가 2개 미만이면 None
+    """
+    parts = line.split()
+    if len(parts) < 2 or not grammar.unit_pattern.search(line):
+        return None
+    shift = _shift(parts, grammar.shift_marker)
+    rp_lot = ""
+    if len(parts) >= 5 + shift and _is_rp_lot(parts[3 + shift]):
+        rp_lot = parts[3 + shift]
+    return sys.intern(parts[0]), sys.intern(parts[1 + shift]), sys.intern(rp_lot)
+
+def parse_cc_results(lines, start_line, date, grammar):
+    """
+    cobas pro c (CC) 결과 블록 파싱
+    "BILD2-D 0.627 > Test", "+ BILD2-D 0.627", "ISE K 4.5" 형태의 결과 줄과
+    다음 줄의 Unit/AU/R.P Lot 정보를 묶어서 한 행으로 만듭니다.
+
+    Args:
+        lines (list): 페이지의 모든 줄들
+        start_line (int): 결과 블록 시작 줄 인덱스 (끝은 문법의 end_marker)
+        date (str): 헤더에서 추출한 날짜
+        grammar (CCGrammar): 결과 블록 문법
+
+    Returns:
+        list: 행(Row) 리스트
+    """
+    rows = []
+    current = EMPTY_CC_RESULT
+    tags = classify_lines(lines, start_line, grammar.line_pattern)
+
+    for i in result_lines(tags, start_line):
+        # 단어 수가 모자란 결과 줄은 이전 결과 줄 정보를 그대로 둠
+        current = _cc_result_fields(lines[i].split(), grammar) or current
+
+        # 다음 줄에서 Unit, AU, R.P Lot 정보 추출 (Unit 줄이 아니어도 다음 줄은 넘어감)
+        unit_fields = _cc_unit_line(lines[i + 1], grammar) if i + 1 < len(lines) else None
+        if unit_fields:
+            unit, au, rp_lot = unit_fields
+            test_name, result, data_alarm, has_plus = current
+            rows.append(Row(test_name, result, unit, au, rp_lot, data_alarm, "Y" if has_plus else "N", date, has_plus))
+            current = EMPTY_CC_RESULT  # 다음 데이터를 위해 초기화
+
+    return rows
+
+def _im_result_fields(parts, grammar):
+    """
+    IM 결과 줄의 (Test Name, Result, Data Alarm)
+    Test Name은 첫 단어 + 뒤따르는 name_suffix 형태 단어들, Result는 그 다음의 첫 번째 숫자형 값입니다.
+    """
+    # "+" 있는 경우 두번째 단어부터 처리
+    current_idx = 1 if parts[0].startswith('+') else 0
+
+    test_name_parts = []
+    if current_idx < len(parts):
+        test_name_parts.append(parts[current_idx])
+        current_idx += 1
+    is_suffix = grammar.name_suffix.fullmatch
+    while current_idx < len(parts) and is_suffix(parts[current_idx]):
+        test_name_parts.append(parts[current_idx])
+        current_idx += 1
+
+    # Result 찾기: Test Name 다음의 첫 번째 숫자형 값
+    for result_idx in range(current_idx, len(parts)):
+        word = parts[result_idx]
+        if _is_numeric(word):
+            # Data Alarm 판정: Result 뒤에 추가 단어가 있으면 'Y'
+            return (sys.intern(" ".join(test_name_parts)), word.replace(',', '.'),
+                    "Y" if result_idx + 1 < len(parts) else "N")
+    return sys.intern(" ".join(test_name_parts)), "", "N"
+
+@lru_cache(maxsize=UNIT_LINE_CACHE_SIZE)
+def _im_unit_line(line, grammar):
+    """
+    IM 결과 줄 다음 줄의 (Unit, AU, R.P Lot) (AU 위치는 IMGrammar의 au_rule 참고)
+
+    Returns:
+        tuple: Unit 정보, 빈 줄이면 None
+    """
+    parts = line.split()
+    if not parts:
+        return None
+    shift = _shift(parts, grammar.shift_marker)
+    au_index = 1 + shift if grammar.au_rule == "second" else 2
+    if len(parts) > au_index and "-" in parts[au_index]:
+        au = parts[au_index]
+    elif len(parts) > 1 or grammar.au_rule != "second":
+        au = _first_with_dash(parts)
+    else:
+        au = ""
+    rp_lot = ""
+    if len(parts) >= 5 + shift and _is_rp_lot(parts[3 + shift]):
+        rp_lot = parts[3 + shift]
+    return sys.intern(parts[0]), sys.intern(au), sys.intern(rp_lot)
+
+def _reaction(line, reactions):
+    """판정 줄에서 처음 찾은 reactions 단어 (없으면 빈 문자열)"""
+    for word in reactions:
+        if word in line:
+            return word
+    return ""
+
+def parse_im_results(lines, start_line, date, grammar):
+    """
+    cobas pro e (IM) 결과 블록 파싱
+    Test Name은 첫 단어 + 뒤따르는 1자리 숫자나 v2/V2 형태 단어들 ("FT4 3", "HBSAG v2"),
+    Result는 그 다음의 첫 번째 숫자형 값입니다 ("4,12" -> "4.12").
+    다음 줄의 첫 단어를 Unit으로 사용하고, Unit이 COI이면 그 다음 줄에서 Reac/NonReac를 읽습니다.
+
+    Args:
+        lines (list): 페이지의 모든 줄들
+        start_line (int): 결과 블록 시작 줄 인덱스 (끝은 문법의 end_marker)
+        date (str): 헤더에서 추출한 날짜
+        grammar (IMGrammar): 결과 블록 문법
+
+    Returns:
+        list: 행(Row) 리스트
+    """
+    rows = []
+    tags = classify_lines(lines, start_line, grammar.line_pattern)
+
+    for i in result_lines(tags, start_line):
+        # 다음 줄에서 Unit, AU, R.P Lot 정보 추출 (다음 줄이 비어 있으면 행을 만들지 않고 넘어감)
+        unit_fields = _im_unit_line(lines[i + 1], grammar) if i + 1 < len(lines) else None
+        if unit_fields:
+            unit, au, rp_lot = unit_fields
+            parts = lines[i].split()
+            test_name, result, data_alarm = _im_result_fields(parts, grammar)
+
+            # COI인 경우 다음 줄에서 Reac 또는 NonReac 찾기
+            r_nr_value = ""
+            if unit == grammar.reaction_unit and i + 2 < len(lines):
+                r_nr_value = _reaction(lines[i + 2], grammar.reactions)
+
+            has_plus = parts[0].startswith('+')
+            row = Row(test_name, result, unit, au, rp_lot, data_alarm, "Y" if has_plus else "N", date, has_plus)
+            row.r_nr = r_nr_value
+            rows.append(row)
+
+    return rows
+
+RESULT_PARSERS = {
+    "cc": parse_cc_results,
+    "im": parse_im_results,
+}
+
+def make_seq_no(base_seq_no, counter):
+    """
+    Sequence 모드의 행별 순차 번호 생성
+
+    Args:
+        base_seq_no (str): 헤더에서 추출한 기준 Seq No.
+        counter (int): 전체 문서 기준 테스트 순서 (1부터)
+
+    Returns:
+        str: 개별 순차 번호 (숫자인 경우 6자리, 아니면 "기준-순서")
+    """
+    if base_seq_no:
+        try:
+            return f"{int(base_seq_no) + counter - 1:06d}"
+        except ValueError:
+            return f"{base_seq_no}-{counter}"
+    return f"{counter:06d}"
+
+def _options(rule):
+    """프로파일 규칙 dict에서 파서 이름을 뺀 나머지 옵션"""
+    return {name: value for name, value in rule.items() if name != 'parser'}
+
+def parse_page(lines, profile, first_page, counter=0):
+    """
+    한 페이지의 줄들을 프로파일 규칙에 따라 파싱하는 함수
+
+    Args:
+        lines (list): 페이지의 모든 줄들
+        profile (dict): 변환 프로파일 (profiles.PROFILES)
+        first_page (bool): 첫 번째 페이지 여부 (헤더/결과 블록 위치가 다름)
+        counter (int): Sequence 모드에서 이전 페이지까지의 테스트 수 (페이지 간 연속성 유지)
+
+    Returns:
+        tuple: (key, date, rows, counter)
+    """
+    page = profile['first_page'] if first_page else profile['other_pages']
+
+    key = None
+    date = None
+    header_index = page['header_index']
+    if len(lines) > header_index:
+        header = page['header']
+        key, date = HEADER_PARSERS[header['parser']](lines[header_index].strip(), **_options(header))
+
+    results = page['results']
+    rows = RESULT_PARSERS[results['parser']](lines, page['start_line'], date, compile_rule(results))
+
+    key_field = profile['key_field']
+    if profile['mode'] == "Seq":
+        for row in rows:
+            counter += 1
+            setattr(row, key_field, make_seq_no(key, counter))
+    else:
+        for row in rows:
+            setattr(row, key_field, key)
+
+    return key, date, rows, counter
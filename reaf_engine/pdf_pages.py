@@ -0,0 +1,1017 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pdfplumber
+
+from .disk_cache import DiskCache, make_key
+
+# 병렬 모드에서 워커 하나가 최소한 맡아야 하는 페이지 수
+# (페이지 수가 적으면 프로세스 생성 비용이 더 크므로 순차 처리)
+MIN_PAGES_PER_WORKER = 8
+
+# 워커당 청크 수 (청크를 잘게 나눠서 페이지별 처리 시간 편차를 흡수)
+CHUNKS_PER_WORKER = 4
+
+# 스트리밍 변환(iter_page_lines)에서 한 번에 추출하는 페이지 수 (이만큼의 페이지 줄만 메모리에 남음)
+STREAM_CHUNK_PAGES = 256
+
+# 스트리밍 변환에서 워커에 미리 맡겨 두는 묶음 수 (내보내는 묶음 포함, 앞 묶음을 파싱하는 동안 다음 묶음을 추출)
+STREAM_LOOKAHEAD_CHUNKS = 2
+
+# 기본 텍스트 추출 백엔드
+DEFAULT_BACKEND = "pdfplumber"
+
+# 페이지 텍스트 캐시 형식/줄 재구성 방식이 바뀌면 올려야 하는 버전 (캐시 키에 사용)
+PAGE_TEXT_VERSION = 1
+
+# 페이지 텍스트 캐시 기본 한도 (압축된 줄 텍스트라 작으므로 1년치 보고서를 담을 수 있도록 넉넉하게)
+PAGE_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+PAGE_CACHE_MAX_AGE = 400 * 24 * 60 * 60    # 400일
+
+# pdfplumber extract_text()의 기본 허용 오차와 동일한 값 (단위: pt)
+X_TOLERANCE = 3
+Y_TOLERANCE = 3
+
+# 분석기별 페이지 영역 프로파일
+# bbox는 페이지 크기 대비 비율 (x0, top, x1, bottom)이며, 파서가 읽는 헤더 줄과 결과 블록만 포함하도록 설정
+# - header_index: (첫 페이지, 이후 페이지)의 헤더 줄 인덱스 (extract_data_from_* 함수와 동일)
+# - header_markers: 헤더 줄에 반드시 있어야 하는 문자열 (하나 이상)
+# - footer_top: 이 위치 아래는 바닥글 영역으로 간주 (잘린 영역 검증 시 무시)
+REGION_PROFILES = {
+    "CC": {
+        "first_page_bbox": (0.0, 0.0, 1.0, 0.70),
+        "other_page_bbox": (0.0, 0.0, 1.0, 0.66),
+        "footer_top": 0.93,
+        "header_index": (7, 4),
+        "header_markers": ("ID :", "Ser/PI", "SerumPlasma"),
+    },
+    "IM": {
+        "first_page_bbox": (0.0, 0.0, 1.0, 0.72),
+        "other_page_bbox": (0.0, 0.0, 1.0, 0.68),
+        "footer_top": 0.93,
+        "header_index": (7, 4),
+        "header_markers": ("Ser/PI", "SerumPlasma"),
+    },
+}
+
+def scale_bbox(bbox, page_bbox):
+    """
+    비율 bbox를 페이지 좌표(위쪽 기준, pdfplumber 방식)로 변환하는 함수
+
+    Args:
+        bbox (tuple): 페이지 크기 대비 비율 (x0, top, x1, bottom)
+        page_bbox (tuple): 페이지 좌표 (x0, top, x1, bottom)
+
+    Returns:
+        tuple: 페이지 좌표 (x0, top, x1, bottom)
+    """
+    px0, ptop, px1, pbottom = page_bbox
+    width = px1 - px0
+    height = pbottom - ptop
+    return (px0 + bbox[0] * width, ptop + bbox[1] * height,
+            px0 + bbox[2] * width, ptop + bbox[3] * height)
+
+def words_to_lines(words, y_tolerance=Y_TOLERANCE):
+    """
+    단어 좌표 목록을 pdfplumber extract_text()와 같은 방식으로 줄 단위 문자열로 합치는 함수
+    top 값이 y_tolerance 이내로 이어지는 단어들을 한 줄로 묶고, 줄 안에서는 x0 순서로 공백 연결
+
+    Args:
+        words (list): (x0, top, text) 튜플 리스트
+        y_tolerance (float): 같은 줄로 판단할 top 값 차이
+
+    Returns:
+        list: 줄 문자열 리스트 (단어가 없으면 [''])
+    """
+    if not words:
+        return ['']
+
+    words = sorted(words, key=lambda word: word[1])
+    lines = []
+    current_line = [words[0]]
+    last_top = words[0][1]
+    for word in words[1:]:
+        if word[1] - last_top <= y_tolerance:
+            current_line.append(word)
+        else:
+            lines.append(current_line)
+            current_line = [word]
+        last_top = word[1]
+    lines.append(current_line)
+
+    return [" ".join(word[2] for word in sorted(line, key=lambda word: word[0])) for line in lines]
+
+def read_source(source):
+    """
+    PDF 입력을 백엔드가 열 수 있는 형태로 정리하는 함수
+    파일 경로는 그대로 두고, bytes와 파일 객체(업로드 파일, BytesIO 등)는 bytes로 읽습니다.
+    (bytes는 여러 번 열 수 있고, 병렬/격리 워커에는 임시 파일로 한 번만 써서 넘김)
+
+    Args:
+        source (str | os.PathLike | bytes | BinaryIO): PDF 파일 경로, PDF 내용 또는 파일 객체
+
+    Returns:
+        str | bytes: 파일 경로 또는 PDF 내용
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, 'getvalue'):
+        return source.getvalue()
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source.read()
+
+class PdfplumberDocument:
+    """
+    pdfplumber 기반 페이지 텍스트 백엔드 (기존 extract_text() 결과와 동일, 가장 느림)
+    """
+    name = "pdfplumber"
+
+    def __init__(self, pdf_path):
+        self.pdf = pdfplumber.open(io.BytesIO(pdf_path) if isinstance(pdf_path, bytes) else pdf_path)
+
+    def __len__(self):
+        return len(self.pdf.pages)
+
+    def page_lines(self, index, bbox=None):
+        """
+        페이지의 텍스트를 줄 리스트로 반환
+
+        Args:
+            index (int): 페이지 인덱스 (0-based)
+            bbox (tuple): 추출할 영역 (페이지 크기 대비 비율, None이면 전체 페이지)
+
+        Returns:
+            list: 줄 문자열 리스트
+        """
+        page = self.pdf.pages[index]
+        try:
+            region = page.within_bbox(scale_bbox(bbox, page.bbox)) if bbox else page
+            return region.extract_text().split('\n')
+        finally:
+            # pdf.pages가 페이지 객체를 계속 갖고 있으므로 파싱한 문자/도형 객체를 놓아주지 않으면 페이지마다 메모리가 쌓임
+            page.close()
+
+    def has_text(self, index, bbox):
+        """
+        페이지의 지정 영역에 텍스트가 있는지 확인
+
+        Args:
+            index (int): 페이지 인덱스 (0-based)
+            bbox (tuple): 확인할 영역 (페이지 크기 대비 비율)
+
+        Returns:
+            bool: 영역에 걸친 문자가 하나라도 있으면 True
+        """
+        page = self.pdf.pages[index]
+        try:
+            # 잘라낸 영역 경계에 걸친 줄은 어느 쪽 within_bbox에도 들어가지 않으므로 겹치는 문자까지 확인
+            return bool(page.crop(scale_bbox(bbox, page.bbox)).chars)
+        finally:
+            page.close()
+
+    def close(self):
+        self.pdf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class PdfiumDocument(PdfplumberDocument):
+    """
+    pypdfium2 기반 페이지 텍스트 백엔드 (pdfplumber 0.11 설치 시 함께 설치됨)
+    문자 박스 좌표로 단어/줄을 재구성하여 pdfplumber와 같은 줄 구조를 만듭니다.
+    """
+    name = "pdfium"
+
+    def __init__(self, pdf_path):
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_c
+        self._pdfium_c = pdfium_c
+        self.pdf = pdfium.PdfDocument(pdf_path)
+
+    def __len__(self):
+        return len(self.pdf)
+
+    def page_lines(self, index, bbox=None):
+        page = self.pdf[index]
+        textpage = page.get_textpage()
+        try:
+            page_width = page.get_width()
+            page_height = page.get_height()
+            if bbox:
+                region = scale_bbox(bbox, (0, 0, page_width, page_height))
+            words = []
+            text = []
+            word_x0 = word_top = prev_x0 = prev_x1 = None
+
+            for i in range(textpage.count_chars()):
+                code = self._pdfium_c.FPDFText_GetUnicode(textpage.raw, i)
+                char = chr(code) if code else " "
+                if char.isspace():
+                    # 공백/줄바꿈 문자는 단어 경계
+                    if text:
+                        words.append((word_x0, word_top, "".join(text)))
+                        text = []
+                    continue
+
+                left, bottom, right, top = textpage.get_charbox(i, loose=True)
+                # pdfplumber와 같은 위쪽 기준 좌표로 변환
+                top = page_height - top
+                bottom = page_height - bottom
+
+                # 영역 밖의 문자는 건너뜀 (단어 경계로 처리)
+                if bbox and (left < region[0] or top < region[1] or right > region[2] or bottom > region[3]):
+                    if text:
+                        words.append((word_x0, word_top, "".join(text)))
+                        text = []
+                    continue
+
+                # 간격이 x_tolerance보다 크거나, 왼쪽으로 돌아가거나, 다른 줄이면 새 단어
+                if text and (left - prev_x1 > X_TOLERANCE or left < prev_x0
+                             or abs(top - word_top) > Y_TOLERANCE):
+                    words.append((word_x0, word_top, "".join(text)))
+                    text = []
+                if not text:
+                    word_x0, word_top = left, top
+                text.append(char)
+                prev_x0, prev_x1 = left, right
+
+            if text:
+                words.append((word_x0, word_top, "".join(text)))
+            return words_to_lines(words)
+        finally:
+            textpage.close()
+            page.close()
+
+    def has_text(self, index, bbox):
+        page = self.pdf[index]
+        textpage = page.get_textpage()
+        try:
+            page_height = page.get_height()
+            x0, top, x1, bottom = scale_bbox(bbox, (0, 0, page.get_width(), page_height))
+            # get_text_bounded는 PDF 좌표(아래쪽 기준)를 사용
+            return bool(textpage.get_text_bounded(x0, page_height - bottom, x1, page_height - top).strip())
+        finally:
+            textpage.close()
+            page.close()
+
+class MupdfDocument(PdfplumberDocument):
+    """
+    PyMuPDF(fitz) 기반 페이지 텍스트 백엔드
+    단어 좌표로 줄을 재구성하여 pdfplumber와 같은 줄 구조를 만듭니다.
+    """
+    name = "mupdf"
+
+    def __init__(self, pdf_path):
+        import fitz  # PyMuPDF
+        if isinstance(pdf_path, bytes):
+            self.pdf = fitz.open(stream=pdf_path, filetype="pdf")
+        else:
+            self.pdf = fitz.open(pdf_path)
+
+    def __len__(self):
+        return self.pdf.page_count
+
+    def page_lines(self, index, bbox=None):
+        page = self.pdf[index]
+        clip = scale_bbox(bbox, tuple(page.rect)) if bbox else None
+        words = page.get_text("words", clip=clip)
+        return words_to_lines([(word[0], word[1], word[4]) for word in words])
+
+    def has_text(self, index, bbox):
+        page = self.pdf[index]
+        return bool(page.get_text("words", clip=scale_bbox(bbox, tuple(page.rect))))
+
+# 선택 가능한 텍스트 추출 백엔드
+BACKENDS = {
+    PdfplumberDocument.name: PdfplumberDocument,
+    PdfiumDocument.name: PdfiumDocument,
+    MupdfDocument.name: MupdfDocument,
+}
+
+def open_document(pdf_path, backend=DEFAULT_BACKEND):
+    """
+    선택한 백엔드로 PDF를 여는 함수
+
+    Args:
+        pdf_path (str | bytes): PDF 파일 경로 또는 PDF 내용
+        backend (str): 'pdfplumber', 'pdfium', 'mupdf' 중 하나
+
+    Returns:
+        PdfplumberDocument: len()과 page_lines(index)를 제공하는 문서 객체
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 텍스트 백엔드입니다: {backend} (사용 가능: {', '.join(BACKENDS)})")
+    return BACKENDS[backend](pdf_path)
+
+def is_valid_region_text(doc, index, lines, region, bbox):
+    """
+    잘라낸 영역의 텍스트가 전체 페이지 추출과 같은 파싱 결과를 낼 수 있는지 검증하는 함수
+    1) 헤더 줄 위치에 헤더 표시 문자열이 있어야 함
+    2) 파서는 결과 블록을 바닥글 전까지 모두 읽으므로, 잘린 영역 아래~바닥글 위에 텍스트가 없어야 함
+
+    Args:
+        doc: open_document()로 연 문서 객체
+        index (int): 페이지 인덱스 (0-based)
+        lines (list): 잘라낸 영역에서 추출한 줄 리스트
+        region (dict): REGION_PROFILES의 프로파일
+        bbox (tuple): 잘라낸 영역 (페이지 크기 대비 비율)
+
+    Returns:
+        bool: 검증 통과 여부
+    """
+    header_index = region["header_index"][0 if index == 0 else 1]
+    if len(lines) <= header_index:
+        return False
+    if not any(marker in lines[header_index] for marker in region["header_markers"]):
+        return False
+
+    if bbox[3] < region["footer_top"]:
+        # 잘린 영역 아래에 결과 줄이 더 있을 수 있으면 검증 실패
+        below = (bbox[0], bbox[3], bbox[2], region["footer_top"])
+        if doc.has_text(index, below):
+            return False
+    return True
+
+def extract_region_lines(doc, index, region):
+    """
+    프로파일의 영역(헤더 줄 + 결과 블록)만 잘라서 페이지 줄을 추출하는 함수
+    잘라낸 텍스트가 검증에 실패하면 전체 페이지를 다시 추출합니다.
+
+    Args:
+        doc: open_document()로 연 문서 객체
+        index (int): 페이지 인덱스 (0-based)
+        region (dict): REGION_PROFILES의 프로파일
+
+    Returns:
+        list: 줄 문자열 리스트
+    """
+    bbox = region["first_page_bbox"] if index == 0 else region["other_page_bbox"]
+    lines = doc.page_lines(index, bbox)
+    if is_valid_region_text(doc, index, lines, region, bbox):
+        return lines
+    # 검증 실패 시 전체 페이지 추출로 대체
+    return doc.page_lines(index)
+
+def _read_page(doc, index, region=None):
+    """영역 프로파일이 있으면 잘라서, 없으면 전체 페이지를 추출"""
+    if region:
+        return extract_region_lines(doc, index, region)
+    return doc.page_lines(index)
+
+def file_sha256(pdf_path):
+    """
+    PDF 파일 내용의 SHA-256 해시를 계산하는 함수
+
+    Args:
+        pdf_path (str | bytes): PDF 파일 경로 또는 PDF 내용
+
+    Returns:
+        str: 64자리 hex 문자열
+    """
+    if isinstance(pdf_path, bytes):
+        return hashlib.sha256(pdf_path).hexdigest()
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def page_digests(pdf_path):
+    """
+    페이지별 내용 해시를 계산하는 함수 (텍스트 추출 없이 페이지 내용 스트림만 읽으므로 빠름)
+    내용 스트림, 페이지 크기, 글꼴 이름이 같으면 같은 해시가 됩니다.
+    누적 PDF에서 이미 처리한 앞쪽 페이지를 알아낼 때 사용합니다.
+
+    Args:
+        pdf_path (str | bytes): PDF 파일 경로 또는 PDF 내용
+
+    Returns:
+        list: 페이지별 SHA-256 hex 문자열 리스트
+    """
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdftypes import resolve1
+
+    digests = []
+    with (io.BytesIO(pdf_path) if isinstance(pdf_path, bytes) else open(pdf_path, 'rb')) as f:
+        for page in PDFPage.create_pages(PDFDocument(PDFParser(f))):
+            digest = hashlib.sha256(repr(page.mediabox).encode('utf-8'))
+            # 하위 글꼴(subset)이 바뀌면 같은 내용 스트림도 다른 글자가 되므로 글꼴 이름도 포함
+            fonts = resolve1((page.resources or {}).get('Font')) or {}
+            for name in sorted(fonts):
+                base_font = resolve1(fonts[name]).get('BaseFont')
+                digest.update(f"{name}={base_font}".encode('utf-8'))
+            contents = page.contents if isinstance(page.contents, list) else [page.contents]
+            for stream in contents:
+                stream = resolve1(stream)
+                if stream is not None:
+                    digest.update(stream.get_data())
+            digests.append(digest.hexdigest())
+    return digests
+
+class PageTextCache:
+    """
+    추출된 페이지 텍스트를 디스크에 보관하는 캐시
+    (PDF 해시, 백엔드, 영역 프로파일)마다 gzip 압축 JSONL 파일 하나에 페이지별 줄 리스트를 한 줄씩 저장합니다.
+    첫 줄은 {"page_count": N}, 이후 줄은 {"page": 페이지 인덱스, "lines": [...]} 형태입니다.
+    """
+    def __init__(self, cache_dir, max_bytes=PAGE_CACHE_MAX_BYTES, max_age=PAGE_CACHE_MAX_AGE):
+        self.store = DiskCache(cache_dir, max_bytes=max_bytes, max_age=max_age, suffix=".jsonl.gz")
+
+    def key(self, pdf_hash, backend, region=None):
+        """
+        캐시 키 생성
+
+        Args:
+            pdf_hash (str): PDF 파일 SHA-256
+            backend (str): 텍스트 추출 백엔드 이름
+            region (dict): 영역 프로파일 (None이면 전체 페이지)
+
+        Returns:
+            str: 캐시 키
+        """
+        region_key = json.dumps(region, sort_keys=True) if region else ""
+        return make_key(PAGE_TEXT_VERSION, pdf_hash, backend, region_key)
+
+    def load(self, key):
+        """
+        캐시된 페이지들을 읽는 함수
+
+        Returns:
+            tuple: (page_count, {페이지 인덱스: 줄 리스트}), 캐시가 없으면 (None, {})
+        """
+        data = self.store.get(key)
+        if data is None:
+            return None, {}
+        try:
+            records = gzip.decompress(data).decode('utf-8').splitlines()
+            page_count = json.loads(records[0])["page_count"]
+            pages = {}
+            for record in records[1:]:
+                item = json.loads(record)
+                pages[item["page"]] = item["lines"]
+            return page_count, pages
+        except (OSError, ValueError, KeyError, IndexError):
+            # 손상된 캐시는 없는 것으로 처리
+            return None, {}
+
+    def open_pages(self, key):
+        """
+        캐시된 페이지들을 한 페이지씩 읽는 함수 (load()와 달리 전체를 메모리에 올리지 않음)
+
+        Returns:
+            tuple: (page_count, (페이지 인덱스, 줄 리스트) 제너레이터), 캐시가 없으면 (None, 빈 제너레이터)
+                제너레이터는 손상된 기록을 만나면 거기서 멈추고, 다 읽거나 close()하면 캐시 파일을 닫습니다.
+        """
+        f = self.store.open(key)
+        if f is None:
+            return None, _read_records(None, None)
+        stream = gzip.GzipFile(fileobj=f)
+        try:
+            page_count = json.loads(stream.readline())["page_count"]
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            f.close()
+            return None, _read_records(None, None)
+        return page_count, _read_records(f, stream)
+
+    def writer(self, key, page_count):
+        """
+        캐시 항목을 페이지 순서대로 나눠 쓰는 객체를 만드는 함수 (save()와 달리 전체 페이지를 모아 두지 않음)
+
+        Returns:
+            PageCacheWriter: 쓰기 객체, 캐시 디렉터리에 쓸 수 없으면 None
+        """
+        try:
+            return PageCacheWriter(self.store, key, page_count)
+        except OSError:
+            return None
+
+    def save(self, key, page_count, pages):
+        """
+        페이지들을 캐시에 저장하는 함수 (기존 항목을 덮어씀)
+
+        Args:
+            key (str): 캐시 키
+            page_count (int): PDF 전체 페이지 수
+            pages (dict): {페이지 인덱스: 줄 리스트}
+        """
+        records = [json.dumps({"page_count": page_count})]
+        for index in sorted(pages):
+            records.append(json.dumps({"page": index, "lines": pages[index]}, ensure_ascii=False))
+        self.store.put(key, gzip.compress("\n".join(records).encode('utf-8')))
+
+def _read_records(f, stream):
+    """open_pages()의 페이지 기록 제너레이터 (f가 None이면 빈 제너레이터)"""
+    if f is None:
+        return
+    try:
+        for record in stream:
+            item = json.loads(record)
+            yield item["page"], item["lines"]
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        # 손상된 뒤쪽 기록은 없는 것으로 처리
+        return
+    finally:
+        f.close()
+
+class PageCacheWriter:
+    """
+    PageTextCache 항목을 페이지 순서대로 한 줄씩 쓰는 객체 (save()와 같은 형식)
+    commit()해야 캐시에 저장되고, 쓰는 중 오류가 나면 항목을 버립니다.
+    """
+    def __init__(self, store, key, page_count):
+        self.store = store
+        self.key = key
+        self.tmp_path, self._file = store.temp_file()
+        self._stream = gzip.GzipFile(fileobj=self._file, mode='wb')
+        self._write({"page_count": page_count})
+
+    def _write(self, record):
+        if self._stream is None:
+            return
+        try:
+            self._stream.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+        except OSError:
+            self.discard()
+
+    def add(self, index, lines):
+        """페이지 기록 추가 (페이지 인덱스 순서대로 호출)"""
+        self._write({"page": index, "lines": lines})
+
+    def _close(self):
+        try:
+            self._stream.close()
+            self._file.close()
+        finally:
+            self._stream = None
+
+    def commit(self):
+        """쓴 항목을 캐시에 저장"""
+        if self._stream is None:
+            return
+        try:
+            self._close()
+        except OSError:
+            self.discard()
+            return
+        self.store.put_file(self.key, self.tmp_path)
+
+    def discard(self):
+        """쓰던 항목 버리기"""
+        if self._stream is not None:
+            try:
+                self._close()
+            except OSError:
+                pass
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+def default_page_cache():
+    """
+    기본 페이지 텍스트 캐시를 반환하는 함수
+    REAF_PAGE_CACHE_DIR 환경변수로 위치를 바꿀 수 있고, REAF_PAGE_CACHE=0이면 캐시를 사용하지 않습니다.
+
+    Returns:
+        PageTextCache: 캐시 객체, 비활성화된 경우 None
+    """
+    if os.environ.get("REAF_PAGE_CACHE", "1") == "0":
+        return None
+    cache_dir = os.environ.get("REAF_PAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "reaf_page_cache"))
+    return PageTextCache(cache_dir)
+
+def resolve_page_cache(page_cache):
+    """
+    converter의 page_cache 인자를 캐시 객체로 변환 (True: 기본 캐시, False/None: 사용 안 함)
+    """
+    if page_cache is True:
+        return default_page_cache()
+    return page_cache or None
+
+class PageReader:
+    """
+    페이지 텍스트 캐시를 먼저 확인하고, 캐시에 없는 페이지만 실제 백엔드로 추출하는 문서 래퍼
+    캐시가 모든 페이지를 갖고 있으면 PDF를 열지 않습니다. 새로 추출한 페이지는 close() 시 캐시에 저장됩니다.
+    """
+    def __init__(self, pdf_path, backend=DEFAULT_BACKEND, region=None, cache=None):
+        self.pdf_path = pdf_path
+        self.backend = backend
+        self.region = region
+        self.cache = cache
+        self._doc = None
+        self._dirty = False
+        self.pages = {}
+        self.page_count = None
+
+        if cache is not None:
+            self.key = cache.key(file_sha256(pdf_path), backend, region)
+            self._load_cache()
+        if self.page_count is None:
+            self.page_count = len(self._open())
+
+    def _load_cache(self):
+        self.page_count, self.pages = self.cache.load(self.key)
+
+    def _open(self):
+        if self._doc is None:
+            self._doc = open_document(self.pdf_path, self.backend)
+        return self._doc
+
+    def __len__(self):
+        return self.page_count
+
+    def missing_pages(self):
+        """캐시에 없는 페이지 인덱스 리스트"""
+        return [i for i in range(self.page_count) if i not in self.pages]
+
+    def store(self, indices, page_lines):
+        """다른 곳(병렬 워커)에서 추출한 페이지들을 등록"""
+        for index, lines in zip(indices, page_lines):
+            self.pages[index] = lines
+        self._dirty = True
+
+    def page_lines(self, index):
+        """
+        페이지의 줄 리스트 반환 (캐시에 없으면 추출)
+
+        Args:
+            index (int): 페이지 인덱스 (0-based)
+
+        Returns:
+            list: 줄 문자열 리스트
+        """
+        if index not in self.pages:
+            self.pages[index] = _read_page(self._open(), index, self.region)
+            self._dirty = True
+        return self.pages[index]
+
+    def close(self):
+        if self.cache is not None and self._dirty:
+            self.cache.save(self.key, self.page_count, self.pages)
+            self._dirty = False
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class PageStream(PageReader):
+    """
+    페이지를 앞에서부터 묶음 단위로 순서대로 읽는 PageReader (긴 보고서의 스트리밍 변환용)
+    fetch()로 묶음의 캐시 기록을 읽고, 다 쓴 페이지는 release()로 메모리에서 지우므로
+    보고서 길이와 상관없이 미리 읽어 둔 몇 묶음의 페이지만 메모리에 남습니다.
+    캐시 항목도 한 줄씩 읽고, 새로 추출한 페이지가 있으면 새 캐시 항목을 한 줄씩 써서
+    마지막 페이지까지 읽은 뒤 close()하면 저장합니다.
+    """
+    def _load_cache(self):
+        # 캐시 항목의 (인덱스, 줄 리스트) 이터레이터와 미리 읽은 기록
+        self.page_count, self._cached = self.cache.open_pages(self.key)
+        self._next = None
+
+    def __init__(self, pdf_path, backend=DEFAULT_BACKEND, region=None, cache=None):
+        self._cached = _read_records(None, None)
+        self._next = None
+        self._writer = None
+        # 이 인덱스 앞의 페이지는 넘겨주고 메모리에서 지움
+        self._released = 0
+        super().__init__(pdf_path, backend, region, cache)
+
+    def fetch(self, start, stop):
+        """
+        start~stop 페이지의 캐시 기록을 읽어 두는 함수 (앞 페이지부터 순서대로, 앞 묶음을 release()하기 전에도 호출 가능)
+        start 앞의 건너뛴 캐시 기록은 새 캐시 항목을 쓰는 중일 때만 옮겨 씁니다.
+        처음부터 읽지 않을 때는 먼저 release(start)로 앞쪽 페이지를 넘겨준 것으로 표시합니다.
+        """
+        while True:
+            if self._next is None:
+                self._next = next(self._cached, None)
+                if self._next is None:
+                    return
+            index, lines = self._next
+            if index >= stop:
+                return
+            if index >= start:
+                self.pages[index] = lines
+            elif self._writer is not None:
+                self._writer.add(index, lines)
+            self._next = None
+
+    def release(self, stop):
+        """
+        stop 앞의 페이지를 메모리에서 지우는 함수
+        새로 추출한 페이지가 있으면 (처음이면 앞쪽 캐시 기록을 옮겨 쓴 뒤) 새 캐시 항목에 순서대로 기록합니다.
+        """
+        if self._dirty and self._writer is None and self.cache is not None:
+            self._writer = self.cache.writer(self.key, self.page_count)
+            if self._writer is not None:
+                # 이미 넘겨준 앞쪽 페이지는 기존 캐시 항목에서 다시 읽어 옮겨 씀
+                _, previous = self.cache.open_pages(self.key)
+                for index, lines in previous:
+                    if index >= self._released:
+                        break
+                    self._writer.add(index, lines)
+                previous.close()
+        for index in sorted(i for i in self.pages if i < stop):
+            lines = self.pages.pop(index)
+            if self._writer is not None:
+                self._writer.add(index, lines)
+        self._released = max(self._released, stop)
+
+    def close(self):
+        # 마지막 페이지까지 읽었을 때만 새 캐시 항목 저장 (중간에 멈췄으면 뒤쪽 페이지가 빠지므로 버림)
+        if self._writer is not None:
+            if self._released >= self.page_count:
+                self._writer.commit()
+            else:
+                self._writer.discard()
+            self._writer = None
+        self._cached.close()
+        self._dirty = False
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+def split_page_ranges(total_pages, chunk_count):
+    """
+    전체 페이지를 연속된 범위로 나누는 함수
+
+    Args:
+        total_pages (int): 전체 페이지 수
+        chunk_count (int): 나눌 범위 개수
+
+    Returns:
+        list: (start, stop) 튜플 리스트 (페이지 순서대로)
+    """
+    chunk_count = max(1, min(chunk_count, total_pages))
+    base, extra = divmod(total_pages, chunk_count)
+    ranges = []
+    start = 0
+    for i in range(chunk_count):
+        stop = start + base + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def _spill_source(pdf_path):
+    """
+    워커에 넘길 PDF 입력을 정하는 함수
+    bytes는 작업마다 피클링해서 보내지 않도록 임시 파일에 한 번만 쓰고 그 경로를 넘깁니다.
+
+    Returns:
+        tuple: (워커에 넘길 파일 경로 또는 PDF 내용, 다 쓰고 지울 임시 파일 경로 또는 None)
+    """
+    if not isinstance(pdf_path, bytes):
+        return pdf_path, None
+    fd, path = tempfile.mkstemp(prefix="reaf_", suffix=".pdf")
+    with os.fdopen(fd, "wb") as f:
+        f.write(pdf_path)
+    return path, path
+
+# _ProcessPool 워커 프로세스가 처음 한 번 열어 두는 문서
+_pool_document = None
+
+def _open_pool_document(pdf_path, backend):
+    """_ProcessPool 워커 프로세스 시작 시 실행: PDF를 한 번만 열어 두고 모든 작업에서 다시 씀"""
+    global _pool_document
+    _pool_document = open_document(pdf_path, backend)
+
+def _extract_pool_pages(indices, region):
+    """_ProcessPool 워커 프로세스에서 실행되는 함수: 열어 둔 문서에서 지정된 페이지들의 줄을 추출"""
+    return [_read_page(_pool_document, i, region) for i in indices]
+
+class _ProcessPool:
+    """
+    ProcessPoolExecutor 하나로 페이지들을 워커 수 * CHUNKS_PER_WORKER 범위로 나눠 추출 (IsolatedPool과 같은 사용법)
+    각 워커는 시작할 때 PDF를 한 번만 열어서 작업마다 다시 열지 않습니다.
+    """
+    def __init__(self, pdf_path, backend, region, workers):
+        self.region = region
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_open_pool_document,
+                                            initargs=(pdf_path, backend))
+
+    def submit(self, indices):
+        ranges = split_page_ranges(len(indices), self.workers * CHUNKS_PER_WORKER)
+        chunks = [indices[chunk_start:chunk_stop] for chunk_start, chunk_stop in ranges]
+        return [(chunk, self.executor.submit(_extract_pool_pages, chunk, self.region)) for chunk in chunks]
+
+    def poll(self, timeout=0):
+        # 워커 프로세스가 알아서 진행하므로 할 일 없음
+        return False
+
+    def result(self, job):
+        pages = {}
+        for chunk, future in job:
+            pages.update(zip(chunk, future.result()))
+        return pages, {}
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+class PageExtractor:
+    """
+    reader에 없는 페이지를 병렬 또는 격리 워커에 맡겨 추출하는 객체
+    워커(ProcessPoolExecutor 또는 격리 워커 한 벌)는 처음 필요할 때 한 번만 만들어서 보고서 전체에 다시 쓰고,
+    bytes 입력은 그때 임시 파일에 한 번만 씁니다.
+    submit()으로 페이지 범위를 미리 맡겨 두고 collect()로 결과를 reader에 등록합니다.
+    병렬/격리를 사용하지 않거나 남은 페이지가 적으면 맡기지 않고, 남은 페이지는 reader.page_lines()가 순차 추출합니다.
+    """
+    def __init__(self, reader, pdf_path, parallel, max_workers, backend, region, isolate, failures):
+        self.reader = reader
+        self.pdf_path = pdf_path
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.backend = backend
+        self.region = region
+        self.failures = failures
+        self.limits = None
+        if isolate:
+            from .isolation import resolve_limits
+            self.limits = resolve_limits(isolate)
+        self.pool = None
+        self.fallback_pool = None
+        self._source = None
+        self._temp_path = None
+
+    def _worker_source(self):
+        if self._source is None:
+            self._source, self._temp_path = _spill_source(self.pdf_path)
+        return self._source
+
+    def _start_pool(self, page_count):
+        """첫 작업의 페이지 수로 워커 수를 정해서 워커를 만듦, 맡기지 않고 순차 추출할 때는 None"""
+        workers = self.max_workers or os.cpu_count() or 1
+        workers = min(workers, page_count // MIN_PAGES_PER_WORKER)
+        if self.limits is not None:
+            from .isolation import IsolatedPool
+            workers = max(1, workers) if self.parallel else 1
+            return IsolatedPool(self._worker_source(), self.backend, self.region, self.limits, workers)
+        if self.parallel and workers >= 2:
+            # 병렬 처리: 각 워커가 PDF를 직접 열어서 자신이 맡은 페이지들만 추출
+            return _ProcessPool(self._worker_source(), self.backend, self.region, workers)
+        return None
+
+    def submit(self, start, stop):
+        """
+        start~stop 중 reader에 없는 페이지를 워커에 맡기는 함수 (reader.fetch() 뒤에 호출)
+
+        Returns:
+            collect()에 넘길 작업 (맡긴 페이지가 없으면 None)
+        """
+        missing = [i for i in range(start, stop) if i not in self.reader.pages]
+        if not missing:
+            return None
+        if self.pool is None:
+            self.pool = self._start_pool(len(missing))
+            if self.pool is None:
+                return None
+        return self.pool.submit(missing)
+
+    def poll(self):
+        """격리 워커에 다음 페이지를 맡기고 끝난 결과를 모음 (스트림이 페이지를 내보낼 때마다 호출)"""
+        if self.pool is not None:
+            self.pool.poll()
+
+    def collect(self, job):
+        """
+        submit()한 페이지들이 끝날 때까지 기다려서 reader에 등록하는 함수
+
+        Returns:
+            dict: 격리 추출에 실패한 페이지의 {페이지 인덱스: 대신 쓸 줄 리스트} (다른 백엔드 결과 또는 빈 페이지)
+        """
+        if job is None:
+            return {}
+        pages, failed = self.pool.result(job)
+        if pages:
+            self.reader.store(sorted(pages), [pages[i] for i in sorted(pages)])
+        if not failed:
+            return {}
+
+        # 실패한 페이지는 더 단순한 백엔드로 한 번 더 추출 (다른 백엔드 결과이므로 캐시에는 저장하지 않음)
+        from .isolation import FALLBACK_BACKENDS, IsolatedPool
+        fallback = FALLBACK_BACKENDS.get(self.backend)
+        recovered = {}
+        if fallback:
+            if self.fallback_pool is None:
+                self.fallback_pool = IsolatedPool(self._worker_source(), fallback, self.region, self.limits,
+                                                  self.pool.workers)
+            recovered, _ = self.fallback_pool.result(self.fallback_pool.submit(sorted(failed)))
+        for index in sorted(failed):
+            if self.failures is not None:
+                self.failures.append({'page': index + 1, 'error': failed[index],
+                                      'fallback': fallback if index in recovered else None})
+        return {index: recovered.get(index, []) for index in failed}
+
+    def close(self):
+        for pool in (self.pool, self.fallback_pool):
+            if pool is not None:
+                pool.close()
+        self.pool = self.fallback_pool = None
+        if self._temp_path is not None:
+            os.remove(self._temp_path)
+            self._temp_path = None
+        self._source = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def extract_page_lines(pdf_path, parallel=False, max_workers=None, backend=DEFAULT_BACKEND, region=None, cache=None,
+                       start=0, stop=None, isolate=None, failures=None):
+    """
+    PDF의 모든 페이지에서 텍스트를 추출하여 페이지별 줄 리스트로 반환하는 함수
+    parallel=True이면 페이지 범위를 ProcessPoolExecutor 워커들에게 나눠서 추출하고,
+    결과는 항상 페이지 순서대로 합쳐집니다.
+    region을 지정하면 각 페이지에서 헤더 줄과 결과 블록 영역만 추출합니다 (검증 실패 시 전체 페이지).
+    cache를 지정하면 캐시된 페이지는 추출하지 않고, 새로 추출한 페이지는 캐시에 저장합니다.
+    start/stop을 지정하면 그 범위의 페이지만 추출합니다 (누적 PDF의 새 페이지, 체크포인트 단위로 나눠 처리할 때).
+    isolate를 지정하면 페이지마다 시간/메모리 제한이 있는 격리된 워커 프로세스에서 추출하고,
+    실패한 페이지는 더 단순한 백엔드로 다시 추출합니다 (그래도 실패하면 빈 페이지, isolation 모듈 참고).
+
+    Args:
+        pdf_path (str | bytes | BinaryIO): PDF 파일 경로, PDF 내용 또는 파일 객체
+        parallel (bool): 병렬 추출 사용 여부
+        max_workers (int): 최대 워커 프로세스 수 (None이면 CPU 코어 수)
+        backend (str): 텍스트 추출 백엔드 ('pdfplumber', 'pdfium', 'mupdf')
+        region (str | dict): 영역 프로파일 이름('CC', 'IM') 또는 프로파일 dict (None이면 전체 페이지)
+        cache (PageTextCache): 페이지 텍스트 캐시 (None이면 사용 안 함)
+        start (int): 추출을 시작할 페이지 인덱스 (0-based)
+        stop (int): 추출을 끝낼 페이지 인덱스 (이 페이지는 제외, None이면 마지막 페이지까지)
+        isolate (bool | PageLimits): 격리 추출 (True: 기본 제한, None/False: 사용 안 함)
+        failures (list): 격리 추출에 실패한 페이지 기록
+            {'page': 페이지 번호(1부터), 'error': 오류 메시지, 'fallback': 다시 추출한 백엔드 또는 None}을 덧붙일 리스트
+
+    Returns:
+        list: 페이지별 줄 리스트 (page_lines[0]이 start 페이지)
+    """
+    if isinstance(region, str):
+        region = REGION_PROFILES[region]
+    pdf_path = read_source(pdf_path)
+
+    with PageReader(pdf_path, backend, region, cache) as reader, \
+            PageExtractor(reader, pdf_path, parallel, max_workers, backend, region, isolate, failures) as extractor:
+        stop = len(reader) if stop is None else min(stop, len(reader))
+        overrides = extractor.collect(extractor.submit(start, stop))
+        # 캐시/병렬 결과가 없는 페이지는 여기서 순차 추출 (항상 페이지 순서대로 반환)
+        return [overrides[i] if i in overrides else reader.page_lines(i) for i in range(start, stop)]
+
+def iter_page_lines(pdf_path, parallel=False, max_workers=None, backend=DEFAULT_BACKEND, region=None, cache=None,
+                    start=0, isolate=None, failures=None, chunk_pages=STREAM_CHUNK_PAGES):
+    """
+    extract_page_lines와 같은 페이지별 줄 리스트를 한 페이지씩 내보내는 제너레이터 (긴 보고서의 스트리밍 변환용)
+    chunk_pages 페이지씩 추출하고 내보낸 묶음은 메모리에서 지우므로, 보고서 길이와 상관없이
+    STREAM_LOOKAHEAD_CHUNKS 묶음의 페이지만 메모리에 남습니다 (캐시도 한 줄씩 읽고 씀, PageStream 참고).
+    병렬/격리 워커는 스트림 전체에서 한 벌만 쓰고, 묶음을 내보내는 동안 다음 묶음을 미리 맡겨서
+    추출과 파싱이 겹치게 합니다 (PageExtractor 참고).
+    옵션은 extract_page_lines와 같고, failures 기록은 해당 묶음의 페이지를 내보내기 전에 덧붙입니다.
+
+    Yields:
+        list: 페이지의 줄 리스트 (start 페이지부터 마지막 페이지까지 순서대로)
+    """
+    if isinstance(region, str):
+        region = REGION_PROFILES[region]
+    pdf_path = read_source(pdf_path)
+
+    with PageStream(pdf_path, backend, region, cache) as reader, \
+            PageExtractor(reader, pdf_path, parallel, max_workers, backend, region, isolate, failures) as extractor:
+        reader.release(start)
+        chunk_starts = iter(range(start, len(reader), chunk_pages))
+        jobs = deque()
+        while True:
+            # 내보낼 묶음과 다음 묶음을 워커에 맡겨 둠 (캐시 기록도 묶음 순서대로 미리 읽음)
+            while len(jobs) < STREAM_LOOKAHEAD_CHUNKS:
+                chunk_start = next(chunk_starts, None)
+                if chunk_start is None:
+                    break
+                chunk_stop = min(chunk_start + chunk_pages, len(reader))
+                reader.fetch(chunk_start, chunk_stop)
+                jobs.append((chunk_start, chunk_stop, extractor.submit(chunk_start, chunk_stop)))
+            if not jobs:
+                return
+
+            chunk_start, chunk_stop, job = jobs.popleft()
+            overrides = extractor.collect(job)
+            for index in range(chunk_start, chunk_stop):
+                extractor.poll()
+                yield overrides[index] if index in overrides else reader.page_lines(index)
+            reader.release(chunk_stop)
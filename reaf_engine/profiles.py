@@ -0,0 +1,341 @@
+"""
+장비(analyzer)/모드별 변환 프로파일
+
+각 프로파일은 페이지 종류(첫 페이지 / 나머지 페이지)별로
+헤더 줄 위치와 헤더 파서, 결과 블록 시작 줄과 결과 문법을 지정하는 데이터입니다.
+결과 블록은 start_line부터 결과 문법의 end_marker 줄(바닥글) 전까지이며, 줄 수 제한은 없습니다.
+파서 이름은 parsers.HEADER_PARSERS / parsers.RESULT_PARSERS의 키이고,
+'parser' 외의 항목은 헤더 파서 함수 또는 결과 문법(parsers.RESULT_GRAMMARS)에 키워드 인자로 전달됩니다.
+결과 문법은 프로파일을 불러올 때 정규식/집합으로 미리 컴파일합니다.
+
+프로파일은 JSON으로 표현할 수 있으므로, 새 장비 펌웨어의 레이아웃은 코드 수정 없이
+프로파일 파일({"format": 1, "profiles": [...]})을 REAF_PROFILE_PATH 환경변수로 지정해서 추가할 수 있습니다.
+레이아웃을 바꾼 프로파일은 layout_version을 올립니다 (체크포인트/증분 변환 상태가 다시 만들어짐).
+"""
+import json
+import os
+import re
+
+from .parsers import HEADER_PARSERS, KEY_FIELDS, RESULT_PARSERS, Row, compile_rule
+
+# 프로파일 파일 형식 버전
+PROFILE_FORMAT = 1
+
+# 결과 블록이 끝나는 줄: 페이지 바닥글 ("Page 3 / 12", "Page 3 of 12")
+# 줄 전체가 바닥글일 때만 끝으로 보도록 줄 끝까지 고정 ("Page 2024/03/01 ..."로 시작하는 결과 줄은 제외)
+RESULT_END_MARKER = r"Page\s+\d+\s*(?:/|of)\s*\d+\s*$"
+
+# 모드별 헤더 줄(샘플 줄) 형식 - 줄 앞에서부터 맞춰 보므로 줄 중간의 "Patient ID :" 같은 문구로는 모드가 바뀌지 않음
+# - ID(Barcode): "Sample ID : 12345 ..." (CC), "SerumPlasma 50016-1 ID : 187 ..." (IM)
+# - Seq(Sequence): "Ser/PI 000123 Routine ..." (CC/IM), "SerumPlasma 000123 Routine ..." (IM)
+MODE_HEADER_PATTERNS = {
+    "ID": re.compile(r"\s*(?:Sample\s+ID|SerumPlasma\s+\S+\s+ID)\s*:"),
+    "Seq": re.compile(r"\s*(?:Ser/PI|SerumPlasma)\s+\S+(?!\S)(?!\s+ID\s*:)"),
+}
+
+# CC 결과 다음 줄이 Unit 줄인지 판단할 때 사용하는 단위 목록 (줄 어디에든 있으면 Unit 줄)
+CC_UNITS = ['mg/dL', 'g/dL', 'mmol/L', 'U/L', '%']
+
+# cobas pro c (CC) 결과 블록 문법
+CC_RESULTS = {
+    "parser": "cc",
+    # "+" 또는 "ISE"로 시작하거나, 대문자 테스트명 뒤에 숫자 결과
+    "result_pattern": r"\+|ISE|[A-Z][A-Z0-9\-]*\s+[\d\.]",
+    # "R2"/"R3"로 시작하는 시약 줄은 생략
+    "skip_words": ["R2", "R3"],
+    "end_marker": RESULT_END_MARKER,
+    "units": CC_UNITS,
+    # "ISE K 4.5"처럼 두 단어가 테스트명
+    "two_word_tests": ["ISE"],
+    # Unit 줄 두번째 단어가 NACL이면 세번째 단어가 AU, 다섯번째 단어가 R.P Lot
+    "shift_marker": "NACL",
+}
+
+# cobas pro e (IM) 결과 블록 문법
+IM_RESULTS = {
+    "parser": "im",
+    # "+"로 시작하거나, 대문자로 시작하는 영문/숫자/하이픈 조합
+    "result_pattern": r"\+|[A-Z][A-Z0-9\-]",
+    "skip_words": ["R2", "R3"],
+    "end_marker": RESULT_END_MARKER,
+    # 테스트명 첫 단어 뒤의 1자리 숫자나 v숫자/V숫자 단어도 테스트명 ("FT4 3", "HBSAG v2")
+    "name_suffix": r"\d|[vV]\d+",
+    "shift_marker": "NACL",
+    # Unit이 COI이면 다음 줄의 NonReac/Reac 판정을 R/NR 컬럼에 기록
+    "reaction_unit": "COI",
+    "reactions": ["NonReac", "Reac"],
+}
+
+# 모든 모드에 공통인 결과 컬럼 (key 컬럼 다음에 위치)
+COMMON_COLUMNS = [
+    ('test_name', 'Test Name'),
+    ('result', 'Result'),
+    ('unit', 'Unit'),
+    ('au', 'AU'),
+    ('rp_lot', 'R.P Lot'),
+    ('data_alarm', 'Data Alarm'),
+    ('rerun', 'Rerun'),
+    ('date', 'Date'),
+]
+
+PROFILES = {
+    # cobas pro c (c503, c703) - Barcode 모드
+    "CC_ID": {
+        "name": "CC_ID",
+        "analyzer": "CC",
+        "mode": "ID",
+        "layout_version": 1,
+        "key_field": "sample_id",
+        "key_label": "Sample ID",
+        "extra_columns": [],
+        "first_page": {
+            "header_index": 7,
+            "header": {"parser": "id_colon"},
+            "start_line": 12,
+            "results": CC_RESULTS,
+        },
+        "other_pages": {
+            "header_index": 4,
+            "header": {"parser": "id_colon"},
+            "start_line": 9,
+            "results": CC_RESULTS,
+        },
+        "terminal_blank_lines": False,
+        "open_after_save": False,
+    },
+    # cobas pro c (c503, c703) - Sequence 모드
+    "CC_Seq": {
+        "name": "CC_Seq",
+        "analyzer": "CC",
+        "mode": "Seq",
+        "layout_version": 1,
+        "key_field": "seq_no",
+        "key_label": "Seq No.",
+        "extra_columns": [],
+        "first_page": {
+            "header_index": 7,
+            "header": {"parser": "second_word", "markers": ["Ser/PI", "SerumPlasma"]},
+            "start_line": 12,
+            "results": CC_RESULTS,
+        },
+        "other_pages": {
+            "header_index": 4,
+            "header": {"parser": "second_word", "markers": ["Ser/PI"]},
+            "start_line": 9,
+            # 나머지 페이지의 "+" 결과 줄은 "+ 테스트명 결과 알람"까지 있어야 결과로 인식
+            "results": {**CC_RESULTS, "plus_min_parts": 4},
+        },
+        # 터미널 시트에 빈 줄까지 그대로 기록하고, 저장 후 엑셀 파일을 자동으로 열기
+        "terminal_blank_lines": True,
+        "open_after_save": True,
+    },
+    # cobas pro e (e801) - Barcode 모드
+    "IM_ID": {
+        "name": "IM_ID",
+        "analyzer": "IM",
+        "mode": "ID",
+        "layout_version": 1,
+        "key_field": "sample_id",
+        "key_label": "Sample ID",
+        "extra_columns": [('r_nr', 'R/NR')],
+        "first_page": {
+            "header_index": 7,
+            "header": {"parser": "serum_plasma"},
+            "start_line": 12,
+            "results": {**IM_RESULTS, "au_rule": "second"},
+        },
+        "other_pages": {
+            "header_index": 4,
+            "header": {"parser": "serum_plasma"},
+            "start_line": 9,
+            "results": {**IM_RESULTS, "au_rule": "second"},
+        },
+        "terminal_blank_lines": False,
+        "open_after_save": False,
+    },
+    # cobas pro e (e801) - Sequence 모드
+    "IM_Seq": {
+        "name": "IM_Seq",
+        "analyzer": "IM",
+        "mode": "Seq",
+        "layout_version": 1,
+        "key_field": "seq_no",
+        "key_label": "Seq No.",
+        "extra_columns": [('r_nr', 'R/NR')],
+        "first_page": {
+            "header_index": 7,
+            "header": {"parser": "second_word", "markers": ["Ser/PI", "SerumPlasma"]},
+            "start_line": 12,
+            "results": {**IM_RESULTS, "au_rule": "third"},
+        },
+        "other_pages": {
+            "header_index": 4,
+            "header": {"parser": "serum_plasma"},
+            "start_line": 9,
+            "results": {**IM_RESULTS, "au_rule": "third"},
+        },
+        "terminal_blank_lines": False,
+        "open_after_save": False,
+    },
+}
+
+# 프로파일 파일에서 생략할 수 있는 항목의 기본값
+PROFILE_DEFAULTS = {
+    "layout_version": 1,
+    "extra_columns": [],
+    "terminal_blank_lines": False,
+    "open_after_save": False,
+}
+
+PROFILE_KEYS = ("name", "analyzer", "mode", "key_field", "key_label", "first_page", "other_pages")
+PAGE_KEYS = ("header_index", "header", "start_line", "results")
+
+def check_profile(profile):
+    """
+    프로파일 데이터를 검사하고 결과 문법을 미리 컴파일하는 함수
+
+    Args:
+        profile (dict): 프로파일
+
+    Returns:
+        dict: 같은 프로파일
+
+    Raises:
+        ValueError: 필수 항목이 없거나, 파서 이름이나 행 필드가 없거나, 결과 문법을 컴파일할 수 없는 경우
+    """
+    name = profile.get('name', '?')
+    missing = [key for key in PROFILE_KEYS if key not in profile]
+    if missing:
+        raise ValueError(f"프로파일 {name}에 필요한 항목이 없습니다: {', '.join(missing)}")
+    if profile['key_field'] not in KEY_FIELDS:
+        raise ValueError(f"프로파일 {name}의 key_field는 {', '.join(KEY_FIELDS)} 중 하나여야 합니다: {profile['key_field']}")
+    unknown = [field for field, _ in profile.get('extra_columns', []) if field not in Row.__slots__]
+    if unknown:
+        raise ValueError(f"프로파일 {name}의 extra_columns에 알 수 없는 행 필드가 있습니다: {', '.join(unknown)}")
+    for page_kind in ("first_page", "other_pages"):
+        page = profile[page_kind]
+        missing = [key for key in PAGE_KEYS if key not in page]
+        if missing:
+            raise ValueError(f"프로파일 {name}의 {page_kind}에 필요한 항목이 없습니다: {', '.join(missing)}")
+        if page['header'].get('parser') not in HEADER_PARSERS:
+            raise ValueError(f"프로파일 {name}의 헤더 파서를 알 수 없습니다: {page['header'].get('parser')}")
+        if page['results'].get('parser') not in RESULT_PARSERS:
+            raise ValueError(f"프로파일 {name}의 결과 파서를 알 수 없습니다: {page['results'].get('parser')}")
+        try:
+            compile_rule(page['results'])
+        except Exception as e:
+            raise ValueError(f"프로파일 {name}의 결과 문법이 잘못되었습니다: {e}")
+    return profile
+
+def load_profiles(path):
+    """
+    프로파일 파일(JSON)을 읽는 함수
+    파일 형식: {"format": 1, "profiles": [프로파일, ...]} (디렉터리이면 안의 *.json 파일을 이름 순서로 모두 읽음)
+
+    Args:
+        path (str): 프로파일 파일 또는 디렉터리 경로
+
+    Returns:
+        dict: {프로파일 이름: 프로파일}
+
+    Raises:
+        ValueError: 파일을 읽을 수 없거나 형식이 맞지 않는 경우
+    """
+    if os.path.isdir(path):
+        profiles = {}
+        for filename in sorted(os.listdir(path)):
+            if filename.lower().endswith(".json"):
+                profiles.update(load_profiles(os.path.join(path, filename)))
+        return profiles
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"프로파일 파일을 읽을 수 없습니다: {path} ({e})")
+    if not isinstance(data, dict) or data.get('format') != PROFILE_FORMAT:
+        raise ValueError(f"지원하지 않는 프로파일 파일 형식입니다: {path} (format {PROFILE_FORMAT} 필요)")
+
+    profiles = {}
+    for item in data.get('profiles', []):
+        profile = check_profile({**PROFILE_DEFAULTS, **item})
+        profile['extra_columns'] = [tuple(column) for column in profile['extra_columns']]
+        profiles[profile['name']] = profile
+    return profiles
+
+# 기본 프로파일도 불러올 때 결과 문법을 컴파일하고, REAF_PROFILE_PATH(os.pathsep로 구분)의 프로파일 추가
+for _profile in PROFILES.values():
+    check_profile(_profile)
+for _path in os.environ.get("REAF_PROFILE_PATH", "").split(os.pathsep):
+    if _path:
+        PROFILES.update(load_profiles(_path))
+
+def get_profile(profile):
+    """
+    프로파일 이름 또는 프로파일 dict를 프로파일 dict로 변환
+
+    Args:
+        profile (str | dict): 프로파일 이름('CC_ID', 'CC_Seq', 'IM_ID', 'IM_Seq') 또는 프로파일 dict
+
+    Returns:
+        dict: 프로파일
+    """
+    if isinstance(profile, dict):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"알 수 없는 변환 프로파일입니다: {profile} (사용 가능: {', '.join(PROFILES)})")
+
+def find_profile(analyzer, mode):
+    """
+    장비/모드 조합에 맞는 프로파일 이름
+
+    Args:
+        analyzer (str): 'CC' 또는 'IM'
+        mode (str): 'ID' 또는 'Seq'
+
+    Returns:
+        str: 프로파일 이름, 없으면 None
+    """
+    for name, profile in PROFILES.items():
+        if profile['analyzer'] == analyzer and profile['mode'] == mode:
+            return name
+    return None
+
+def header_mode(line):
+    """
+    헤더 줄 형식으로 모드를 판단하는 함수 (MODE_HEADER_PATTERNS를 줄 앞에서부터 맞춰 봄)
+
+    Args:
+        line (str): 헤더 줄
+
+    Returns:
+        str: 'ID' 또는 'Seq', 어느 형식과도 맞지 않으면 None
+    """
+    for mode, pattern in MODE_HEADER_PATTERNS.items():
+        if pattern.match(line):
+            return mode
+    return None
+
+def mode_profiles(analyzer):
+    """
+    장비의 모든 모드 프로파일 이름 (Barcode/Sequence 시트를 한 번에 만들 때 사용)
+
+    Args:
+        analyzer (str): 'CC' 또는 'IM'
+
+    Returns:
+        list: 모드마다 첫 번째 프로파일 이름 리스트 (PROFILES 순서, 추가 레이아웃 프로파일은 제외)
+    """
+    names = {}
+    for name, profile in PROFILES.items():
+        if profile['analyzer'] == analyzer:
+            names.setdefault(profile['mode'], name)
+    return list(names.values())
+
+def excel_columns(profile):
+    """
+    결과 시트 컬럼 목록 [(행 필드 이름, 헤더명), ...]
+    """
+    return [(profile['key_field'], profile['key_label'])] + COMMON_COLUMNS + profile['extra_columns']
@@ -0,0 +1,306 @@
+"""
+폴더 감시 변환 서비스
+
+장비가 PDF를 내보내는 폴더(네트워크 공유 등)를 주기적으로 확인해서, 새 PDF가 다 써지면
+워커 프로세스 풀에서 변환하고 엑셀을 PDF 옆에 저장합니다.
+처리한 파일은 장부(ledger) 파일에 (크기, 수정 시각)과 함께 기록하므로 서비스를 다시 시작해도 다시 변환하지 않고,
+내용이 바뀐 PDF만 다시 변환합니다.
+
+    python -m reaf_engine.watch <감시 폴더> [--interval 2] [--settle 5] [--jobs N] [--profile auto]
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import BATCH_MAX_WORKERS
+from .cli import convert_to_file, is_up_to_date, write_atomic
+from .converter import DIAGNOSTICS_LEVELS
+from .isolation import PAGE_MEMORY_MB, PAGE_TIMEOUT, PageLimits
+from .pdf_pages import BACKENDS, DEFAULT_BACKEND
+from .profiles import PROFILES
+
+# 감시 폴더 안에 만드는 기본 장부 파일 이름
+LEDGER_NAME = ".reaf_ledger.json"
+
+# 장부 형식이 바뀌면 올려야 하는 버전 (버전이 다르면 장부를 새로 시작)
+LEDGER_VERSION = 1
+
+# 폴더 확인 주기(초)와, 파일 크기/수정 시각이 이 시간(초) 동안 그대로여야 다 써진 것으로 판단
+DEFAULT_INTERVAL = 2.0
+DEFAULT_SETTLE = 5.0
+
+# PDF 끝부분에서 %%EOF 표시를 찾을 범위 (바이트)
+EOF_SEARCH_BYTES = 2048
+
+def log(message):
+    """시각과 함께 표준 에러로 출력"""
+    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}", file=sys.stderr, flush=True)
+
+def file_signature(path):
+    """
+    파일 변경 판단용 (크기, 수정 시각 ns)
+
+    Returns:
+        tuple: (size, mtime_ns), 파일이 없으면 None
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def looks_complete(path):
+    """
+    PDF가 끝까지 써졌는지 확인 (파일 끝부분에 %%EOF 표시가 있는지)
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - EOF_SEARCH_BYTES))
+            return b"%%EOF" in f.read()
+    except OSError:
+        return False
+
+class Ledger:
+    """
+    처리한 PDF 기록 (JSON 파일)
+    PDF 절대 경로마다 {size, mtime_ns, status, output, profile, rows, error, time}를 저장하고,
+    기록할 때마다 임시 파일에 쓴 뒤 이름을 바꿔서 저장합니다.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == LEDGER_VERSION:
+                return data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def is_done(self, pdf_path, signature):
+        """같은 (크기, 수정 시각)으로 이미 처리한 PDF이면 True (실패한 파일도 바뀌기 전까지 다시 시도하지 않음)"""
+        entry = self.entries.get(os.path.abspath(pdf_path))
+        return entry is not None and (entry.get("size"), entry.get("mtime_ns")) == tuple(signature)
+
+    def record(self, pdf_path, signature, **info):
+        """
+        PDF 처리 결과를 기록하고 저장
+
+        Args:
+            pdf_path (str): PDF 경로
+            signature (tuple): 처리 시점의 (size, mtime_ns)
+            **info: status, output, profile, rows, error 등
+        """
+        self.entries[os.path.abspath(pdf_path)] = {
+            "size": signature[0],
+            "mtime_ns": signature[1],
+            **info,
+            "time": time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        self.save()
+
+    def save(self):
+        data = {"version": LEDGER_VERSION, "files": self.entries}
+        write_atomic(self.path, json.dumps(data, ensure_ascii=False, indent=1).encode('utf-8'))
+
+class FolderWatcher:
+    """
+    폴더를 주기적으로 확인하면서 다 써진 새 PDF를 워커 풀에서 변환하는 서비스
+
+    PDF는 (크기, 수정 시각)이 settle초 동안 바뀌지 않고 파일 끝에 %%EOF가 있을 때 변환합니다.
+    """
+    def __init__(self, folder, profile="auto", jobs=None, interval=DEFAULT_INTERVAL, settle=DEFAULT_SETTLE,
+                 recursive=False, ledger_path=None, **options):
+        """
+        Args:
+            folder (str): 감시할 폴더
+            profile (str): 변환 프로파일 이름 또는 'auto'
+            jobs (int): 워커 프로세스 수 (None이면 CPU 코어 수, BATCH_MAX_WORKERS 이하)
+            interval (float): 폴더 확인 주기 (초)
+            settle (float): 파일이 바뀌지 않아야 하는 시간 (초)
+            recursive (bool): 하위 폴더까지 감시
+            ledger_path (str): 장부 파일 경로 (None이면 감시 폴더의 .reaf_ledger.json)
+            **options: batch.convert_file 옵션 (backend, crop, page_cache, diagnostics 등)
+        """
+        self.folder = folder
+        self.profile = profile
+        self.workers = max(1, jobs or min(os.cpu_count() or 1, BATCH_MAX_WORKERS))
+        self.interval = interval
+        self.settle = settle
+        self.recursive = recursive
+        self.options = options
+        self.ledger = Ledger(ledger_path or os.path.join(folder, LEDGER_NAME))
+        # 다 써지기를 기다리는 파일: {경로: (signature, 처음 본 시각)}
+        self.pending = {}
+        # 변환 중인 파일: {경로: (future, signature)}
+        self.running = {}
+        # 마지막 확인 때 아직 바뀌고 있던(settle 시간이 지나지 않은) 파일 수
+        self.changing = 0
+        self.executor = None
+        self.stopping = False
+
+    def scan(self):
+        """감시 폴더의 PDF 경로 목록"""
+        found = []
+        for root, dirs, files in os.walk(self.folder):
+            for name in sorted(files):
+                if name.lower().endswith(".pdf"):
+                    found.append(os.path.join(root, name))
+            if not self.recursive:
+                break
+        return found
+
+    def output_path(self, pdf_path):
+        """PDF 옆에 저장할 엑셀 경로"""
+        return os.path.splitext(pdf_path)[0] + ".xlsx"
+
+    def collect(self):
+        """끝난 변환 결과를 장부에 기록"""
+        for pdf_path, (future, signature) in list(self.running.items()):
+            if not future.done():
+                continue
+            del self.running[pdf_path]
+            try:
+                item = future.result()
+            except BaseException as e:
+                # 워커 프로세스가 비정상 종료/중단된 경우: 장부에 기록하지 않고 다음 확인 때 다시 시도
+                log(f"[retry] {pdf_path} - 변환이 중단되었습니다: {e!r}")
+                continue
+            self.ledger.record(pdf_path, signature, status=item['status'], output=item['output'],
+                               profile=item['profile'], rows=item['rows'], error=item['error'])
+            log(f"[{item['status']}] {pdf_path} ({item['profile']}, {item['rows']} rows)"
+                + (f" - {item['error']}" if item['error'] else ""))
+
+    def poll(self):
+        """
+        폴더를 한 번 확인해서 다 써진 새 PDF를 워커 풀에 넣는 함수
+
+        Returns:
+            int: 새로 변환을 시작한 파일 수
+        """
+        self.collect()
+        now = time.monotonic()
+        started = 0
+        seen = set()
+        self.changing = 0
+
+        for pdf_path in self.scan():
+            seen.add(pdf_path)
+            if pdf_path in self.running:
+                continue
+            signature = file_signature(pdf_path)
+            if signature is None or signature[0] == 0 or self.ledger.is_done(pdf_path, signature):
+                self.pending.pop(pdf_path, None)
+                continue
+
+            # 처음 보거나 바뀐 파일은 settle초 동안 그대로인지 지켜봄
+            previous = self.pending.get(pdf_path)
+            if previous is None or previous[0] != signature:
+                self.pending[pdf_path] = (signature, now)
+                if self.settle > 0:
+                    self.changing += 1
+                    continue
+            elif now - previous[1] < self.settle:
+                self.changing += 1
+                continue
+            if not looks_complete(pdf_path):
+                # 크기는 그대로인데 %%EOF가 없으면 아직 쓰는 중이거나 깨진 파일: 바뀔 때까지 대기
+                continue
+            del self.pending[pdf_path]
+
+            output_path = self.output_path(pdf_path)
+            if is_up_to_date(pdf_path, output_path) and os.path.abspath(pdf_path) not in self.ledger.entries:
+                # 장부가 생기기 전에 이미 변환된 파일
+                self.ledger.record(pdf_path, signature, status='skipped', output=output_path, profile=None,
+                                   rows=None, error=None)
+                continue
+
+            future = self.executor.submit(convert_to_file, pdf_path, output_path, self.profile, **self.options)
+            self.running[pdf_path] = (future, signature)
+            started += 1
+
+        # 사라진 파일은 대기 목록에서 제거
+        for pdf_path in list(self.pending):
+            if pdf_path not in seen:
+                del self.pending[pdf_path]
+        return started
+
+    def stop(self, *_):
+        """다음 확인 주기에 멈추도록 표시 (시그널 핸들러로도 사용)"""
+        self.stopping = True
+
+    def run(self, once=False):
+        """
+        서비스 실행 (stop() 또는 Ctrl+C까지 반복, 멈출 때 진행 중인 변환은 끝까지 기다림)
+
+        Args:
+            once (bool): True이면 지금 있는 PDF만 처리하고 (바뀌고 있거나 변환 중인 파일이 없어지면) 종료
+        """
+        log(f"감시 시작: {os.path.abspath(self.folder)} (워커 {self.workers}개, 확인 주기 {self.interval}초)")
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            while not self.stopping:
+                self.poll()
+                if once and not self.changing and not self.running:
+                    break
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            log("감시 종료: 진행 중인 변환을 기다립니다...")
+            self.executor.shutdown(wait=True)
+            self.collect()
+            self.executor = None
+
+def build_parser():
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="python -m reaf_engine.watch",
+        description="폴더에 들어오는 cobas pro 보고서 PDF를 자동으로 엑셀로 변환합니다 (엑셀은 PDF 옆에 저장).",
+    )
+    parser.add_argument("folder", help="감시할 폴더")
+    parser.add_argument("-p", "--profile", default="auto", choices=["auto"] + list(PROFILES),
+                        help="변환 프로파일 (기본: auto - 첫 페이지로 장비/모드 감지)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="동시에 변환할 워커 프로세스 수")
+    parser.add_argument("-r", "--recursive", action="store_true", help="하위 폴더까지 감시")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="폴더 확인 주기 (초)")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE,
+                        help="파일 크기/수정 시각이 이 시간(초) 동안 그대로여야 변환 시작")
+    parser.add_argument("--ledger", default=None, help=f"장부 파일 경로 (기본: 감시 폴더의 {LEDGER_NAME})")
+    parser.add_argument("--once", action="store_true", help="지금 있는 PDF만 처리하고 종료")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=list(BACKENDS), help="텍스트 추출 백엔드")
+    parser.add_argument("--diagnostics", default="summary", choices=DIAGNOSTICS_LEVELS,
+                        help="엑셀에 넣을 진단 정보 수준 (기본: summary)")
+    parser.add_argument("--isolate", action="store_true",
+                        help="페이지마다 시간/메모리 제한이 있는 격리된 워커 프로세스에서 추출 (실패 페이지는 단순한 백엔드로 재시도)")
+    parser.add_argument("--page-timeout", type=float, default=PAGE_TIMEOUT,
+                        help=f"--isolate 사용 시 페이지당 추출 시간 제한 (초, 기본: {PAGE_TIMEOUT:g})")
+    parser.add_argument("--page-memory", type=int, default=PAGE_MEMORY_MB,
+                        help=f"--isolate 사용 시 추출 워커가 시작 후 더 쓸 수 있는 메모리 (MB, 기본: {PAGE_MEMORY_MB})")
+    return parser
+
+def main(argv=None):
+    """명령줄 진입점"""
+    args = build_parser().parse_args(argv)
+    if not os.path.isdir(args.folder):
+        print(f"오류: 폴더를 찾을 수 없습니다: {args.folder}", file=sys.stderr)
+        return 2
+
+    watcher = FolderWatcher(args.folder, profile=args.profile, jobs=args.jobs, interval=args.interval,
+                            settle=args.settle, recursive=args.recursive, ledger_path=args.ledger,
+                            backend=args.backend, diagnostics=args.diagnostics,
+                            isolate=PageLimits(args.page_timeout, args.page_memory) if args.isolate else False)
+    signal.signal(signal.SIGTERM, watcher.stop)
+    watcher.run(once=args.once)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
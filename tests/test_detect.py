@@ -0,0 +1,48 @@
+"""보고서 종류 자동 감지 (reaf_engine.detect) 테스트"""
+import pytest
+
+from reaf_engine.detect import classify_page, detect_profile_from_lines
+
+def first_page(header, results):
+    """헤더 줄이 8번째 줄, 결과 블록이 13번째 줄부터인 첫 페이지 줄들"""
+    lines = [f"cobas pro report line {n}" for n in range(1, 8)]
+    lines.append(header)
+    lines.extend(f"filler {n}" for n in range(4))
+    lines.extend(results)
+    return lines
+
+CC_RESULT_LINES = ["CHOL2-I 99.087", "U/L 1-2 x 34567 z", "GLUC3 101.2", "mg/dL 1-2 x 34567 z"]
+IM_RESULT_LINES = ["HBSAG v2 0.512", "COI 3-4 y 1234 q", "TSH 1.23", "uIU/mL 3-4 y 1234 q"]
+
+@pytest.mark.parametrize("header, results, expected", [
+    ("Sample ID : S10000 Routine 2024/03/01 10:00:00", CC_RESULT_LINES, "CC_ID"),
+    ("Ser/PI 000100 Routine 2024/03/01 10:00:00", CC_RESULT_LINES, "CC_Seq"),
+    ("SerumPlasma 50016-0 ID : 180 Test Sample 2024/03/01 10:00:00", IM_RESULT_LINES, "IM_ID"),
+    ("Ser/PI 000100 Routine 2024/03/01 10:00:00", IM_RESULT_LINES, "IM_Seq"),
+    ("SerumPlasma 000100 Routine 2024/03/01 10:00:00", IM_RESULT_LINES, "IM_Seq"),
+])
+def test_detect_profile(header, results, expected):
+    assert detect_profile_from_lines(first_page(header, results)) == expected
+
+@pytest.mark.parametrize("header, results, expected", [
+    ("Ser/PI 000100 Patient ID : 42 Routine 2024/03/01 10:00:00", CC_RESULT_LINES, "CC_Seq"),
+    ("Ser/PI 000100 Routine Patient ID : 42 2024/03/01 10:00:00", IM_RESULT_LINES, "IM_Seq"),
+    ("SerumPlasma 000100 Patient ID : 42 2024/03/01 10:00:00", IM_RESULT_LINES, "IM_Seq"),
+])
+def test_seq_header_with_id_text(header, results, expected):
+    """Sequence 헤더 줄 중간에 "ID :"가 있어도 Barcode 모드로 보지 않음"""
+    assert detect_profile_from_lines(first_page(header, results)) == expected
+
+def test_barcode_header_without_units():
+    """단위 줄로 장비를 판단할 수 없으면 Barcode 헤더 형식으로 장비를 고름"""
+    assert detect_profile_from_lines(first_page("Sample ID : S10000 Routine 2024/03/01 10:00:00", [])) == "CC_ID"
+    assert detect_profile_from_lines(
+        first_page("SerumPlasma 50016-0 ID : 180 Test Sample 2024/03/01 10:00:00", [])) == "IM_ID"
+
+def test_no_header():
+    assert detect_profile_from_lines(first_page("Patient ID : 42 2024/03/01 10:00:00", CC_RESULT_LINES)) is None
+    assert classify_page(["filler"] * 20) == (None, None)
+
+def test_classify_first_page():
+    lines = first_page("Ser/PI 000100 Patient ID : 42 Routine 2024/03/01 10:00:00", CC_RESULT_LINES)
+    assert classify_page(lines) == ("CC_Seq", True)